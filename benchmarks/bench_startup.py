@@ -0,0 +1,97 @@
+"""
+Benchmark da abertura do programa.
+
+Mede, em processos novos (imports frios do Python):
+  - import:        tempo para importar sekai_translator.main_window
+  - primeiro paint: do início do processo até a janela principal
+                    pintar pela primeira vez
+
+e compara a mediana com o orçamento. O último projeto (QSettings)
+continua sendo restaurado normalmente: ele não deve atrasar o paint.
+
+    python benchmarks/bench_startup.py [execuções]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Orçamento (segundos, mediana)
+IMPORT_BUDGET = 0.300
+FIRST_PAINT_BUDGET = 0.750
+
+
+def child():
+    """Roda no processo filho: imprime 'import paint' em segundos."""
+    start = time.perf_counter()
+
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PySide6.QtCore import QEvent, QObject
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+
+    t = time.perf_counter()
+    from sekai_translator.main_window import MainWindow
+    import_time = time.perf_counter() - t
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                paint_time = time.perf_counter() - start
+                print(f"{import_time:.6f} {paint_time:.6f}", flush=True)
+                os._exit(0)
+            return False
+
+    window = MainWindow()
+    watcher = FirstPaint()
+    window.installEventFilter(watcher)
+    window.show()
+
+    app.exec()
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    imports, paints = [], []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child"],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=True,
+        ).stdout.split()
+        imports.append(float(out[-2]))
+        paints.append(float(out[-1]))
+
+    ok = True
+    for name, values, budget in (
+        ("import", imports, IMPORT_BUDGET),
+        ("primeiro paint", paints, FIRST_PAINT_BUDGET),
+    ):
+        median = statistics.median(values)
+        status = "ok" if median <= budget else "ACIMA DO ORÇAMENTO"
+        ok = ok and median <= budget
+        print(
+            f"{name:>15}: mediana {median * 1000:7.1f} ms  "
+            f"(mín {min(values) * 1000:.1f} ms, orçamento "
+            f"{budget * 1000:.0f} ms)  {status}"
+        )
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child()
+    else:
+        main()
@@ -0,0 +1,86 @@
+"""
+Benchmark de TranslationTableModel.data().
+
+Simula o que a view faz ao rolar: todas as roles de pintura
+para todas as células visíveis, várias vezes.
+
+    python benchmarks/bench_table_data.py [linhas]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from sekai_translator.core import TranslationEntry, TranslationStatus
+from sekai_translator.qa_service import QAService
+from sekai_translator.translation_table import TranslationTableModel
+
+
+ROLES = (
+    Qt.DisplayRole,
+    Qt.ToolTipRole,
+    Qt.BackgroundRole,
+    Qt.FontRole,
+)
+
+VISIBLE_ROWS = 40
+
+
+def make_entries(n: int):
+    statuses = list(TranslationStatus)
+    entries = []
+    for i in range(n):
+        entries.append(
+            TranslationEntry(
+                entry_id=str(i),
+                original=f'[["{{name}} diz algo na linha {i}"]]',
+                translation=f'"Alguém fala na linha {i}"' if i % 3 else "",
+                status=statuses[i % len(statuses)],
+                context={
+                    "is_translatable": True,
+                    "speaker": f"Personagem {i % 7}",
+                },
+            )
+        )
+    for e in entries[::10]:
+        e.qa_issues = QAService.run(e)
+    return entries
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+
+    model = TranslationTableModel(make_entries(rows))
+    cols = model.columnCount()
+    indexes = [
+        [model.index(r, c) for c in range(cols)]
+        for r in range(rows)
+    ]
+
+    calls = 0
+    start = time.perf_counter()
+
+    # "Rola" a tabela de cima a baixo, uma tela por vez, 3 passadas
+    for _ in range(3):
+        for top in range(0, rows - VISIBLE_ROWS, VISIBLE_ROWS // 2):
+            for r in range(top, top + VISIBLE_ROWS):
+                for index in indexes[r]:
+                    for role in ROLES:
+                        model.data(index, role)
+                        calls += 1
+
+    elapsed = time.perf_counter() - start
+    print(f"{rows} linhas, {calls} chamadas de data()")
+    print(f"{elapsed:.3f}s  ->  {calls / elapsed:,.0f} chamadas/s")
+
+
+if __name__ == "__main__":
+    main()
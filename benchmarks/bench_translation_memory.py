@@ -0,0 +1,134 @@
+"""
+Benchmark da memória de tradução.
+
+Monta uma memória com N segmentos sintéticos (falas curtas em
+japonês, com muita repetição de trechos como num VN de verdade)
+e mede consulta exata e aproximada.
+
+    python benchmarks/bench_translation_memory.py [segmentos] [consultas]
+"""
+
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sekai_translator.translation_memory import (
+    TranslationMemory,
+    normalize,
+    similarity,
+)
+
+
+SPEAKERS = ["「", "（", ""]
+PUNCT = ["。", "！", "？", "…", "」", ""]
+
+HIRAGANA = [chr(c) for c in range(0x3041, 0x3094)]
+KANJI = [chr(c) for c in range(0x4E00, 0x4E00 + 2500)]
+
+
+def make_vocabulary(rng: random.Random, size: int = 6000):
+    """Palavras: kanji + okurigana, partículas e kana soltas."""
+    words = []
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.5:
+            word = "".join(rng.choices(KANJI, k=rng.randint(1, 2)))
+            word += "".join(rng.choices(HIRAGANA, k=rng.randint(0, 3)))
+        else:
+            word = "".join(rng.choices(HIRAGANA, k=rng.randint(2, 5)))
+        words.append(word)
+    # Distribuição de Zipf: poucas palavras aparecem muito
+    weights = [1 / (i + 1) for i in range(size)]
+    return words, weights
+
+
+VOCABULARY, WEIGHTS = make_vocabulary(random.Random(7))
+
+
+def make_line(rng: random.Random) -> str:
+    words = rng.choices(VOCABULARY, WEIGHTS, k=rng.randint(3, 9))
+    return rng.choice(SPEAKERS) + "".join(words) + rng.choice(PUNCT)
+
+
+def mutate(rng: random.Random, text: str) -> str:
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        op = rng.randrange(3)
+        pos = rng.randrange(len(chars))
+        if op == 0 and len(chars) > 2:
+            del chars[pos]
+        elif op == 1:
+            chars.insert(pos, rng.choice("ねよ！？"))
+        else:
+            chars[pos] = rng.choice("あいうえお")
+    return "".join(chars)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    rng = random.Random(42)
+
+    print(f"Gerando {size} segmentos...")
+    sources = [make_line(rng) for _ in range(size)]
+
+    memory = TranslationMemory()
+    start = time.perf_counter()
+    for i, source in enumerate(sources):
+        memory.add(source, f"translation {i}", "bench")
+    build = time.perf_counter() - start
+    print(f"Construção: {build:.1f} s ({len(memory)} segmentos únicos)")
+
+    sample = rng.sample(sources, queries)
+
+    # Exato
+    start = time.perf_counter()
+    for text in sample:
+        memory.exact(text)
+    exact = (time.perf_counter() - start) / queries * 1000
+    print(f"Exato: {exact:.4f} ms/consulta")
+
+    # Aproximado: metade editada (o original sabidamente está na
+    # memória), metade inédita
+    edited = [(mutate(rng, t), t) for t in sample[: queries // 2]]
+    unseen = [make_line(rng) for _ in range(queries - len(edited))]
+
+    timings = []
+    found = 0
+    recalled = 0
+    expected = 0
+
+    for text, origin in edited + [(t, None) for t in unseen]:
+        start = time.perf_counter()
+        matches = memory.suggest(text, limit=3, min_score=0.6)
+        timings.append((time.perf_counter() - start) * 1000)
+        found += bool(matches)
+
+        if origin is not None:
+            # Qualidade: a melhor sugestão tem de ser pelo menos tão
+            # boa quanto o segmento que foi editado
+            target = similarity(normalize(text), normalize(origin))
+            if target >= 0.6:
+                expected += 1
+                recalled += bool(matches) and matches[0].score >= target - 1e-9
+
+    print(
+        f"Aproximado: média {statistics.mean(timings):.2f} ms, "
+        f"p95 {percentile(timings, 0.95):.2f} ms, "
+        f"máx {max(timings):.2f} ms "
+        f"({found}/{len(timings)} com sugestão)"
+    )
+    print(f"Recall (editados): {recalled}/{expected}")
+
+if __name__ == "__main__":
+    main()
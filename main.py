@@ -1,11 +1,10 @@
 import sys
+import multiprocessing
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtCore import Qt
 
-from sekai_translator.main_window import MainWindow
-
 
 def apply_dark_theme(app: QApplication):
     """
@@ -39,11 +38,18 @@ def apply_dark_theme(app: QApplication):
 
 
 def main():
+    # Necessário para o pool de processos do QA no executável (PyInstaller)
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
 
     # 🌙 Tema escuro como padrão
     apply_dark_theme(app)
 
+    # Aqui e não no topo: os processos do QA reimportam este módulo
+    # e não precisam da interface
+    from sekai_translator.main_window import MainWindow
+
     window = MainWindow()
     window.show()
 
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from sekai_translator.core import Project, TranslationEntry, TranslationStatus
+
+
+# ============================================================
+# Evento
+# ============================================================
+
+@dataclass
+class EntryChanged:
+    file_path: str
+    row: int                    # posição da entrada no arquivo
+    entry: TranslationEntry
+    old_status: TranslationStatus
+    new_status: TranslationStatus
+    old_text: str
+    new_text: str
+
+    @property
+    def status_changed(self) -> bool:
+        return self.old_status != self.new_status
+
+    @property
+    def text_changed(self) -> bool:
+        return self.old_text != self.new_text
+
+
+# ============================================================
+# Barramento
+# ============================================================
+
+class ChangeBus:
+    """
+    Alterações de entradas do projeto aberto.
+
+    O StatusService (e o undo, através dele) publica cada mudança de
+    texto / status; quem depende disso (estatísticas, QA, índices,
+    telas) assina com `subscribe(fn)` e recebe UMA lista por volta do
+    event loop. Várias mudanças na mesma entrada viram um evento só:
+    valores anteriores do primeiro, atuais do último.
+
+    `schedule(fn)` agenda o flush (na GUI: QTimer.singleShot(0, fn)).
+    Sem ele, quem publica chama `flush()`.
+    """
+
+    def __init__(self, schedule: Callable[[Callable[[], None]], None] | None = None):
+        self.project: Project | None = None
+        self._schedule = schedule
+        self._scheduled = False
+        self._pending: Dict[int, EntryChanged] = {}
+        self._subscribers: List[Callable[[List[EntryChanged]], None]] = []
+
+    def set_project(self, project: Project | None):
+        # Eventos do projeto anterior não interessam a mais ninguém
+        self.project = project
+        self._pending.clear()
+
+    def subscribe(self, fn: Callable[[List[EntryChanged]], None]):
+        self._subscribers.append(fn)
+
+    # --------------------------------------------------
+
+    def entry_changed(self, entry: TranslationEntry, old_status, old_text: str):
+        """Listener do StatusService."""
+        event = self._pending.get(id(entry))
+        if event is not None:
+            event.new_status = entry.status
+            event.new_text = entry.translation
+            return
+
+        location = self.project.locate(entry) if self.project else None
+        if location is None:
+            return
+
+        path, row = location
+        self._pending[id(entry)] = EntryChanged(
+            file_path=path,
+            row=row,
+            entry=entry,
+            old_status=old_status,
+            new_status=entry.status,
+            old_text=old_text,
+            new_text=entry.translation,
+        )
+
+        if self._schedule is not None and not self._scheduled:
+            self._scheduled = True
+            self._schedule(self.flush)
+
+    def flush(self):
+        """Entrega o que estiver pendente (chamável a qualquer momento)."""
+        self._scheduled = False
+        if not self._pending:
+            return
+
+        events = [
+            e for e in self._pending.values()
+            if e.status_changed or e.text_changed
+        ]
+        self._pending = {}
+
+        if not events:
+            return
+
+        for fn in list(self._subscribers):
+            fn(events)
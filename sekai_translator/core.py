@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Any
@@ -31,6 +32,169 @@ class TranslationEntry:
     context: Dict[str, Any] = field(default_factory=dict)
     qa_issues: List[Any] = field(default_factory=list)
 
+    def to_dict(self) -> dict:
+        # qa_issues não vai para o project.json: fica na tabela de QA
+        # (ver qa_store), compacta e invalidada por fingerprint
+        return {
+            "entry_id": self.entry_id,
+            "original": self.original,
+            "translation": self.translation,
+            "status": getattr(self.status, "value", self.status),
+            "context": self.context,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "TranslationEntry":
+        return TranslationEntry(
+            entry_id=data["entry_id"],
+            original=data.get("original", ""),
+            translation=data.get("translation", ""),
+            status=TranslationStatus(
+                data.get("status", TranslationStatus.UNTRANSLATED)
+            ),
+            context=data.get("context", {}),
+        )
+
+
+# ============================================================
+# Project Stats
+# ============================================================
+
+_SLOTS = {status: i for i, status in enumerate(TranslationStatus)}
+_TRANSLATED = _SLOTS[TranslationStatus.TRANSLATED]
+
+
+def _slot(status) -> int:
+    slot = _SLOTS.get(status)
+    if slot is None:
+        slot = _SLOTS[TranslationStatus(status)]
+    return slot
+
+
+class ProjectStats:
+    """
+    Contadores de linhas traduzíveis por status: projeto, arquivo
+    e pasta. Cada transição de status (StatusService / undo) só
+    mexe nos contadores daquela linha, então o progresso é O(1).
+    """
+
+    def __init__(self):
+        # [untranslated, in_progress, translated, reviewed]
+        self.totals: List[int] = [0] * len(_SLOTS)
+        self.files: Dict[str, List[int]] = {}
+
+        # pasta -> [traduzidas, traduzíveis] de todos os arquivos abaixo
+        self.folders: Dict[str, List[int]] = {}
+
+        # id(entry) -> arquivo (só linhas traduzíveis)
+        self._owner: Dict[int, str] = {}
+
+    # --------------------------------------------------
+    # Construção
+    # --------------------------------------------------
+
+    def rebuild(self, files: Dict[str, List[TranslationEntry]]):
+        self.totals = [0] * len(_SLOTS)
+        self.files.clear()
+        self.folders.clear()
+        self._owner.clear()
+        for path, entries in files.items():
+            self.add_file(path, entries)
+
+    def add_file(self, path: str, entries: List[TranslationEntry]):
+        """(Re)conta um arquivo inteiro: import / load."""
+        owner = self._owner
+        old = self.files.get(path)
+        if old is not None:
+            for i, n in enumerate(old):
+                self.totals[i] -= n
+
+        counts = [0] * len(_SLOTS)
+        for e in entries:
+            if e.context.get("is_translatable"):
+                counts[_slot(e.status)] += 1
+                owner[id(e)] = path
+
+        self.files[path] = counts
+        for i, n in enumerate(counts):
+            self.totals[i] += n
+
+        old = old or [0] * len(_SLOTS)
+        self._bubble(
+            path,
+            counts[_TRANSLATED] - old[_TRANSLATED],
+            sum(counts) - sum(old),
+        )
+
+    # --------------------------------------------------
+    # Transições
+    # --------------------------------------------------
+
+    def status_changed(self, entry: TranslationEntry, old_status, new_status=None):
+        path = self._owner.get(id(entry))
+        if path is None:
+            return
+
+        old = _slot(old_status)
+        new = _slot(entry.status if new_status is None else new_status)
+        if old == new:
+            return
+
+        counts = self.files[path]
+        counts[old] -= 1
+        counts[new] += 1
+        self.totals[old] -= 1
+        self.totals[new] += 1
+
+        if old == _TRANSLATED:
+            self._bubble(path, -1, 0)
+        elif new == _TRANSLATED:
+            self._bubble(path, 1, 0)
+
+    def _bubble(self, path: str, d_translated: int, d_total: int):
+        """Só a diferença sobe pelas pastas: custo = profundidade."""
+        if not d_translated and not d_total:
+            return
+
+        folders = self.folders
+        parent = os.path.dirname(path)
+        while parent and parent != path:
+            counts = folders.get(parent)
+            if counts is None:
+                counts = folders[parent] = [0, 0]
+            counts[0] += d_translated
+            counts[1] += d_total
+            path, parent = parent, os.path.dirname(parent)
+
+    # --------------------------------------------------
+    # Consulta
+    # --------------------------------------------------
+
+    @property
+    def total(self) -> int:
+        return sum(self.totals)
+
+    def progress(self) -> float:
+        """Progresso do projeto (%, uma casa), só TRANSLATED."""
+        total = self.total
+        if not total:
+            return 0
+        return round((self.totals[_TRANSLATED] / total) * 100, 1)
+
+    def count(self, status: TranslationStatus, path: str | None = None) -> int:
+        counts = self.totals if path is None else self.files.get(path)
+        return counts[_slot(status)] if counts else 0
+
+    def file_total(self, path: str) -> int:
+        return sum(self.files.get(path) or ())
+
+    def has_translated(self, path: str) -> bool:
+        counts = self.files.get(path)
+        return bool(counts and counts[_TRANSLATED])
+
+    def folder_counts(self, path: str) -> List[int] | None:
+        return self.folders.get(path)
+
 
 # ============================================================
 # Project
@@ -59,8 +223,24 @@ class Project:
         # entry_id -> TranslationEntry
         self.entry_index: Dict[str, TranslationEntry] = {}
 
-        # file_path -> bool (tem alguma linha traduzida?)
-        self.file_status_cache: Dict[str, bool] = {}
+        # (file_path, entry_id) -> TranslationEntry
+        self.entry_keys: Dict[tuple, TranslationEntry] = {}
+
+        # id(entry) -> (file_path, posição no arquivo)
+        self.entry_rows: Dict[int, tuple] = {}
+
+        # Contadores por status / arquivo / pasta (ver ProjectStats)
+        self.stats = ProjectStats()
+
+        # Regras de QA ativas / parâmetros (ver qa_rules.QAConfig)
+        self.qa_config: Dict[str, Any] = {}
+
+        # Glossário: [{"source", "target", "note"}] (ver glossary)
+        self.glossary: List[Dict[str, str]] = []
+
+        # Nome do personagem (original) -> nome traduzido,
+        # aplicado no rebuild pelos parsers que têm personagem
+        self.speaker_names: Dict[str, str] = {}
 
         self.undo_stack = UndoStack()
         self.project_path: str | None = None
@@ -71,9 +251,33 @@ class Project:
 
     def index_entries(self):
         self.entry_index.clear()
-        for entries in self.files.values():
-            for e in entries:
+        self.entry_keys.clear()
+        self.entry_rows.clear()
+        for path, entries in self.files.items():
+            for row, e in enumerate(entries):
                 self.entry_index[e.entry_id] = e
+                self.entry_keys[(path, e.entry_id)] = e
+                self.entry_rows[id(e)] = (path, row)
+
+    def index_file(self, path: str):
+        """Indexa só um arquivo (recém-importado), sem varrer o projeto."""
+        for row, e in enumerate(self.files.get(path) or []):
+            self.entry_index[e.entry_id] = e
+            self.entry_keys[(path, e.entry_id)] = e
+            self.entry_rows[id(e)] = (path, row)
+
+    def locate(self, entry: TranslationEntry):
+        """(file_path, posição no arquivo), ou None se não é deste projeto."""
+        return self.entry_rows.get(id(entry))
+
+    def get_entry(self, entry_id: str, file_path: str | None = None):
+        """
+        Entrada pelo id. Ids se repetem entre arquivos:
+        com `file_path` a busca é exata.
+        """
+        if file_path is not None:
+            return self.entry_keys.get((file_path, entry_id))
+        return self.entry_index.get(entry_id)
 
     # --------------------------------------------------
     # Cache de status por arquivo (TreeView)
@@ -81,30 +285,20 @@ class Project:
 
     def update_file_status(self, path: str):
         """
-        Atualiza o cache indicando se o arquivo possui
-        pelo menos uma linha traduzida.
+        Reconta o arquivo inteiro (import). Edições depois disso
+        chegam aos contadores pelas transições de status.
         """
-        entries = self.files.get(path)
-        if not entries:
-            self.file_status_cache[path] = False
-            return
-
-        self.file_status_cache[path] = any(
-            e.status == TranslationStatus.TRANSLATED
-            for e in entries
-        )
+        self.stats.add_file(path, self.files.get(path) or [])
 
     def rebuild_all_file_status(self):
         """
         Recalcula o cache inteiro.
         Usar apenas ao carregar projeto.
         """
-        self.file_status_cache.clear()
-        for path in self.files:
-            self.update_file_status(path)
+        self.stats.rebuild(self.files)
 
     # --------------------------------------------------
-    # Progresso por arquivo (NOVO)
+    # Progresso por arquivo / pasta
     # --------------------------------------------------
 
     def file_progress(self, path: str) -> int:
@@ -112,24 +306,21 @@ class Project:
         Retorna o progresso do arquivo em porcentagem (0–100),
         considerando APENAS linhas traduzíveis e status TRANSLATED.
         """
-        entries = self.files.get(path)
-        if not entries:
-            return 0
-
-        translatable = [
-            e for e in entries
-            if e.context.get("is_translatable")
-        ]
-
-        if not translatable:
+        total = self.stats.file_total(path)
+        if not total:
             return 0
+        translated = self.stats.count(TranslationStatus.TRANSLATED, path)
+        return int((translated / total) * 100)
 
-        translated = len([
-            e for e in translatable
-            if e.status == TranslationStatus.TRANSLATED
-        ])
-
-        return int((translated / len(translatable)) * 100)
+    def folder_progress(self, path: str) -> int | None:
+        """
+        Progresso somado dos arquivos importados abaixo da pasta.
+        None se nenhum arquivo da pasta foi importado ainda.
+        """
+        counts = self.stats.folder_counts(path)
+        if not counts or not counts[1]:
+            return None
+        return int((counts[0] / counts[1]) * 100)
 
     # --------------------------------------------------
     # Persistência
@@ -143,8 +334,11 @@ class Project:
             "encoding": self.encoding,
             "language": self.language,
             "engine": self.engine,
+            "qa_config": self.qa_config,
+            "glossary": self.glossary,
+            "speaker_names": self.speaker_names,
             "files": {
-                path: [e.__dict__ for e in entries]
+                path: [e.to_dict() for e in entries]
                 for path, entries in self.files.items()
             },
         }
@@ -159,10 +353,13 @@ class Project:
             language=data.get("language", "en"),
             engine=data.get("engine", "artemis"),
         )
+        project.qa_config = data.get("qa_config", {}) or {}
+        project.glossary = data.get("glossary", []) or []
+        project.speaker_names = data.get("speaker_names", {}) or {}
 
         for path, entries in data.get("files", {}).items():
             project.files[path] = [
-                TranslationEntry(**e) for e in entries
+                TranslationEntry.from_dict(e) for e in entries
             ]
 
         project.index_entries()
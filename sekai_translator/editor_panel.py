@@ -1,5 +1,8 @@
-from PySide6.QtCore import Qt, Signal, QEvent
-from PySide6.QtGui import QTextOption, QFont
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from PySide6.QtCore import Qt, Signal, QEvent, QTimer
+from PySide6.QtGui import QTextOption, QFont, QTextCharFormat, QColor, QTextCursor
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -8,15 +11,77 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QHBoxLayout,
     QStyle,
+    QTextEdit,
+    QListWidget,
+    QListWidgetItem,
 )
 
 from sekai_translator.status_service import StatusService
 from sekai_translator.undo_stack import UndoAction, CompositeUndoAction
 from sekai_translator.core import TranslationStatus
+from sekai_translator.qa_rules import QAConfig, QAEngine
+from sekai_translator.translation_memory import suggest as tm_suggest
+from sekai_translator.glossary import glossary_matcher, project_terms
 
 
 MAX_NAME_LEN = 14
 
+# Espera após a última tecla antes de rodar o QA ao vivo
+LIVE_QA_DELAY_MS = 250
+
+# Sugestões da memória de tradução mostradas no editor
+TM_SUGGESTIONS = 3
+TM_MIN_SCORE = 0.6
+
+# Uma thread só: avaliações antigas são descartadas, não enfileiradas
+_live_qa_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="live-qa")
+
+# Engine própria da thread do QA ao vivo (o cache de tags da engine
+# compartilhada não é seguro entre threads). Só a configuração atual.
+_live_qa_engine: QAEngine | None = None
+
+
+def _engine_for_config(config: QAConfig) -> QAEngine:
+    """Só chamada na thread do QA ao vivo."""
+    global _live_qa_engine
+    version = (QAEngine.RULES_VERSION, config.signature())
+    if _live_qa_engine is None or _live_qa_engine.version != version:
+        _live_qa_engine = QAEngine(config)
+    return _live_qa_engine
+
+
+def _evaluate_draft(config, entries, lines, generation, is_current):
+    """
+    Roda em background. Avalia o texto ainda não confirmado
+    e devolve, por linha, (issues, tags ausentes).
+    """
+    engine = _engine_for_config(config)
+    results = []
+    for entry, text in zip(entries, lines):
+        if not is_current(generation):
+            return None
+
+        draft = replace(
+            entry,
+            translation=text,
+            status=(
+                TranslationStatus.IN_PROGRESS
+                if text.strip()
+                else TranslationStatus.UNTRANSLATED
+            ),
+            qa_issues=[],
+        )
+        issues = engine.run(draft)
+
+        missing = ()
+        if any(i.code == "MISSING_TAG" for i in issues):
+            ctx = entry.context
+            rebuilt = f"{ctx.get('prefix', '') or ''}{text}{ctx.get('suffix', '') or ''}"
+            missing = tuple(engine.tags(entry.original or "") - engine.tags(rebuilt))
+
+        results.append((issues, missing))
+    return results
+
 
 class EditorPanel(QWidget):
 
@@ -24,13 +89,26 @@ class EditorPanel(QWidget):
     request_next = Signal()
     request_prev = Signal()
 
-    def __init__(self, project):
+    # (geração, resultados) vindo da thread de QA ao vivo
+    _live_qa_ready = Signal(int, object)
+
+    def __init__(self, project, file_path: str | None = None):
         super().__init__()
 
         self.project = project
+        self.file_path = file_path
         self._entries: list = []
         self._rows: list[int] = []
 
+        # Memórias de tradução consultadas (lista compartilhada,
+        # preenchida pela MainWindow)
+        self.memories: list = []
+        self._tm_line = -1
+
+        # Destaques no original: termos do glossário + tags ausentes (QA)
+        self._glossary_selections: list = []
+        self._tag_selections: list = []
+
         mono = QFont("Consolas")
         mono.setStyleHint(QFont.Monospace)
 
@@ -58,6 +136,13 @@ class EditorPanel(QWidget):
         original_row.addWidget(self.original_edit)
         root.addLayout(original_row)
 
+        # ================= GLOSSÁRIO =================
+        self.glossary_label = QLabel()
+        self.glossary_label.setWordWrap(True)
+        self.glossary_label.setStyleSheet("color: #93c5fd;")
+        self.glossary_label.hide()
+        root.addWidget(self.glossary_label)
+
         # ================= TRADUÇÃO =================
         root.addWidget(QLabel("Tradução"))
 
@@ -78,6 +163,37 @@ class EditorPanel(QWidget):
         translation_row.addWidget(self.translation_edit)
         root.addLayout(translation_row)
 
+        # ================= QA AO VIVO =================
+        self.qa_label = QLabel()
+        self.qa_label.setWordWrap(True)
+        self.qa_label.setStyleSheet("color: #fca5a5;")
+        self.qa_label.hide()
+        root.addWidget(self.qa_label)
+
+        self._qa_generation = 0
+        self._qa_future = None
+
+        self._qa_timer = QTimer(self)
+        self._qa_timer.setSingleShot(True)
+        self._qa_timer.setInterval(LIVE_QA_DELAY_MS)
+        self._qa_timer.timeout.connect(self._start_live_qa)
+
+        self.translation_edit.textChanged.connect(self._schedule_live_qa)
+        self._live_qa_ready.connect(self._apply_live_qa)
+
+        # ================= MEMÓRIA DE TRADUÇÃO =================
+        self.tm_list = QListWidget()
+        self.tm_list.setMaximumHeight(72)
+        self.tm_list.setFocusPolicy(Qt.NoFocus)
+        self.tm_list.setToolTip("Memória de tradução (Ctrl+1..3 ou duplo clique)")
+        self.tm_list.hide()
+        root.addWidget(self.tm_list)
+
+        self.tm_list.itemDoubleClicked.connect(self._on_tm_activated)
+        self.translation_edit.cursorPositionChanged.connect(
+            self._on_cursor_moved
+        )
+
         # Scroll sync
         self.original_edit.verticalScrollBar().valueChanged.connect(
             self.meta_original.verticalScrollBar().setValue
@@ -161,6 +277,227 @@ class EditorPanel(QWidget):
 
         self.translation_edit.setFocus()
 
+        self._tm_line = -1
+        self._update_suggestions()
+        self._update_glossary()
+
+    # ================= GLOSSÁRIO =================
+
+    def _update_glossary(self):
+        """Destaca os termos no original e mostra as traduções aprovadas."""
+        matcher = glossary_matcher(project_terms(self.project))
+
+        self._glossary_selections = []
+        terms = []
+        seen = set()
+
+        if matcher:
+            fmt = QTextCharFormat()
+            fmt.setBackground(QColor("#1e3a5f"))
+            fmt.setFontUnderline(True)
+
+            doc = self.original_edit.document()
+            block = doc.begin()
+            while block.isValid():
+                for start, end, term in matcher.find(block.text()):
+                    sel = QTextEdit.ExtraSelection()
+                    sel.format = fmt
+                    cursor = QTextCursor(block)
+                    cursor.setPosition(block.position() + start)
+                    cursor.setPosition(
+                        block.position() + end, QTextCursor.KeepAnchor
+                    )
+                    sel.cursor = cursor
+                    self._glossary_selections.append(sel)
+
+                    if term.source not in seen:
+                        seen.add(term.source)
+                        terms.append(term)
+                block = block.next()
+
+        self.glossary_label.setText(
+            "📖 " + "   ·   ".join(f"{t.source} → {t.target}" for t in terms)
+        )
+        self.glossary_label.setVisible(bool(terms))
+        self._apply_original_selections()
+
+    def _apply_original_selections(self):
+        self.original_edit.setExtraSelections(
+            self._glossary_selections + self._tag_selections
+        )
+
+    # ================= MEMÓRIA DE TRADUÇÃO =================
+
+    def _current_line(self) -> int:
+        return self.translation_edit.textCursor().blockNumber()
+
+    def _on_cursor_moved(self):
+        if self._current_line() != self._tm_line:
+            self._update_suggestions()
+
+    def _update_suggestions(self):
+        self.tm_list.clear()
+
+        line = self._current_line()
+        self._tm_line = line
+
+        if not self.memories or not 0 <= line < len(self._entries):
+            self.tm_list.hide()
+            return
+
+        matches = tm_suggest(
+            self.memories,
+            self._entries[line].original or "",
+            limit=TM_SUGGESTIONS,
+            min_score=TM_MIN_SCORE,
+        )
+
+        for i, match in enumerate(matches, start=1):
+            item = QListWidgetItem(
+                f"{i}. [{match.percent}%] {match.target}"
+            )
+            item.setToolTip(
+                f"{match.source}\n({match.origin})" if match.origin else match.source
+            )
+            item.setData(Qt.UserRole, match.target)
+            self.tm_list.addItem(item)
+
+        self.tm_list.setVisible(bool(matches))
+
+    def _on_tm_activated(self, item: QListWidgetItem):
+        self.apply_suggestion(self.tm_list.row(item))
+
+    def apply_suggestion(self, index: int):
+        """Substitui a linha atual da tradução pela sugestão `index`."""
+        item = self.tm_list.item(index)
+        if item is None:
+            return
+
+        cursor = self.translation_edit.textCursor()
+        cursor.movePosition(QTextCursor.StartOfBlock)
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        cursor.insertText(item.data(Qt.UserRole))
+        self.translation_edit.setTextCursor(cursor)
+        self.translation_edit.setFocus()
+
+    # ================= QA AO VIVO =================
+
+    def _schedule_live_qa(self):
+        # Invalida qualquer avaliação em andamento e reinicia o debounce
+        self._qa_generation += 1
+        self._qa_timer.start()
+
+    def _is_current_generation(self, generation: int) -> bool:
+        return generation == self._qa_generation
+
+    def _start_live_qa(self):
+        if not self._entries:
+            return
+
+        # Mesma divisão do commit (_commit_translation)
+        lines = [
+            l.rstrip() for l in self.translation_edit.toPlainText().splitlines()
+        ]
+
+        if len(lines) != len(self._entries):
+            self._show_live_qa(
+                ["Número de linhas não corresponde às entradas."], [], []
+            )
+            return
+
+        if self._qa_future is not None:
+            self._qa_future.cancel()
+
+        generation = self._qa_generation
+        self._qa_future = _live_qa_pool.submit(
+            self._run_live_qa,
+            QAConfig.from_project(self.project) if self.project else QAConfig(),
+            list(self._entries),
+            lines,
+            generation,
+        )
+
+    def _run_live_qa(self, config, entries, lines, generation):
+        results = _evaluate_draft(
+            config, entries, lines, generation, self._is_current_generation
+        )
+        if results is not None:
+            self._live_qa_ready.emit(generation, results)
+
+    def _apply_live_qa(self, generation: int, results):
+        # Resultado velho (o texto mudou depois que a avaliação começou)
+        if generation != self._qa_generation:
+            return
+
+        is_batch = len(results) > 1
+        messages = []
+        bad_lines = []
+        missing_tags = []
+
+        for line, (issues, missing) in enumerate(results):
+            if not issues:
+                continue
+            level = "error" if any(i.level == "error" for i in issues) else "warning"
+            bad_lines.append((line, level))
+            missing_tags.append((line, missing))
+            for issue in issues:
+                icon = "❌" if issue.level == "error" else "⚠️"
+                where = f"{self._rows[line] + 1}: " if is_batch else ""
+                messages.append(f"{icon} {where}{issue.message}")
+
+        self._show_live_qa(messages, bad_lines, missing_tags)
+
+    def _show_live_qa(self, messages, bad_lines, missing_tags):
+        self.qa_label.setText("\n".join(messages))
+        self.qa_label.setVisible(bool(messages))
+
+        # Sublinha as linhas problemáticas da tradução
+        selections = []
+        doc = self.translation_edit.document()
+        for line, level in bad_lines:
+            block = doc.findBlockByNumber(line)
+            if not block.isValid():
+                continue
+            sel = QTextEdit.ExtraSelection()
+            fmt = QTextCharFormat()
+            fmt.setUnderlineStyle(QTextCharFormat.WaveUnderline)
+            fmt.setUnderlineColor(
+                QColor("#f87171") if level == "error" else QColor("#facc15")
+            )
+            sel.format = fmt
+            cursor = QTextCursor(block)
+            cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+            sel.cursor = cursor
+            selections.append(sel)
+        self.translation_edit.setExtraSelections(selections)
+
+        # Destaca no original as tags que faltam na tradução
+        selections = []
+        doc = self.original_edit.document()
+        for line, tags in missing_tags:
+            block = doc.findBlockByNumber(line)
+            if not block.isValid():
+                continue
+            text = block.text()
+            for tag in tags:
+                start = text.find(tag)
+                while start != -1:
+                    sel = QTextEdit.ExtraSelection()
+                    fmt = QTextCharFormat()
+                    fmt.setBackground(QColor("#7f1d1d"))
+                    sel.format = fmt
+                    cursor = QTextCursor(block)
+                    cursor.setPosition(block.position() + start)
+                    cursor.setPosition(
+                        block.position() + start + len(tag),
+                        QTextCursor.KeepAnchor,
+                    )
+                    sel.cursor = cursor
+                    selections.append(sel)
+                    start = text.find(tag, start + len(tag))
+        self._tag_selections = selections
+        self._apply_original_selections()
+
     # ================= EVENT FILTER =================
 
     def eventFilter(self, obj, event):
@@ -186,6 +523,10 @@ class EditorPanel(QWidget):
                 self._commit_translation()
                 return True
 
+            if mods == Qt.ControlModifier and Qt.Key_1 <= key <= Qt.Key_9:
+                self.apply_suggestion(key - Qt.Key_1)
+                return True
+
         return super().eventFilter(obj, event)
 
     # ================= NAV =================
@@ -210,38 +551,68 @@ class EditorPanel(QWidget):
             )
             return
 
-        undo_actions = []
+        if not self.commit_lines(self._entries, lines):
+            return
 
-        for entry, new_text in zip(self._entries, lines):
-            if entry.translation == new_text:
-                continue
+        self.entry_changed.emit()
+        self.request_next.emit()
 
-            undo_actions.append(
-                UndoAction(
-                    entry_id=entry.entry_id,
-                    field="translation",
-                    old_value=entry.translation,
-                    new_value=new_text,
+    def commit_lines(self, entries: list, lines: list) -> bool:
+        """
+        Confirma `lines` nas entradas (um passo de undo + StatusService).
+        Também usado pela edição direta na tabela. Retorna False se
+        nada mudou.
+        """
+        undo_actions = []
+        committed = []
+
+        for entry, new_text in zip(entries, lines):
+            # Texto igual ainda confirma sugestões (memória / propagação
+            # deixam a linha em andamento); já confirmada não muda nada
+            if entry.translation == new_text and (
+                not new_text.strip()
+                or entry.status in (
+                    TranslationStatus.TRANSLATED,
+                    TranslationStatus.REVIEWED,
                 )
+            ):
+                continue
+
+            new_status = (
+                TranslationStatus.TRANSLATED
+                if new_text.strip()
+                else TranslationStatus.UNTRANSLATED
             )
+
+            if entry.translation != new_text:
+                undo_actions.append(
+                    UndoAction(
+                        entry_id=entry.entry_id,
+                        field="translation",
+                        old_value=entry.translation,
+                        new_value=new_text,
+                        file_path=self.file_path,
+                    )
+                )
             undo_actions.append(
                 UndoAction(
                     entry_id=entry.entry_id,
                     field="status",
                     old_value=entry.status,
-                    new_value=TranslationStatus.TRANSLATED,
+                    new_value=new_status,
+                    file_path=self.file_path,
                 )
             )
+            committed.append((entry, new_text))
 
         if not undo_actions:
-            return
+            return False
 
         self.project.undo_stack.push(
             CompositeUndoAction(undo_actions)
         )
 
-        for entry, text in zip(self._entries, lines):
+        for entry, text in committed:
             StatusService.on_translation_committed(entry, text)
 
-        self.entry_changed.emit()
-        self.request_next.emit()
+        return True
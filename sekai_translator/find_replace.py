@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+from sekai_translator.core import Project, TranslationEntry
+from sekai_translator.search_index import SearchIndex
+from sekai_translator.status_service import StatusService
+from sekai_translator.undo_stack import CompositeUndoAction, UndoAction
+
+
+# ============================================================
+# Consulta / resultado
+# ============================================================
+
+@dataclass(frozen=True)
+class ReplaceQuery:
+    find: str
+    replace: str = ""
+    regex: bool = False
+    case_sensitive: bool = False
+
+    def compile(self) -> Pattern:
+        """Regex da busca. Pode lançar `re.error`."""
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        pattern = self.find if self.regex else re.escape(self.find)
+        return re.compile(pattern, flags)
+
+    def template(self) -> str:
+        """Texto de substituição no formato de `re.sub`."""
+        if self.regex:
+            return self.replace
+        # Literal: barras invertidas não são referências de grupo
+        return self.replace.replace("\\", "\\\\")
+
+
+@dataclass
+class ReplaceMatch:
+    file_path: str
+    entry: TranslationEntry
+    old_text: str
+    new_text: str
+    count: int
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+def _split_affixes(entry: TranslationEntry, text: str) -> Tuple[str, str, str]:
+    """
+    Separa prefixo / sufixo da linha original que tenham sido
+    mantidos dentro da tradução: a substituição nunca os altera.
+    """
+    ctx = entry.context
+    prefix = ctx.get("prefix", "") or ""
+    suffix = ctx.get("suffix", "") or ""
+
+    head = prefix if prefix and text.startswith(prefix) else ""
+    rest = text[len(head):]
+
+    tail = suffix if suffix and rest.endswith(suffix) else ""
+    core = rest[:len(rest) - len(tail)] if tail else rest
+
+    return head, core, tail
+
+
+def _candidates(
+    project: Project,
+    query: ReplaceQuery,
+    search_index: Optional[SearchIndex],
+    paths: Optional[Iterable[str]],
+) -> Iterable[Tuple[str, TranslationEntry]]:
+    allowed = set(paths) if paths is not None else None
+
+    # Busca literal: o índice já reduz para as linhas que contêm o texto
+    if search_index is not None and not query.regex:
+        hits = search_index.search(
+            query.find,
+            in_original=False,
+            in_translation=True,
+            limit=None,
+        )
+        # Agrupa por arquivo, na ordem do projeto
+        order = {path: i for i, path in enumerate(project.files)}
+        hits.sort(key=lambda h: order.get(h.file_path, len(order)))
+        return (
+            (h.file_path, h.entry) for h in hits
+            if allowed is None or h.file_path in allowed
+        )
+
+    return (
+        (path, entry)
+        for path, entries in project.files.items()
+        if allowed is None or path in allowed
+        for entry in entries
+        if entry.context.get("is_translatable")
+    )
+
+
+# ============================================================
+# Localizar / substituir
+# ============================================================
+
+def find_replacements(
+    project: Project,
+    query: ReplaceQuery,
+    search_index: Optional[SearchIndex] = None,
+    paths: Optional[Iterable[str]] = None,
+) -> List[ReplaceMatch]:
+    """
+    Prévia: todas as traduções afetadas e como ficam depois.
+    Só a coluna de tradução é considerada.
+    """
+    if not query.find:
+        return []
+
+    subn = query.compile().subn
+    template = query.template()
+
+    matches: List[ReplaceMatch] = []
+    for path, entry in _candidates(project, query, search_index, paths):
+        text = entry.translation
+        if not text:
+            continue
+
+        head, core, tail = _split_affixes(entry, text)
+        new_core, count = subn(template, core)
+        if count and new_core != core:
+            matches.append(
+                ReplaceMatch(path, entry, text, f"{head}{new_core}{tail}", count)
+            )
+
+    return matches
+
+
+def apply_replacements(
+    project: Project,
+    matches: Iterable[ReplaceMatch],
+) -> List[ReplaceMatch]:
+    """
+    Aplica as substituições como UMA ação de undo.
+    Linhas editadas depois da prévia são ignoradas.
+    Retorna as que foram realmente aplicadas.
+    """
+    actions: List[UndoAction] = []
+    applied: List[ReplaceMatch] = []
+
+    for m in matches:
+        entry = m.entry
+        if entry.translation != m.old_text:
+            continue
+
+        old_status = entry.status
+        StatusService.on_translation_replaced(entry, m.new_text)
+
+        actions.append(
+            UndoAction(
+                entry_id=entry.entry_id,
+                field="translation",
+                old_value=m.old_text,
+                new_value=m.new_text,
+                file_path=m.file_path,
+            )
+        )
+        if entry.status != old_status:
+            actions.append(
+                UndoAction(
+                    entry_id=entry.entry_id,
+                    field="status",
+                    old_value=old_status,
+                    new_value=entry.status,
+                    file_path=m.file_path,
+                )
+            )
+        applied.append(m)
+
+    if actions:
+        project.undo_stack.push(CompositeUndoAction(actions))
+
+    return applied
@@ -0,0 +1,187 @@
+import re
+from pathlib import Path
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QLabel,
+    QLineEdit,
+    QCheckBox,
+    QPushButton,
+    QMessageBox,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QHeaderView,
+)
+
+from sekai_translator.find_replace import ReplaceQuery, find_replacements
+
+
+class FindReplaceDialog(QDialog):
+    """
+    Localizar / substituir nas traduções do projeto inteiro.
+    Mostra a prévia; "Substituir Tudo" aplica só as linhas marcadas.
+    """
+
+    replace_requested = Signal(object)     # List[ReplaceMatch]
+    entry_activated = Signal(str, object)  # file_path, TranslationEntry
+
+    # Acima disso a prévia só mostra as primeiras (todas são aplicadas)
+    PREVIEW_LIMIT = 5000
+
+    def __init__(self, project, search_index=None, parent=None):
+        super().__init__(parent)
+
+        self.setWindowTitle("Localizar e Substituir")
+        self.resize(960, 560)
+        self.setModal(False)
+
+        self.project = project
+        self.search_index = search_index
+        self._matches: list = []
+
+        layout = QVBoxLayout(self)
+
+        form = QFormLayout()
+        self.find_edit = QLineEdit()
+        self.replace_edit = QLineEdit()
+        form.addRow("Localizar", self.find_edit)
+        form.addRow("Substituir por", self.replace_edit)
+        layout.addLayout(form)
+
+        options = QHBoxLayout()
+        self.regex_check = QCheckBox("Regex")
+        self.case_check = QCheckBox("Diferenciar maiúsculas")
+        options.addWidget(self.regex_check)
+        options.addWidget(self.case_check)
+        options.addStretch()
+
+        self.find_button = QPushButton("Localizar")
+        self.replace_button = QPushButton("Substituir Tudo")
+        self.replace_button.setEnabled(False)
+        options.addWidget(self.find_button)
+        options.addWidget(self.replace_button)
+        layout.addLayout(options)
+
+        self.summary = QLabel()
+        layout.addWidget(self.summary)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Arquivo", "Linha", "Antes", "Depois"])
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True)
+
+        header = self.tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        layout.addWidget(self.tree)
+
+        self.find_button.clicked.connect(self.run_find)
+        self.find_edit.returnPressed.connect(self.run_find)
+        self.replace_button.clicked.connect(self._on_replace_all)
+        self.tree.itemDoubleClicked.connect(self._on_item_activated)
+
+        # Mudou a busca: a prévia antiga não vale mais
+        for edit in (self.find_edit, self.replace_edit):
+            edit.textChanged.connect(self._invalidate)
+        for box in (self.regex_check, self.case_check):
+            box.toggled.connect(self._invalidate)
+
+    # --------------------------------------------------
+
+    def query(self) -> ReplaceQuery:
+        return ReplaceQuery(
+            find=self.find_edit.text(),
+            replace=self.replace_edit.text(),
+            regex=self.regex_check.isChecked(),
+            case_sensitive=self.case_check.isChecked(),
+        )
+
+    def _invalidate(self, *_):
+        self._matches = []
+        self.tree.clear()
+        self.summary.clear()
+        self.replace_button.setEnabled(False)
+
+    # --------------------------------------------------
+
+    def run_find(self):
+        self._invalidate()
+
+        query = self.query()
+        if not query.find:
+            return
+
+        try:
+            self._matches = find_replacements(
+                self.project, query, self.search_index
+            )
+        except re.error as e:
+            QMessageBox.warning(self, "Regex inválida", str(e))
+            return
+
+        root = Path(self.project.root_path)
+        items = []
+
+        for i, m in enumerate(self._matches[:self.PREVIEW_LIMIT]):
+            try:
+                name = str(Path(m.file_path).relative_to(root))
+            except ValueError:
+                name = Path(m.file_path).name
+
+            item = QTreeWidgetItem([
+                name,
+                "",
+                m.old_text.replace("\n", " "),
+                m.new_text.replace("\n", " "),
+            ])
+            item.setData(1, Qt.DisplayRole, m.entry.context.get("line_number", ""))
+            item.setData(0, Qt.UserRole, i)
+            item.setCheckState(0, Qt.Checked)
+            items.append(item)
+
+        self.tree.addTopLevelItems(items)
+
+        total = sum(m.count for m in self._matches)
+        files = len({m.file_path for m in self._matches})
+        text = (
+            f"{total} ocorrência(s) em {len(self._matches)} linha(s), "
+            f"{files} arquivo(s)."
+        )
+        if len(self._matches) > self.PREVIEW_LIMIT:
+            text += f" Mostrando as primeiras {self.PREVIEW_LIMIT}."
+        self.summary.setText(text)
+
+        self.replace_button.setEnabled(bool(self._matches))
+
+    # --------------------------------------------------
+
+    def _on_replace_all(self):
+        if not self._matches:
+            return
+
+        skipped = set()
+        for i in range(self.tree.topLevelItemCount()):
+            item = self.tree.topLevelItem(i)
+            if item.checkState(0) != Qt.Checked:
+                skipped.add(item.data(0, Qt.UserRole))
+
+        selected = [
+            m for i, m in enumerate(self._matches) if i not in skipped
+        ]
+        if not selected:
+            return
+
+        self.replace_requested.emit(selected)
+        self.run_find()
+
+    def _on_item_activated(self, item: QTreeWidgetItem, _column: int):
+        i = item.data(0, Qt.UserRole)
+        if i is not None and i < len(self._matches):
+            m = self._matches[i]
+            self.entry_activated.emit(m.file_path, m.entry)
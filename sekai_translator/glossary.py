@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple
+
+
+# ============================================================
+# Termo
+# ============================================================
+
+@dataclass(frozen=True)
+class GlossaryTerm:
+    source: str
+    target: str
+    note: str = ""
+
+    def to_dict(self) -> dict:
+        data = {"source": self.source, "target": self.target}
+        if self.note:
+            data["note"] = self.note
+        return data
+
+    @staticmethod
+    def from_dict(data: dict) -> "GlossaryTerm":
+        return GlossaryTerm(
+            source=data.get("source", ""),
+            target=data.get("target", ""),
+            note=data.get("note", ""),
+        )
+
+    def targets(self) -> List[str]:
+        """Traduções aceitas (variantes separadas por '|')."""
+        return [t.strip() for t in self.target.split("|") if t.strip()]
+
+
+def project_terms(project) -> Tuple[Tuple[str, str], ...]:
+    """Pares (termo, tradução) do projeto, em forma hashable."""
+    return tuple(
+        (t["source"], t.get("target", ""))
+        for t in getattr(project, "glossary", None) or ()
+        if t.get("source")
+    )
+
+
+# ============================================================
+# Aho-Corasick
+# ============================================================
+
+class AhoCorasick:
+    """
+    Autômato de múltiplos padrões: uma passada pelo texto encontra
+    todas as ocorrências de todos os termos, independente de quantos
+    termos existam.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[int, ...]] = [()]
+
+        for index, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = out[state] + (index,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+
+                f = fail[state]
+                while f and char not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(char, 0)
+                fail[nxt] = target if target != nxt else 0
+
+                # Saídas herdadas do sufixo: sem seguir links na busca
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._alphabet = frozenset(goto[0]).union(*goto[1:]) if goto else frozenset()
+
+    def iter_matches(self, text: str):
+        """Gera (início, fim, índice do padrão)."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        alphabet = self._alphabet
+        patterns = self.patterns
+
+        state = 0
+        for pos, char in enumerate(text):
+            if char not in alphabet:
+                state = 0
+                continue
+
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if out[state]:
+                end = pos + 1
+                for index in out[state]:
+                    yield end - len(patterns[index]), end, index
+
+
+# ============================================================
+# Matcher do glossário
+# ============================================================
+
+def _is_word_char(char: str) -> bool:
+    # Só letras/dígitos ASCII pedem fronteira de palavra:
+    # em japonês / chinês não há espaços entre palavras
+    return char.isascii() and char.isalnum()
+
+
+class GlossaryMatcher:
+    """
+    Glossário compilado. Busca sem diferenciar maiúsculas e,
+    para termos latinos, só palavras inteiras.
+    """
+
+    def __init__(self, terms: Tuple[Tuple[str, str], ...]):
+        self.terms = [GlossaryTerm(source, target) for source, target in terms]
+        self._automaton = AhoCorasick([t.source.casefold() for t in self.terms])
+        self._targets = [
+            [v.casefold() for v in t.targets()] for t in self.terms
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    # --------------------------------------------------
+
+    def _matches(self, text: str):
+        """Gera (início, fim, índice do termo)."""
+        if not text or not self.terms:
+            return
+
+        folded = text.casefold()
+        # casefold pode mudar o tamanho (ß → ss): aí as posições não
+        # batem mais e a busca vai no texto original
+        haystack = folded if len(folded) == len(text) else text
+
+        terms = self.terms
+        for start, end, index in self._automaton.iter_matches(haystack):
+            source = terms[index].source
+            if _is_word_char(source[0]) and start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if _is_word_char(source[-1]) and end < len(text) and _is_word_char(text[end]):
+                continue
+            yield start, end, index
+
+    def find(self, text: str) -> List[Tuple[int, int, GlossaryTerm]]:
+        """Ocorrências (início, fim, termo) no texto."""
+        return [
+            (start, end, self.terms[index])
+            for start, end, index in self._matches(text)
+        ]
+
+    def terms_in(self, text: str) -> List[GlossaryTerm]:
+        """Termos distintos presentes no texto, na ordem em que aparecem."""
+        seen: Set[int] = set()
+        terms = []
+        for _, _, index in self._matches(text):
+            if index not in seen:
+                seen.add(index)
+                terms.append(self.terms[index])
+        return terms
+
+    def missing(self, original: str, translation: str) -> List[GlossaryTerm]:
+        """Termos presentes no original cuja tradução aprovada não aparece."""
+        translated = (translation or "").casefold()
+        missing = []
+        seen: Set[int] = set()
+
+        for _, _, index in self._matches(original):
+            if index in seen:
+                continue
+            seen.add(index)
+
+            targets = self._targets[index]
+            if targets and not any(t in translated for t in targets):
+                missing.append(self.terms[index])
+
+        return missing
+
+
+@lru_cache(maxsize=4)
+def glossary_matcher(terms: Tuple[Tuple[str, str], ...]) -> GlossaryMatcher:
+    """Matcher compartilhado (editor, QA) para o mesmo glossário."""
+    return GlossaryMatcher(terms)
@@ -0,0 +1,160 @@
+import csv
+
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QFileDialog,
+    QMessageBox,
+    QDialogButtonBox,
+)
+
+
+class GlossaryDialog(QDialog):
+    """
+    Edita o glossário do projeto (nomes, lugares, habilidades).
+    Traduções alternativas aceitas: separar com '|'.
+    """
+
+    COLUMNS = ("source", "target", "note")
+
+    def __init__(self, project, parent=None):
+        super().__init__(parent)
+
+        self.setWindowTitle("Glossário")
+        self.resize(760, 520)
+
+        self.terms: list = list(project.glossary)
+
+        layout = QVBoxLayout(self)
+
+        top = QHBoxLayout()
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filtrar termos…")
+        self.filter_edit.setClearButtonEnabled(True)
+        top.addWidget(self.filter_edit)
+
+        add_button = QPushButton("Adicionar")
+        remove_button = QPushButton("Remover")
+        import_button = QPushButton("Importar CSV...")
+        top.addWidget(add_button)
+        top.addWidget(remove_button)
+        top.addWidget(import_button)
+        layout.addLayout(top)
+
+        self.table = QTableWidget(0, 3)
+        self.table.setHorizontalHeaderLabels(["Termo", "Tradução", "Nota"])
+        self.table.verticalHeader().setVisible(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        layout.addWidget(
+            QLabel("Várias traduções aceitas: separe com \"|\" (ex.: magia|feitiço).")
+        )
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self._on_accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        add_button.clicked.connect(self._add_row)
+        remove_button.clicked.connect(self._remove_rows)
+        import_button.clicked.connect(self._import_csv)
+        self.filter_edit.textChanged.connect(self._apply_filter)
+
+        self._fill(self.terms)
+
+    # --------------------------------------------------
+
+    def _fill(self, terms):
+        self.table.setRowCount(0)
+        self.table.setRowCount(len(terms))
+        for row, term in enumerate(terms):
+            for col, key in enumerate(self.COLUMNS):
+                self.table.setItem(row, col, QTableWidgetItem(term.get(key, "")))
+
+    def _add_row(self):
+        self.filter_edit.clear()
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        for col in range(3):
+            self.table.setItem(row, col, QTableWidgetItem(""))
+        self.table.editItem(self.table.item(row, 0))
+
+    def _remove_rows(self):
+        rows = sorted(
+            {i.row() for i in self.table.selectedIndexes()}, reverse=True
+        )
+        for row in rows:
+            self.table.removeRow(row)
+
+    def _apply_filter(self, text: str):
+        text = text.casefold()
+        for row in range(self.table.rowCount()):
+            visible = not text or any(
+                text in (self.table.item(row, col).text().casefold()
+                         if self.table.item(row, col) else "")
+                for col in range(3)
+            )
+            self.table.setRowHidden(row, not visible)
+
+    def _import_csv(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Importar glossário", "", "CSV (*.csv);;Todos (*.*)"
+        )
+        if not path:
+            return
+
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as f:
+                rows = [r for r in csv.reader(f) if r and r[0].strip()]
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            QMessageBox.warning(self, "Importar glossário", str(e))
+            return
+
+        terms = self._collect()
+        known = {t["source"] for t in terms}
+        for r in rows:
+            source = r[0].strip()
+            if source in known:
+                continue
+            known.add(source)
+            terms.append({
+                "source": source,
+                "target": r[1].strip() if len(r) > 1 else "",
+                "note": r[2].strip() if len(r) > 2 else "",
+            })
+
+        self.filter_edit.clear()
+        self._fill(terms)
+
+    # --------------------------------------------------
+
+    def _collect(self) -> list:
+        terms = []
+        for row in range(self.table.rowCount()):
+            values = [
+                (self.table.item(row, col).text().strip()
+                 if self.table.item(row, col) else "")
+                for col in range(3)
+            ]
+            if not values[0]:
+                continue
+            term = {"source": values[0], "target": values[1]}
+            if values[2]:
+                term["note"] = values[2]
+            terms.append(term)
+        return terms
+
+    def _on_accept(self):
+        self.terms = self._collect()
+        self.accept()
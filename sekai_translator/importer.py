@@ -5,3 +5,8 @@ from sekai_translator.core import Project
 def import_file(file_path: str, project: Project):
     parser = get_parser(file_path, project)
     return parser.parse(file_path, project.encoding)
+
+
+def iter_import_file(file_path: str, project: Project):
+    parser = get_parser(file_path, project)
+    return parser.iter_parse(file_path, project.encoding)
@@ -1,12 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 import os
 import sys
 import subprocess
-
-from PySide6.QtCore import Qt, QSortFilterProxyModel, QSettings
-from PySide6.QtGui import QFont, QColor, QShortcut
+import threading
+import time
+
+from PySide6.QtCore import (
+    Qt,
+    QItemSelectionModel,
+    QSortFilterProxyModel,
+    QSettings,
+    Signal,
+    QTimer,
+)
+from PySide6.QtGui import QFont, QColor, QShortcut, QKeySequence
 from PySide6.QtWidgets import (
+    QApplication,
     QMainWindow,
     QSplitter,
     QTreeView,
@@ -17,25 +28,42 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHeaderView,
     QLabel,
+    QPushButton,
+    QProgressBar,
 )
 
 from sekai_translator import __app_name__, __version__
-from sekai_translator.update_service import UpdateService
+from sekai_translator.update_service import CHECK_INTERVAL, VERSION_URL, UpdateService
 
-from sekai_translator.core import Project, TranslationStatus
-from sekai_translator.project_io import load_project, save_project
+from sekai_translator.core import Project
+from sekai_translator.project_io import load_project, save_project, list_projects
 from sekai_translator.translation_table import (
     TranslationTableModel,
     TranslationTableView,
+    TableFilterBar,
 )
 from sekai_translator.editor_panel import EditorPanel
-from sekai_translator.importer import import_file
-from sekai_translator.exporter import export_translated_file
+from sekai_translator.importer import iter_import_file
 from sekai_translator.qa_service import QAService
-from sekai_translator.project_status import build_project_status, export_project_status
+from sekai_translator.qa_scan import ProjectQAScanner
+from sekai_translator.search_index import SearchIndex
+from sekai_translator.search_panel import SearchPanel
+from sekai_translator.speaker_index import SpeakerIndex
+from sekai_translator.speaker_panel import SpeakerPanel
+from sekai_translator.find_replace import ReplaceMatch, apply_replacements
+from sekai_translator.translation_memory import TranslationMemory
+from sekai_translator.propagation import (
+    OriginalIndex,
+    apply_fills,
+    memory_fills,
+    propagation_fills,
+)
+from sekai_translator.status_service import StatusService
+from sekai_translator.change_bus import ChangeBus, EntryChanged
+from sekai_translator.undo_stack import CompositeUndoAction, UndoStack
+from sekai_translator.project_status import export_project_status
 
-from sekai_translator.create_project_dialog import CreateProjectDialog
-from sekai_translator.open_project_dialog import OpenProjectDialog
+# Diálogos e exportador: importados no primeiro uso (abertura mais rápida)
 
 
 # ============================================================
@@ -64,11 +92,13 @@ class FileFilterProxy(QSortFilterProxyModel):
         if not index.isValid():
             return False
 
-        path = self.sourceModel().filePath(index)
-        if os.path.isdir(path):
+        # isDir / fileName vêm do cache do QFileSystemModel:
+        # nada de acesso ao disco a cada linha
+        model = self.sourceModel()
+        if model.isDir(index):
             return True
 
-        return Path(path).suffix.lower() in self.ALLOWED_EXTENSIONS
+        return os.path.splitext(model.fileName(index))[1].lower() in self.ALLOWED_EXTENSIONS
 
     def data(self, index, role=Qt.DisplayRole):
         src = self.mapToSource(index)
@@ -76,9 +106,14 @@ class FileFilterProxy(QSortFilterProxyModel):
 
         if role == Qt.DisplayRole:
             name = os.path.basename(path)
-            if self.project and path in self.project.files:
+            if not self.project:
+                return name
+            if path in self.project.stats.files:
                 progress = self.project.file_progress(path)
                 return f"{name} [{progress}%]"
+            progress = self.project.folder_progress(path)
+            if progress is not None:
+                return f"{name} [{progress}%]"
             return name
 
         if role == Qt.FontRole:
@@ -88,7 +123,7 @@ class FileFilterProxy(QSortFilterProxyModel):
             return font
 
         if role == Qt.ForegroundRole and self.project:
-            if self.project.file_status_cache.get(path):
+            if self.project.stats.has_translated(path):
                 return QColor("#a7f3d0")
 
             if self.active_path and os.path.normpath(path) == self.active_path:
@@ -103,6 +138,13 @@ class FileFilterProxy(QSortFilterProxyModel):
 
 class FileTab(QWidget):
 
+    # Carga progressiva: o parser (gerador) é consumido em fatias
+    # pelo event loop. A primeira é curta (primeira tela em poucos
+    # milissegundos); as seguintes maiores, para não pagar o custo
+    # de inserção na view a cada punhado de linhas.
+    FIRST_SLICE = 0.010
+    SLICE = 0.050
+
     def __init__(self, project: Project, file_path: str, parent):
         super().__init__()
 
@@ -111,35 +153,55 @@ class FileTab(QWidget):
         self.parent = parent
         self.dirty = False
 
-        if file_path not in project.files:
-            project.files[file_path] = import_file(file_path, project)
-            project.index_entries()
-            project.update_file_status(file_path)
+        # Arquivo ainda não importado: parse em fatias, linhas
+        # entrando na tabela aos lotes; só leitura até terminar
+        self.loading = file_path not in project.files
 
-        self.all_entries = project.files[file_path]
+        self.all_entries = [] if self.loading else project.files[file_path]
+
+        # Aba em segundo plano sem modelo / tabela / editor (ver hibernate)
+        self.hibernated = False
+        self._saved_view: dict | None = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        splitter = QSplitter(Qt.Vertical)
-        layout.addWidget(splitter)
+        self.filter_bar = TableFilterBar([])
+        self.filter_bar.filter_changed.connect(self._on_filter_changed)
+
+        self.loading_label = QLabel("Carregando arquivo…")
+        self.loading_label.setVisible(self.loading)
+
+        layout.addWidget(self.filter_bar)
+        layout.addWidget(self.loading_label)
+
+        self._build_view()
+        self.filter_bar.set_speakers(self.model.row_index.speakers())
+
+        if self.loading:
+            self._start_loading()
+        elif self.model.rowCount() > 0:
+            self.table.selectRow(0)
+
+    def _build_view(self):
+        """Modelo, tabela e editor (na criação e ao sair da hibernação)."""
+        self.splitter = QSplitter(Qt.Vertical)
 
         self.table = TranslationTableView()
         self.model = TranslationTableModel(self.all_entries)
         self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
 
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        self._apply_header()
 
+        self.editor = EditorPanel(self.project, self.file_path)
+        self.editor.memories = self.parent.memories
 
-        self.editor = EditorPanel(self.project)
-
-        splitter.addWidget(self.table)
-        splitter.addWidget(self.editor)
-        splitter.setSizes([360, 540])
+        self.splitter.addWidget(self.table)
+        self.splitter.addWidget(self.editor)
+        self.splitter.setSizes([360, 540])
+        self.layout().addWidget(self.splitter)
 
         self.table.selectionModel().selectionChanged.connect(
             self._on_selection_changed
@@ -148,11 +210,184 @@ class FileTab(QWidget):
 
         self.editor.request_next.connect(self._go_next)
         self.editor.request_prev.connect(self._go_prev)
-        self.model.advance_requested.connect(self._go_next_from_model)
+        self.model.translation_edited.connect(self._on_table_edit)
+
+    def _apply_header(self):
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
 
-        if self.model.rowCount() > 0:
+    # --------------------------------------------------------
+    # Carga progressiva
+    # --------------------------------------------------------
+
+    def _start_loading(self):
+        self.filter_bar.setEnabled(False)
+        self.editor.setEnabled(False)
+        self._edit_triggers = self.table.editTriggers()
+        self.table.setEditTriggers(TranslationTableView.NoEditTriggers)
+
+        self._parsing = None
+        self._slice = self.FIRST_SLICE
+
+        # Intervalo 0: uma fatia a cada volta do event loop, com
+        # pintura e input processados entre elas
+        self._load_timer = QTimer(self)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._load_slice)
+        self._load_timer.start()
+
+    def _load_slice(self):
+        deadline = time.perf_counter() + self._slice
+        self._slice = self.SLICE
+
+        batch = []
+        error = None
+        done = False
+        try:
+            if self._parsing is None:
+                self._parsing = iter_import_file(self.file_path, self.project)
+            for entry in self._parsing:
+                batch.append(entry)
+                if not len(batch) & 63 and time.perf_counter() > deadline:
+                    break
+            else:
+                done = True
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+            done = True
+
+        if batch:
+            self._on_rows_parsed(batch)
+
+        if done:
+            self._load_timer.stop()
+            self._parsing = None
+            self._on_parse_finished(error)
+
+    def cancel_loading(self):
+        """Aba fechada / projeto trocado: descarta o resto da carga."""
+        if self.loading:
+            self._load_timer.stop()
+            self._parsing = None
+
+    def _on_rows_parsed(self, batch: list):
+        columns = self.model.columnCount()
+        self.model.append_entries(batch)
+        if self.model.columnCount() != columns:
+            self._apply_header()
+
+        self.loading_label.setText(
+            f"Carregando arquivo… {len(self.all_entries)} linha(s)"
+        )
+
+        if (
+            self.model.rowCount() > 0
+            and not self.table.selectionModel().hasSelection()
+        ):
             self.table.selectRow(0)
 
+    def _on_parse_finished(self, error):
+        self.loading = False
+        self.loading_label.hide()
+
+        if error is not None:
+            self.parent.file_load_failed(self, error)
+            return
+
+        # Entra no projeto só completo: contadores, índices, undo
+        project = self.project
+        path = self.file_path
+        project.files[path] = self.all_entries
+        project.index_file(path)
+        project.update_file_status(path)
+        if self.parent.search_index is not None:
+            self.parent.search_index.add_file(path, self.all_entries)
+        if self.parent.original_index is not None:
+            self.parent.original_index.add_file(path, self.all_entries)
+        if self.parent.speaker_index is not None:
+            self.parent.speaker_index.add_file(path, self.all_entries)
+
+        self.filter_bar.set_speakers(self.model.row_index.speakers())
+        self.filter_bar.setEnabled(True)
+        self.editor.setEnabled(True)
+        self.table.setEditTriggers(self._edit_triggers)
+
+        self.parent.file_loaded(self)
+
+    # --------------------------------------------------------
+    # Hibernação
+    # --------------------------------------------------------
+
+    def hibernate(self):
+        """
+        Libera modelo, tabela e editor (aba fora de uso). As entradas
+        continuam no projeto; ficam guardados rolagem, seleção,
+        ordenação e o texto ainda não confirmado do editor.
+        """
+        if self.hibernated or self.loading:
+            return
+
+        header = self.table.horizontalHeader()
+        draft = self.editor.translation_edit.toPlainText()
+        committed = "\n".join(e.translation or "" for e in self.editor._entries)
+
+        self._saved_view = {
+            "selected": list(self.editor._entries),
+            "scroll": self.table.verticalScrollBar().value(),
+            "sort": (header.sortIndicatorSection(), header.sortIndicatorOrder()),
+            "sizes": self.splitter.sizes(),
+            "draft": draft if draft != committed else None,
+        }
+
+        self.splitter.setParent(None)
+        self.splitter.deleteLater()
+        self.splitter = self.table = self.model = self.editor = None
+        self.hibernated = True
+
+    def wake(self):
+        """Recria a visualização como estava antes de hibernar."""
+        if not self.hibernated:
+            return
+
+        saved = self._saved_view
+        self._saved_view = None
+        self.hibernated = False
+
+        self._build_view()
+
+        row_filter = self.filter_bar.current_filter()
+        if not row_filter.is_empty():
+            self.model.set_filter(row_filter)
+        self.table.sortByColumn(*saved["sort"])
+        self.splitter.setSizes(saved["sizes"])
+
+        selection = self.table.selectionModel()
+        for entry in saved["selected"]:
+            row = self.model.row_of(entry)
+            if row >= 0:
+                selection.select(
+                    self.model.index(row, 0),
+                    QItemSelectionModel.Select | QItemSelectionModel.Rows,
+                )
+
+        if saved["draft"] is not None and self.editor._entries:
+            self.editor.translation_edit.setPlainText(saved["draft"])
+
+        # A faixa da barra de rolagem só existe depois do layout
+        scroll = saved["scroll"]
+        table = self.table
+
+        def restore_scroll():
+            if table is self.table:
+                table.verticalScrollBar().setValue(scroll)
+
+        QTimer.singleShot(0, restore_scroll)
+
+    # --------------------------------------------------------
+
     def _on_selection_changed(self, *_):
         rows = sorted(
             i.row() for i in self.table.selectionModel().selectedRows()
@@ -160,29 +395,42 @@ class FileTab(QWidget):
         if rows:
             self.editor.set_entries(
                 [self.model.entries[r] for r in rows],
-                rows
-        )
+                [self.model.source_row(r) for r in rows],
+            )
 
+    def _on_filter_changed(self, row_filter):
+        if self.hibernated:
+            return  # aplicado ao acordar
 
-    def _on_entry_changed(self):
-        for entry in self.editor._entries:
-            entry.qa_issues = QAService.run(entry)
+        current = list(self.editor._entries)
 
-        self.project.update_file_status(self.file_path)
+        self.model.set_filter(row_filter)
+
+        # Mantém a linha que estava sendo editada, se continuar visível
+        for entry in current:
+            if self.model.row_of(entry) >= 0:
+                self.select_entry(entry)
+                break
 
-        self.dirty = True
-        self.parent.update_tab_title(self)
-        self.parent._update_status_bar()
 
-        self.model.refresh()
+    def _on_entry_changed(self):
+        # QA, índices, contadores e telas: via ChangeBus
+        self.parent.propagate_from(self.file_path, self.editor._entries)
+
+    def select_entry(self, entry):
+        self.wake()
+        row = self.model.row_of(entry)
+        if row < 0:
+            return
+        self.table.selectRow(row)
+        self.table.scrollTo(self.model.index(row, 0))
 
     def _go_next(self):
         if not self.editor._entries:
             return
         entry = self.editor._entries[-1]
-        try:
-            row = self.model.entries.index(entry)
-        except ValueError:
+        row = self.model.row_of(entry)
+        if row < 0:
             return
 
         if row + 1 < self.model.rowCount():
@@ -193,7 +441,11 @@ class FileTab(QWidget):
         if index.isValid() and index.row() > 0:
             self.table.selectRow(index.row() - 1)
 
-    def _go_next_from_model(self, row: int):
+    def _on_table_edit(self, row: int, text: str):
+        entry = self.model.entries[row]
+        if self.editor.commit_lines([entry], [text]):
+            self.parent.propagate_from(self.file_path, [entry])
+
         if row + 1 < self.model.rowCount():
             self.table.selectRow(row + 1)
 
@@ -208,6 +460,18 @@ class FileTab(QWidget):
 
 class MainWindow(QMainWindow):
 
+    # Abas com modelo / editor vivos (QSettings: max_live_tabs)
+    MAX_LIVE_TABS = 8
+
+    # (id do projeto, TranslationMemory) vindo da thread de carga
+    _shared_memory_ready = Signal(str, object)
+
+    # (UpdateInfo | None, erro | None, automática?) vindo da thread
+    _update_checked = Signal(object, object, bool)
+
+    # (caminho, projeto lido | None, erro | None) vindo da thread
+    _project_read = Signal(str, object, object)
+
     def __init__(self):
         super().__init__()
 
@@ -219,13 +483,49 @@ class MainWindow(QMainWindow):
         self.project: Project | None = None
         self.open_tabs: Dict[str, FileTab] = {}
 
+        # Alterações não salvas em qualquer arquivo do projeto (não só
+        # nas abas abertas: substituir / propagar / pré-traduzir)
+        self.project_dirty = False
+
+        # Abas por ordem de ativação (a última é a atual): só as
+        # max_live_tabs mais recentes mantêm modelo / editor vivos
+        self._tab_order: List[str] = []
+
+        self.qa_scanner = ProjectQAScanner()
+        self._qa_dialog = None          # QAReportDialog (no primeiro uso)
+        self.search_index: SearchIndex | None = None
+        self._replace_dialog = None     # FindReplaceDialog (no primeiro uso)
+
+        # Memória do projeto atual (+ outros projetos, se ativado).
+        # A lista é compartilhada com os editores.
+        self.translation_memory: TranslationMemory | None = None
+        self.memories: list = []
+        self.original_index: OriginalIndex | None = None
+        self.speaker_index: SpeakerIndex | None = None
+        self._tm_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tm")
+        self._shared_memory_ready.connect(self._on_shared_memory_ready)
+
+        self._update_thread: threading.Thread | None = None
+        self._update_info = None
+        self._update_checked.connect(self._on_update_checked)
+
+        self._load_thread: threading.Thread | None = None
+        self._project_read.connect(self._on_project_read)
+
+        # Alterações de texto / status: juntadas por volta do event loop
+        self.changes = ChangeBus(schedule=lambda fn: QTimer.singleShot(0, fn))
+        self.changes.subscribe(self._on_entries_changed)
+        StatusService.add_listener(self.changes.entry_changed)
+
         self._build_ui()
         self._build_status_bar()
         self._build_menu()
         self._install_global_shortcuts()
-        self._try_restore_last_project()
 
-        self.check_for_updates(auto=True)
+        # Janela primeiro: o último projeto e a verificação de
+        # atualizações só começam com o event loop rodando
+        QTimer.singleShot(0, self._try_restore_last_project)
+        QTimer.singleShot(0, lambda: self.check_for_updates(auto=True))
 
     # --------------------------------------------------------
     # Status bar
@@ -242,6 +542,25 @@ class MainWindow(QMainWindow):
         bar.addWidget(self.status_file_progress)
         bar.addPermanentWidget(self.status_project_progress)
 
+        # Indicador de carga do projeto (indeterminado)
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setMaximumWidth(120)
+        self.load_progress.setMaximumHeight(14)
+        self.load_progress.setTextVisible(False)
+        self.load_progress.hide()
+        bar.addPermanentWidget(self.load_progress)
+
+        # Aviso de atualização (não modal): só aparece quando há uma
+        self.update_button = QPushButton()
+        self.update_button.setFlat(True)
+        self.update_button.setStyleSheet("color: #a7f3d0;")
+        self.update_button.hide()
+        self.update_button.clicked.connect(
+            lambda: self._confirm_update(self._update_info)
+        )
+        bar.addPermanentWidget(self.update_button)
+
     def _update_status_bar(self):
         if not self.project:
             self.status_file.setText("Arquivo: -")
@@ -260,9 +579,8 @@ class MainWindow(QMainWindow):
             self.status_file.setText("Arquivo: -")
             self.status_file_progress.setText("Arquivo: 0%")
 
-        stats = build_project_status(self.project)
         self.status_project_progress.setText(
-            f"Projeto: {stats['stats']['progress']}%"
+            f"Projeto: {self.project.stats.progress()}%"
         )
 
     # --------------------------------------------------------
@@ -321,6 +639,18 @@ class MainWindow(QMainWindow):
 
         self.tree.doubleClicked.connect(self._on_tree_double_click)
         self.tabs.tabCloseRequested.connect(self._close_tab)
+        self.tabs.currentChanged.connect(self._on_tab_activated)
+
+        self.search_panel = SearchPanel(self)
+        self.search_panel.entry_activated.connect(self._open_entry)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.search_panel)
+        self.search_panel.hide()
+
+        self.speaker_panel = SpeakerPanel(self)
+        self.speaker_panel.entry_activated.connect(self._open_entry)
+        self.speaker_panel.speaker_renamed.connect(self._on_speaker_renamed)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.speaker_panel)
+        self.speaker_panel.hide()
 
     # --------------------------------------------------------
     # MENUS
@@ -339,6 +669,48 @@ class MainWindow(QMainWindow):
         file_menu.addSeparator()
         file_menu.addAction("Sair", self.close)
 
+        search_menu = menubar.addMenu("Buscar")
+        search_action = search_menu.addAction(
+            "Buscar no Projeto...", self.show_project_search
+        )
+        search_action.setShortcut(QKeySequence("Ctrl+Shift+F"))
+        replace_action = search_menu.addAction(
+            "Localizar e Substituir...", self.show_find_replace
+        )
+        replace_action.setShortcut(QKeySequence("Ctrl+H"))
+        search_menu.addSeparator()
+        search_menu.addAction("Falas por Personagem...", self.show_speakers)
+
+        tm_menu = menubar.addMenu("Memória")
+        self.tm_shared_action = tm_menu.addAction("Usar outros projetos")
+        self.tm_shared_action.setCheckable(True)
+        self.tm_shared_action.setChecked(
+            self.settings.value("tm_use_other_projects", False, type=bool)
+        )
+        self.tm_shared_action.toggled.connect(self._on_tm_shared_toggled)
+
+        self.tm_propagate_action = tm_menu.addAction(
+            "Propagar para originais idênticos"
+        )
+        self.tm_propagate_action.setCheckable(True)
+        self.tm_propagate_action.setChecked(
+            self.settings.value("tm_propagate", True, type=bool)
+        )
+        self.tm_propagate_action.toggled.connect(
+            lambda checked: self.settings.setValue("tm_propagate", checked)
+        )
+
+        tm_menu.addSeparator()
+        tm_menu.addAction(
+            "Pré-traduzir Projeto pela Memória", self.pretranslate_project
+        )
+        tm_menu.addSeparator()
+        tm_menu.addAction("Glossário...", self.edit_glossary)
+
+        qa_menu = menubar.addMenu("QA")
+        qa_menu.addAction("Verificar Projeto Inteiro", self.run_project_qa)
+        qa_menu.addAction("Configurar Regras...", self.configure_qa_rules)
+
         help_menu = menubar.addMenu("Ajuda")
         help_menu.addAction("Verificar atualizações", self.check_for_updates)
         help_menu.addAction("Sobre", self._show_about)
@@ -347,24 +719,104 @@ class MainWindow(QMainWindow):
     # Undo / Redo
     # --------------------------------------------------------
 
+    def _configure_undo(self):
+        """
+        Limite de memória do histórico (undo_memory_mb). O histórico
+        salvo (undo_history.bin) é configurado pelo load_project.
+        """
+        megabytes = self.settings.value(
+            "undo_memory_mb", UndoStack.MAX_BYTES // (1024 * 1024), type=int
+        )
+        self.project.undo_stack.configure(max_bytes=max(1, megabytes) * 1024 * 1024)
+
+    # O undo avisa o StatusService; o resto vem pelo ChangeBus,
+    # só para as linhas / arquivos / contadores tocados
+
     def undo(self):
         if self.project and self.project.undo_stack.can_undo():
-            self.project.undo_stack.undo(self.project)
-            self._refresh_after_undo_redo()
+            touched = self.project.undo_stack.undo(self.project)
+            self._after_undo_redo(touched, "Desfeito")
 
     def redo(self):
         if self.project and self.project.undo_stack.can_redo():
-            self.project.undo_stack.redo(self.project)
-            self._refresh_after_undo_redo()
+            touched = self.project.undo_stack.redo(self.project)
+            self._after_undo_redo(touched, "Refeito")
+
+    def _after_undo_redo(self, touched: list, verb: str):
+        """
+        touched: [(file_path, entrada)]. Atualiza já (sem esperar a
+        volta do event loop) e leva a aba atual até a linha desfeita.
+        """
+        self.changes.flush()
+        if not touched:
+            return
 
-    def _refresh_after_undo_redo(self):
-        for tab in self.open_tabs.values():
-            tab.model.refresh()
+        tab = self.tabs.currentWidget()
+        if tab:
+            for path, entry in touched:
+                if path == tab.file_path:
+                    if not any(e is entry for e in tab.editor._entries):
+                        tab.select_entry(entry)
+                    break
+
+        files = {path for path, _ in touched}
+        self.statusBar().showMessage(
+            f"{verb}: {len(touched)} linha(s) em {len(files)} arquivo(s).",
+            3000,
+        )
 
-        if self.project:
-            self.project.rebuild_all_file_status()
-            self.fs_proxy.invalidateFilter()
+    # --------------------------------------------------------
+    # Alterações de entradas (ChangeBus)
+    # --------------------------------------------------------
+
+    def _on_entries_changed(self, events: List[EntryChanged]):
+        """
+        Uma vez por volta do event loop, só com as linhas alteradas:
+        contadores, QA, índices e telas.
+        """
+        if not self.project:
+            return
+
+        stats = self.project.stats
+        by_file: Dict[str, list] = {}
+        for ev in events:
+            if ev.status_changed:
+                stats.status_changed(ev.entry, ev.old_status, ev.new_status)
+            by_file.setdefault(ev.file_path, []).append(ev.entry)
+
+        entries = [ev.entry for ev in events]
+        for entry, issues in zip(
+            entries, QAService.run_batch(entries, self.project)
+        ):
+            entry.qa_issues = issues
+
+        if self.search_index is not None:
+            self.search_index.update_entries(
+                [ev.entry for ev in events if ev.text_changed]
+            )
+        if self.translation_memory is not None:
+            self.translation_memory.add_entries(entries, self.project.name)
+
+        self.project_dirty = True
 
+        for path, touched in by_file.items():
+            tab = self.open_tabs.get(path)
+            if tab:
+                tab.dirty = True
+                self.update_tab_title(tab)
+
+                # Hibernada: o modelo é recriado já com os valores novos
+                if tab.hibernated:
+                    continue
+
+                tab.model.refresh_entries(touched)
+
+                # Editor mostrando uma linha alterada: recarrega
+                ids = {id(e) for e in touched}
+                if any(id(e) in ids for e in tab.editor._entries):
+                    tab._on_selection_changed()
+
+        self.tree.viewport().update()
         self._update_status_bar()
 
     # --------------------------------------------------------
@@ -372,25 +824,105 @@ class MainWindow(QMainWindow):
     # --------------------------------------------------------
 
     def _try_restore_last_project(self):
+        """
+        Lê o último projeto em background (JSON, índice de busca,
+        memória). A janela continua respondendo; só a adoção do
+        projeto lido roda na thread da interface.
+        """
         last = self.settings.value("last_project_path", "")
-        if last and Path(last).exists():
-            try:
-                self._load_project(last)
-            except Exception:
-                pass
+        if not last or not Path(last).exists():
+            return
+
+        if self._load_thread is not None and self._load_thread.is_alive():
+            return
+
+        self.load_progress.show()
+        self.statusBar().showMessage("Abrindo último projeto…")
+
+        self._load_thread = threading.Thread(
+            target=self._read_project_worker,
+            args=(last,),
+            name="project-load",
+            daemon=True,
+        )
+        self._load_thread.start()
+
+    def _read_project_worker(self, path: str):
+        try:
+            loaded, error = self._read_project(path), None
+        except Exception as e:
+            loaded, error = None, str(e) or e.__class__.__name__
+
+        self._project_read.emit(path, loaded, error)
+
+    def _on_project_read(self, path: str, loaded, error):
+        self.load_progress.hide()
+        self.statusBar().clearMessage()
+
+        # Outro projeto foi aberto enquanto este carregava
+        if self.project is not None:
+            return
+
+        if error is not None:
+            self.statusBar().showMessage(
+                f"Não foi possível abrir o último projeto: {error}", 5000
+            )
+            return
+
+        self._adopt_project(path, loaded)
 
     def open_project(self):
+        if not self._confirm_unsaved("Deseja salvar antes de trocar de projeto?"):
+            return
+
+        from sekai_translator.open_project_dialog import OpenProjectDialog
+
         dlg = OpenProjectDialog(self)
         if dlg.exec():
             self._load_project(dlg.project_path)
 
     def create_project(self):
+        if not self._confirm_unsaved("Deseja salvar antes de trocar de projeto?"):
+            return
+
+        from sekai_translator.create_project_dialog import CreateProjectDialog
+
         dlg = CreateProjectDialog(self)
         if dlg.exec():
             self._load_project(dlg.project_path)
 
+    @staticmethod
+    def _read_project(path: str) -> tuple:
+        """
+        Parte da abertura que não toca na interface (pode rodar fora
+        da thread principal): projeto e índices derivados.
+        """
+        project = load_project(path)
+        return (
+            project,
+            SearchIndex.load(project),
+            TranslationMemory.from_project(project),
+            OriginalIndex.from_project(project),
+            SpeakerIndex.from_project(project),
+        )
+
     def _load_project(self, path: str):
-        self.project = load_project(path)
+        self._adopt_project(path, self._read_project(path))
+
+    def _adopt_project(self, path: str, loaded: tuple):
+        (
+            project,
+            search_index,
+            translation_memory,
+            original_index,
+            speaker_index,
+        ) = loaded
+
+        self.changes.flush()
+
+        self.project = project
+        self.project_dirty = False
+        self.changes.set_project(self.project)
 
         root = Path(self.project.root_path)
         src_index = self.fs_model.setRootPath(str(root))
@@ -403,8 +935,34 @@ class MainWindow(QMainWindow):
             f"{self.project.name}  [lang={self.project.language}]"
         )
 
+        for tab in self.open_tabs.values():
+            tab.cancel_loading()
         self.tabs.clear()
         self.open_tabs.clear()
+        self._tab_order.clear()
+        self.qa_scanner.clear_cache()
+        self.qa_scanner.adopt(self.project)
+
+        self._configure_undo()
+
+        self.search_index = search_index
+        self.search_panel.set_index(self.search_index, self.project.root_path)
+
+        if self._replace_dialog is not None:
+            self._replace_dialog.close()
+            self._replace_dialog = None
+
+        self.translation_memory = translation_memory
+        self.memories[:] = [self.translation_memory]
+        self.original_index = original_index
+        self._load_shared_memory()
+
+        self.speaker_index = speaker_index
+        self.speaker_panel.set_index(
+            self.speaker_index,
+            self.project.speaker_names,
+            self.project.root_path,
+        )
 
         self.settings.setValue("last_project_path", path)
         self.main_splitter.setSizes([300, 1200])
@@ -435,6 +993,7 @@ class MainWindow(QMainWindow):
         rel = str(Path(path).relative_to(self.project.root_path))
         self.tabs.addTab(tab, rel)
         self.tabs.setCurrentWidget(tab)
+        self.update_tab_title(tab)
 
         self.fs_proxy.set_active_path(path)
         self._update_status_bar()
@@ -443,10 +1002,63 @@ class MainWindow(QMainWindow):
         idx = self.tabs.indexOf(tab)
         if idx != -1:
             title = str(Path(tab.file_path).relative_to(self.project.root_path))
-            self.tabs.setTabText(idx, f"● {title}" if tab.dirty else title)
+            if tab.loading:
+                title = f"⏳ {title}"
+            elif tab.dirty:
+                title = f"● {title}"
+            self.tabs.setTabText(idx, title)
+
+    def file_loaded(self, tab: FileTab):
+        """Carga em background terminou (arquivo já está no projeto)."""
+        self.update_tab_title(tab)
+        self.tree.viewport().update()
+        self._update_status_bar()
+
+    def file_load_failed(self, tab: FileTab, error: str):
+        idx = self.tabs.indexOf(tab)
+        if idx != -1:
+            self._close_tab(idx)
+
+        QMessageBox.warning(
+            self,
+            "Erro ao abrir arquivo",
+            f"Não foi possível abrir o arquivo:\n{tab.file_path}\n\n{error}",
+        )
+
+    def _on_tab_activated(self, index: int):
+        tab = self.tabs.widget(index)
+        if tab is None:
+            return
+
+        tab.wake()
+
+        if tab.file_path in self._tab_order:
+            self._tab_order.remove(tab.file_path)
+        self._tab_order.append(tab.file_path)
+
+        self._hibernate_tabs()
+
+    def _hibernate_tabs(self):
+        """
+        Abas ativadas há mais tempo, além do limite (max_live_tabs),
+        liberam modelo, tabela e editor até serem ativadas de novo.
+        """
+        limit = max(
+            1,
+            self.settings.value("max_live_tabs", self.MAX_LIVE_TABS, type=int),
+        )
+        live = [
+            path for path in self._tab_order
+            if path in self.open_tabs and not self.open_tabs[path].hibernated
+        ]
+        for path in live[:-limit]:
+            self.open_tabs[path].hibernate()
 
     def _close_tab(self, index):
         tab: FileTab = self.tabs.widget(index)
+        tab.cancel_loading()
+        if tab.file_path in self._tab_order:
+            self._tab_order.remove(tab.file_path)
         self.open_tabs.pop(tab.file_path, None)
         self.tabs.removeTab(index)
         self._update_status_bar()
@@ -459,9 +1071,14 @@ class MainWindow(QMainWindow):
         if not self.project:
             return
 
+        self.changes.flush()
+
         save_project(self.project)
         export_project_status(self.project)
+        if self.search_index is not None:
+            self.search_index.save(self.project)
 
+        self.project_dirty = False
         for tab in self.open_tabs.values():
             tab.mark_clean()
 
@@ -469,17 +1086,14 @@ class MainWindow(QMainWindow):
 
     def export_current_file(self):
         tab = self.tabs.currentWidget()
-        if not tab or not self.project:
+        if not tab or not self.project or tab.loading:
             return
 
-        critical = [
-            issue
-            for entry in tab.all_entries
-            for issue in entry.qa_issues
-            if issue.level == "error"
-        ]
+        # Nunca confiar nos qa_issues guardados: reavalia (com cache)
+        report = self.qa_scanner.scan(self.project, [tab.file_path])
+        tab.model.refresh_all()
 
-        if critical:
+        if report.errors:
             QMessageBox.critical(
                 self,
                 "Erro crítico de QA",
@@ -487,6 +1101,8 @@ class MainWindow(QMainWindow):
             )
             return
 
+        from sekai_translator.exporter import export_translated_file
+
         out = export_translated_file(
             tab.file_path,
             tab.all_entries,
@@ -499,6 +1115,255 @@ class MainWindow(QMainWindow):
             f"Arquivo exportado:\n{out}",
         )
 
+    # --------------------------------------------------------
+    # QA
+    # --------------------------------------------------------
+
+    def run_project_qa(self):
+        if not self.project:
+            return
+
+        self.changes.flush()
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            report = self.qa_scanner.scan(self.project)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        for tab in self.open_tabs.values():
+            if not tab.hibernated:
+                tab.model.refresh_all()
+
+        if self._qa_dialog is None:
+            from sekai_translator.qa_report_dialog import QAReportDialog
+
+            self._qa_dialog = QAReportDialog(
+                report, self.project.root_path, self
+            )
+            self._qa_dialog.entry_activated.connect(self._open_entry)
+        else:
+            self._qa_dialog.set_report(report, self.project.root_path)
+
+        self._qa_dialog.show()
+        self._qa_dialog.raise_()
+
+    def configure_qa_rules(self):
+        if not self.project:
+            return
+
+        from sekai_translator.qa_rules_dialog import QARulesDialog
+
+        dlg = QARulesDialog(self.project, self)
+        if dlg.exec():
+            self.project.qa_config = dlg.config.to_dict()
+            self._qa_config_changed()
+
+    def _qa_config_changed(self):
+        """
+        Regras / glossário mudaram: reavalia o projeto inteiro. Sem
+        isso os resultados antigos seriam gravados (qa_issues.json)
+        com a assinatura nova e voltariam como válidos. Fica para o
+        próximo "Salvar Projeto", como qualquer alteração.
+        """
+        self.changes.flush()
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.qa_scanner.scan(self.project)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        for tab in self.open_tabs.values():
+            if not tab.hibernated:
+                tab.model.refresh_all()
+
+        self.project_dirty = True
+
+    def edit_glossary(self):
+        if not self.project:
+            return
+
+        from sekai_translator.glossary_dialog import GlossaryDialog
+
+        dlg = GlossaryDialog(self.project, self)
+        if not dlg.exec():
+            return
+
+        self.project.glossary = dlg.terms
+
+        # O glossário faz parte da configuração do QA
+        self._qa_config_changed()
+
+        for tab in self.open_tabs.values():
+            if not tab.hibernated and tab.editor._entries:
+                tab.editor._update_glossary()
+
+    # --------------------------------------------------------
+    # Busca
+    # --------------------------------------------------------
+
+    def show_project_search(self):
+        if not self.project:
+            return
+        self.search_panel.focus_query()
+
+    def show_speakers(self):
+        if not self.project:
+            return
+        self.speaker_panel.show_panel()
+
+    def _on_speaker_renamed(self, speaker: str, name: str):
+        if not self.project:
+            return
+
+        # Vale para a próxima exportação (ver parsers.set_speaker_names)
+        if name:
+            self.project.speaker_names[speaker] = name
+        else:
+            self.project.speaker_names.pop(speaker, None)
+        self.project_dirty = True
+
+        self.statusBar().showMessage(
+            f"{speaker} → {name}" if name else f"{speaker}: nome original",
+            3000,
+        )
+
+    def show_find_replace(self):
+        if not self.project:
+            return
+
+        if self._replace_dialog is None:
+            from sekai_translator.find_replace_dialog import FindReplaceDialog
+
+            self._replace_dialog = FindReplaceDialog(
+                self.project, self.search_index, self
+            )
+            self._replace_dialog.replace_requested.connect(
+                self.apply_replacements
+            )
+            self._replace_dialog.entry_activated.connect(self._open_entry)
+
+        self._replace_dialog.show()
+        self._replace_dialog.raise_()
+        self._replace_dialog.find_edit.setFocus()
+
+    def apply_replacements(self, matches: List[ReplaceMatch]):
+        """
+        Aplica o substituir em lote. Status, QA, índice e telas são
+        atualizados uma vez por lote, só para as linhas alteradas.
+        """
+        if not self.project:
+            return
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            applied = apply_replacements(self.project, matches)
+            if not applied:
+                return
+            self.changes.flush()
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        self.statusBar().showMessage(
+            f"{sum(m.count for m in applied)} substituição(ões) "
+            f"em {len(applied)} linha(s).",
+            5000,
+        )
+
+    # --------------------------------------------------------
+    # Memória de tradução
+    # --------------------------------------------------------
+
+    def propagate_from(self, file_path: str, entries: list):
+        """
+        Copia as traduções recém-confirmadas para as linhas em branco
+        com o mesmo original (em qualquer arquivo importado). Entra no
+        mesmo passo de undo do commit.
+        """
+        if not self.project or self.original_index is None:
+            return
+        if not self.tm_propagate_action.isChecked():
+            return
+
+        fills = propagation_fills(
+            self.original_index, [(file_path, e) for e in entries]
+        )
+        if not fills:
+            return
+
+        actions = apply_fills(fills, StatusService.on_translation_propagated)
+        self.project.undo_stack.amend(actions)
+
+        self.statusBar().showMessage(
+            f"Tradução propagada para {len(fills)} linha(s) idêntica(s).",
+            5000,
+        )
+
+    def pretranslate_project(self):
+        """
+        Preenche as linhas em branco com correspondência exata na
+        memória (em andamento, para revisão). Um único passo de undo.
+        """
+        if not self.project or not self.memories:
+            return
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            fills = memory_fills(self.project, self.memories)
+            if fills:
+                actions = apply_fills(
+                    fills, StatusService.on_translation_pretranslated
+                )
+                self.project.undo_stack.push(CompositeUndoAction(actions))
+                self.changes.flush()
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        QMessageBox.information(
+            self,
+            "Pré-tradução",
+            f"{len(fills)} linha(s) preenchida(s) pela memória de tradução.",
+        )
+
+    def _on_tm_shared_toggled(self, checked: bool):
+        self.settings.setValue("tm_use_other_projects", checked)
+        if checked:
+            self._load_shared_memory()
+        elif self.translation_memory is not None:
+            self.memories[:] = [self.translation_memory]
+
+    def _load_shared_memory(self):
+        """Carrega as memórias dos outros projetos em background."""
+        if not self.project or not self.tm_shared_action.isChecked():
+            return
+        self._tm_pool.submit(self._build_shared_memory, self.project.id)
+
+    def _build_shared_memory(self, project_id: str):
+        projects = [p for p in list_projects() if p.id != project_id]
+        memory = TranslationMemory.from_projects(projects)
+        self._shared_memory_ready.emit(project_id, memory)
+
+    def _on_shared_memory_ready(self, project_id: str, memory):
+        if not self.project or self.project.id != project_id:
+            return
+        if not self.tm_shared_action.isChecked():
+            return
+
+        self.memories[:] = [self.translation_memory, memory]
+        self.statusBar().showMessage(
+            f"Memória de outros projetos: {len(memory)} segmento(s).",
+            5000,
+        )
+
+    def _open_entry(self, path: str, entry):
+        if not self.project:
+            return
+        self._open_file(path)
+        tab = self.open_tabs.get(path)
+        if tab:
+            tab.select_entry(entry)
+
     # --------------------------------------------------------
     # Helpers
     # --------------------------------------------------------
@@ -519,17 +1384,74 @@ class MainWindow(QMainWindow):
     # Update
     # --------------------------------------------------------
 
-    def check_for_updates(self, auto: bool = False):
-        info = UpdateService.check(__version__)
-        if not info:
+    def check_for_updates(self, auto: bool = False, url: str | None = None):
+        """
+        Consulta em background (nunca bloqueia a interface). A automática
+        roda no máximo uma vez por dia e só avisa se houver atualização.
+        """
+        if auto:
+            last = self.settings.value("update_last_check", 0.0, type=float)
+            if time.time() - last < CHECK_INTERVAL:
+                return
+
+        if self._update_thread is not None and self._update_thread.is_alive():
+            return
+
+        if not auto:
+            self.statusBar().showMessage("Verificando atualizações…")
+
+        self._update_thread = threading.Thread(
+            target=self._check_updates_worker,
+            args=(url or VERSION_URL, auto),
+            name="update-check",
+            daemon=True,
+        )
+        self._update_thread.start()
+
+    def _check_updates_worker(self, url: str, auto: bool):
+        try:
+            info = UpdateService.fetch(__version__, url)
+            error = None
+        except Exception as e:
+            info, error = None, str(e) or e.__class__.__name__
+
+        self._update_checked.emit(info, error, auto)
+
+    def _on_update_checked(self, info, error, auto: bool):
+        if error is None:
+            self.settings.setValue("update_last_check", time.time())
+
+        if not auto:
+            self.statusBar().clearMessage()
+
+        if info is not None:
+            self._update_info = info
+            self.update_button.setText(
+                f"Atualização {info.version} disponível"
+            )
+            self.update_button.show()
+
             if not auto:
-                QMessageBox.information(
-                    self,
-                    "Atualizações",
-                    "Você já está usando a versão mais recente.",
-                )
+                self._confirm_update(info)
             return
 
+        if auto:
+            return
+
+        if error is not None:
+            QMessageBox.warning(
+                self,
+                "Atualizações",
+                f"Não foi possível verificar atualizações.\n\n{error}",
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Atualizações",
+                "Você já está usando a versão mais recente.",
+            )
+
+    def _confirm_update(self, info):
         res = QMessageBox.question(
             self,
             "Atualização disponível",
@@ -542,11 +1464,14 @@ class MainWindow(QMainWindow):
         )
 
         if res == QMessageBox.Yes:
-            self._run_updater(info.url)
+            self._run_updater(info.url, info.sha256)
 
-    def _run_updater(self, installer_url: str):
+    def _run_updater(self, installer_url: str, sha256: str = ""):
         updater = Path(sys.executable).with_name("updater.exe")
-        subprocess.Popen([str(updater), installer_url], shell=True)
+        args = [str(updater), installer_url]
+        if sha256:
+            args.append(sha256)
+        subprocess.Popen(args, shell=True)
         sys.exit(0)
 
     # --------------------------------------------------------
@@ -554,28 +1479,39 @@ class MainWindow(QMainWindow):
     # --------------------------------------------------------
 
     def closeEvent(self, event):
-        if not self.project:
-            event.accept()
-            return
+        self._handle_close(event)
+        if event.isAccepted():
+            self.qa_scanner.close()
+            self._tm_pool.shutdown(wait=False, cancel_futures=True)
 
-        has_dirty = any(tab.dirty for tab in self.open_tabs.values())
-        if not has_dirty:
+    def _handle_close(self, event):
+        if self._confirm_unsaved("Deseja salvar antes de sair?"):
             event.accept()
-            return
+        else:
+            event.ignore()
+
+    def _confirm_unsaved(self, question: str) -> bool:
+        """
+        Pergunta se há alterações não salvas no projeto (em qualquer
+        arquivo). False = cancelar a operação.
+        """
+        if not self.project:
+            return True
+
+        self.changes.flush()
+
+        if not self.project_dirty:
+            return True
 
         res = QMessageBox.question(
             self,
             "Projeto não salvo",
-            "Existem alterações não salvas no projeto.\n\n"
-            "Deseja salvar antes de sair?",
+            f"Existem alterações não salvas no projeto.\n\n{question}",
             QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
             QMessageBox.Save,
         )
 
         if res == QMessageBox.Save:
             self.save_project()
-            event.accept()
-        elif res == QMessageBox.Discard:
-            event.accept()
-        else:
-            event.ignore()
+            return True
+        return res == QMessageBox.Discard
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List
+from typing import Iterator
 
 from sekai_translator.core import TranslationEntry, TranslationStatus
 from sekai_translator.parsers.base import BaseParser
@@ -13,7 +13,7 @@ class ArtemisParser(BaseParser):
 
     # --------------------------------------------------
 
-    def parse(self, file_path: str, encoding: str) -> List[TranslationEntry]:
+    def iter_parse(self, file_path: str, encoding: str) -> Iterator[TranslationEntry]:
         if not self.language:
             raise RuntimeError("Idioma não definido no parser Artemis")
 
@@ -21,8 +21,6 @@ class ArtemisParser(BaseParser):
             encoding=encoding, errors="ignore"
         ).splitlines()
 
-        entries: List[TranslationEntry] = []
-
         inside_block = False
         inside_text = False
         inside_lang = False
@@ -37,7 +35,7 @@ class ArtemisParser(BaseParser):
             if not inside_block and stripped.startswith("block_") and stripped.endswith("{"):
                 inside_block = True
                 block_depth = 1
-                entries.append(self._raw(line, ln))
+                yield self._raw(line, ln)
                 continue
 
             if inside_block:
@@ -47,7 +45,7 @@ class ArtemisParser(BaseParser):
                 if not inside_text and stripped.startswith("text ="):
                     inside_text = True
                     text_depth = 1
-                    entries.append(self._raw(line, ln))
+                    yield self._raw(line, ln)
                     continue
 
                 if inside_text:
@@ -61,7 +59,7 @@ class ArtemisParser(BaseParser):
                     ):
                         inside_lang = True
                         lang_depth = 1
-                        entries.append(self._raw(line, ln))
+                        yield self._raw(line, ln)
                         continue
 
                     if inside_lang:
@@ -70,7 +68,7 @@ class ArtemisParser(BaseParser):
 
                         if lang_depth == 0:
                             inside_lang = False
-                            entries.append(self._raw(line, ln))
+                            yield self._raw(line, ln)
                             continue
 
                         raw = line.rstrip().rstrip(",")
@@ -100,47 +98,43 @@ class ArtemisParser(BaseParser):
                             start_idx = line.find(text)
                             end_idx = start_idx + len(text)
 
-                            entries.append(
-                                TranslationEntry(
-                                    entry_id=str(ln),
-                                    original=text,
-                                    translation="",
-                                    status=TranslationStatus.UNTRANSLATED,
-                                    context={
-                                        "raw_line": line,
-                                        "prefix": line[:start_idx],
-                                        "suffix": line[end_idx:],
-                                        "wrapper": wrapper,
-                                        "is_translatable": True,
-                                        "language": self.language,
-                                        "line_number": ln,
-                                    },
-                                )
+                            yield TranslationEntry(
+                                entry_id=str(ln),
+                                original=text,
+                                translation="",
+                                status=TranslationStatus.UNTRANSLATED,
+                                context={
+                                    "raw_line": line,
+                                    "prefix": line[:start_idx],
+                                    "suffix": line[end_idx:],
+                                    "wrapper": wrapper,
+                                    "is_translatable": True,
+                                    "language": self.language,
+                                    "line_number": ln,
+                                },
                             )
                             continue
 
-                        entries.append(self._raw(line, ln))
+                        yield self._raw(line, ln)
                         continue
 
                     if text_depth == 0:
                         inside_text = False
-                        entries.append(self._raw(line, ln))
+                        yield self._raw(line, ln)
                         continue
 
-                    entries.append(self._raw(line, ln))
+                    yield self._raw(line, ln)
                     continue
 
                 if block_depth == 0:
                     inside_block = False
-                    entries.append(self._raw(line, ln))
+                    yield self._raw(line, ln)
                     continue
 
-                entries.append(self._raw(line, ln))
+                yield self._raw(line, ln)
                 continue
 
-            entries.append(self._raw(line, ln))
-
-        return entries
+            yield self._raw(line, ln)
 
     # --------------------------------------------------
 
@@ -3,15 +3,23 @@ class BaseParser:
 
     def __init__(self):
         self.language = None
+        self.speaker_names = {}
 
     def set_language(self, language: str):
         self.language = language
 
+    def set_speaker_names(self, names: dict):
+        self.speaker_names = names or {}
+
     def can_parse(self, file_path: str) -> bool:
         raise NotImplementedError
 
-    def parse(self, file_path: str, encoding: str):
+    def iter_parse(self, file_path: str, encoding: str):
+        """Entradas do arquivo, uma a uma (permite carga progressiva)."""
         raise NotImplementedError
 
+    def parse(self, file_path: str, encoding: str):
+        return list(self.iter_parse(file_path, encoding))
+
     def rebuild(self, source_file, entries, encoding, suffix):
         raise NotImplementedError
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 import re
 
 from sekai_translator.parsers.base import BaseParser
@@ -39,13 +39,11 @@ class KirikiriParser(BaseParser):
     # PARSE
     # --------------------------------------------------------
 
-    def parse(self, file_path: str, encoding: str) -> List[TranslationEntry]:
+    def iter_parse(self, file_path: str, encoding: str) -> Iterator[TranslationEntry]:
         lines = Path(file_path).read_text(
             encoding=encoding, errors="ignore"
         ).splitlines()
 
-        entries: List[TranslationEntry] = []
-
         for ln, line in enumerate(lines, start=1):
             stripped = line.strip()
 
@@ -53,7 +51,7 @@ class KirikiriParser(BaseParser):
             # Linha vazia → estrutural
             # ----------------------------
             if not stripped:
-                entries.append(self._raw(line, ln))
+                yield self._raw(line, ln)
                 continue
 
             # ----------------------------
@@ -69,43 +67,37 @@ class KirikiriParser(BaseParser):
                 start = line.find(text)
                 end = start + len(text)
 
-                entries.append(
-                    TranslationEntry(
-                        entry_id=str(ln),
-                        original=text,
-                        translation="",
-                        status=TranslationStatus.UNTRANSLATED,
-                        context={
-                            "speaker": speaker,
-                            "prefix": line[:start],
-                            "suffix": line[end:],
-                            "is_translatable": True,
-                            "line_number": ln,
-                        },
-                    )
-                )
-                continue
-
-            # ----------------------------
-            # Narrativa (texto puro)
-            # ----------------------------
-            entries.append(
-                TranslationEntry(
+                yield TranslationEntry(
                     entry_id=str(ln),
-                    original=line,
+                    original=text,
                     translation="",
                     status=TranslationStatus.UNTRANSLATED,
                     context={
-                        "speaker": None,
-                        "prefix": "",
-                        "suffix": "",
+                        "speaker": speaker,
+                        "prefix": line[:start],
+                        "suffix": line[end:],
                         "is_translatable": True,
                         "line_number": ln,
                     },
                 )
-            )
+                continue
 
-        return entries
+            # ----------------------------
+            # Narrativa (texto puro)
+            # ----------------------------
+            yield TranslationEntry(
+                entry_id=str(ln),
+                original=line,
+                translation="",
+                status=TranslationStatus.UNTRANSLATED,
+                context={
+                    "speaker": None,
+                    "prefix": "",
+                    "suffix": "",
+                    "is_translatable": True,
+                    "line_number": ln,
+                },
+            )
 
     # --------------------------------------------------------
     # REBUILD
@@ -116,6 +108,7 @@ class KirikiriParser(BaseParser):
         out = src.with_name(f"{src.stem}{suffix}{src.suffix}")
 
         output: List[str] = []
+        names = self.speaker_names
 
         for e in entries:
             ctx = e.context
@@ -124,10 +117,15 @@ class KirikiriParser(BaseParser):
                 output.append(ctx["raw_line"])
                 continue
 
+            prefix = ctx.get("prefix", "")
+            speaker = ctx.get("speaker")
+            if speaker and names.get(speaker):
+                prefix = prefix.replace(
+                    f"<{speaker}>", f"<{names[speaker]}>", 1
+                )
+
             text = e.translation or e.original
-            output.append(
-                f"{ctx.get('prefix','')}{text}{ctx.get('suffix','')}"
-            )
+            output.append(f"{prefix}{text}{ctx.get('suffix','')}")
 
         out.write_text("\n".join(output), encoding=encoding)
         return out
@@ -49,6 +49,7 @@ def get_parser(file_path, project):
         parser = parser_cls()
         if parser.can_parse(file_path):
             parser.set_language(language)
+            parser.set_speaker_names(getattr(project, "speaker_names", None))
             return parser
 
     raise RuntimeError(
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from sekai_translator.core import TranslationEntry, TranslationStatus
 from sekai_translator.parsers.base import BaseParser
@@ -17,12 +17,11 @@ class SiglusParser(BaseParser):
     # PARSE
     # --------------------------------------------------
 
-    def parse(self, file_path: str, encoding: str) -> List[TranslationEntry]:
+    def iter_parse(self, file_path: str, encoding: str) -> Iterator[TranslationEntry]:
         lines = Path(file_path).read_text(
             encoding=encoding, errors="ignore"
         ).splitlines()
 
-        entries: List[TranslationEntry] = []
         i = 0
 
         while i < len(lines) - 1:
@@ -31,13 +30,13 @@ class SiglusParser(BaseParser):
 
             # precisa ser par ○ / ●
             if not (line_a.startswith("○") and line_b.startswith("●")):
-                entries.append(self._raw(line_a, i + 1))
+                yield self._raw(line_a, i + 1)
                 i += 1
                 continue
 
             id_end = line_a.find("○", 1)
             if id_end == -1:
-                entries.append(self._raw(line_a, i + 1))
+                yield self._raw(line_a, i + 1)
                 i += 1
                 continue
 
@@ -55,8 +54,8 @@ class SiglusParser(BaseParser):
             # Se NÃO for fala → esconder
             # ---------------------------------
             if not has_quotes:
-                entries.append(self._raw(line_a, i + 1))
-                entries.append(self._raw(line_b, i + 2))
+                yield self._raw(line_a, i + 1)
+                yield self._raw(line_b, i + 2)
                 i += 2
                 continue
 
@@ -66,34 +65,30 @@ class SiglusParser(BaseParser):
             text = raw_text[1:-1]
 
             if not text.strip():
-                entries.append(self._raw(line_a, i + 1))
-                entries.append(self._raw(line_b, i + 2))
+                yield self._raw(line_a, i + 1)
+                yield self._raw(line_b, i + 2)
                 i += 2
                 continue
 
-            entries.append(
-                TranslationEntry(
-                    entry_id=str(i),
-                    original=text,
-                    translation="",
-                    status=TranslationStatus.UNTRANSLATED,
-                    context={
-                        "prefix_a": line_a[: id_end + 1] + prefix_extra,
-                        "prefix_b": line_b[: id_end + 1] + prefix_extra,
-                        "suffix": suffix_extra,
-                        "is_translatable": True,
-                        "line_number": i + 1,
-                    },
-                )
+            yield TranslationEntry(
+                entry_id=str(i),
+                original=text,
+                translation="",
+                status=TranslationStatus.UNTRANSLATED,
+                context={
+                    "prefix_a": line_a[: id_end + 1] + prefix_extra,
+                    "prefix_b": line_b[: id_end + 1] + prefix_extra,
+                    "suffix": suffix_extra,
+                    "is_translatable": True,
+                    "line_number": i + 1,
+                },
             )
 
             i += 2
 
         # sobra de linha
         if i < len(lines):
-            entries.append(self._raw(lines[i], i + 1))
-
-        return entries
+            yield self._raw(lines[i], i + 1)
 
     # --------------------------------------------------
     # REBUILD
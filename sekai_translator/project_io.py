@@ -6,6 +6,8 @@ import re
 from pathlib import Path
 
 from sekai_translator.core import Project
+from sekai_translator.qa_store import load_qa_table, save_qa_table
+from sekai_translator.undo_stack import UndoStack
 
 
 # ============================================================
@@ -118,8 +120,17 @@ def save_project(project: Project):
     # 3️⃣ substitui o arquivo real de forma atômica
     os.replace(tmp_path, path)
 
+    # 4️⃣ tabela de QA (qa_issues.json)
+    save_qa_table(project)
 
-def load_project(project_path: str) -> Project:
+    # 5️⃣ histórico de undo até este estado (undo_history.bin)
+    project.undo_stack.configure(
+        history_path=str(project_dir / UndoStack.HISTORY_NAME)
+    )
+    project.undo_stack.checkpoint()
+
+
+def load_project(project_path: str, restore_qa: bool = True) -> Project:
     with open(project_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
@@ -133,6 +144,15 @@ def load_project(project_path: str) -> Project:
     project.index_entries()
     project.rebuild_all_file_status()
 
+    # Histórico de undo: só lido quando o undo passar da memória
+    project.undo_stack.configure(
+        history_path=str(Path(project_path).parent / UndoStack.HISTORY_NAME)
+    )
+
+    # Marcadores ❌/⚠️ sem reexecutar o QA
+    if restore_qa:
+        load_qa_table(project)
+
     return project
 
 
@@ -168,7 +188,7 @@ def list_projects() -> list[Project]:
             continue
 
         try:
-            project = load_project(str(path))
+            project = load_project(str(path), restore_qa=False)
             projects.append(project)
         except Exception:
             pass
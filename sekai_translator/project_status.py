@@ -15,29 +15,22 @@ def build_project_status(project: Project) -> dict:
     """
     Constrói um dicionário com o status do projeto,
     seguro para uso externo (site, dashboard, etc).
+
+    Lê os contadores de `project.stats` (mantidos a cada
+    transição de status): não percorre as entradas.
     """
+    stats = project.stats
     files_status: dict[str, dict] = {}
 
     total = translated = reviewed = 0
 
-    for path, entries in project.files.items():
-        translatable = [
-            e for e in entries
-            if e.context.get("is_translatable")
-        ]
-
-        if not translatable:
+    for path in project.files:
+        file_total = stats.file_total(path)
+        if not file_total:
             continue
 
-        file_total = len(translatable)
-        file_translated = len([
-            e for e in translatable
-            if e.status == TranslationStatus.TRANSLATED
-        ])
-        file_reviewed = len([
-            e for e in translatable
-            if e.status == TranslationStatus.REVIEWED
-        ])
+        file_translated = stats.count(TranslationStatus.TRANSLATED, path)
+        file_reviewed = stats.count(TranslationStatus.REVIEWED, path)
 
         files_status[Path(path).name] = {
             "total": file_total,
@@ -67,9 +60,7 @@ def build_project_status(project: Project) -> dict:
             "translated": translated,
             "reviewed": reviewed,
             "untranslated": untranslated,
-            "progress": round(
-                (translated / total) * 100, 1
-            ) if total else 0,
+            "progress": stats.progress(),
         },
 
         "files": files_status,
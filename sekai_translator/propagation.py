@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from sekai_translator.core import Project, TranslationEntry, TranslationStatus
+from sekai_translator.translation_memory import COMMITTED, normalize
+from sekai_translator.undo_stack import UndoAction
+
+
+# ============================================================
+# Preenchimento
+# ============================================================
+
+@dataclass
+class Fill:
+    file_path: str
+    entry: TranslationEntry
+    text: str
+
+
+def is_open_slot(entry: TranslationEntry) -> bool:
+    """Linha traduzível que ninguém tocou ainda."""
+    return (
+        bool(entry.context.get("is_translatable"))
+        and entry.status == TranslationStatus.UNTRANSLATED
+        and not (entry.translation or "").strip()
+    )
+
+
+# ============================================================
+# Índice original normalizado → entradas
+# ============================================================
+
+class OriginalIndex:
+    """
+    Todas as entradas traduzíveis do projeto (abertas em aba ou não),
+    agrupadas pelo original normalizado. O original nunca muda depois
+    do import, então o índice só muda quando arquivos entram / saem.
+    """
+
+    def __init__(self):
+        self._by_key: Dict[str, List[Tuple[str, TranslationEntry]]] = {}
+        self._file_keys: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_project(cls, project: Project) -> "OriginalIndex":
+        index = cls()
+        for path, entries in project.files.items():
+            index.add_file(path, entries)
+        return index
+
+    def add_file(self, path: str, entries: List[TranslationEntry]):
+        if path in self._file_keys:
+            self.remove_file(path)
+
+        keys = []
+        by_key = self._by_key
+        for entry in entries:
+            if not entry.context.get("is_translatable"):
+                continue
+            key = normalize(entry.original)
+            if not key:
+                continue
+            by_key.setdefault(key, []).append((path, entry))
+            keys.append(key)
+        self._file_keys[path] = keys
+
+    def remove_file(self, path: str):
+        for key in set(self._file_keys.pop(path, ())):
+            items = [i for i in self._by_key.get(key, ()) if i[0] != path]
+            if items:
+                self._by_key[key] = items
+            else:
+                self._by_key.pop(key, None)
+
+    def identical(self, original: str) -> List[Tuple[str, TranslationEntry]]:
+        return self._by_key.get(normalize(original), [])
+
+
+# ============================================================
+# Quem preencher
+# ============================================================
+
+def propagation_fills(
+    index: OriginalIndex,
+    sources: Iterable[Tuple[str, TranslationEntry]],
+) -> List[Fill]:
+    """
+    Para cada tradução confirmada em `sources`, as outras entradas
+    com o mesmo original que ainda estão em branco.
+    """
+    fills: List[Fill] = []
+    seen = set()
+
+    for _, source in sources:
+        if source.status not in COMMITTED or not source.translation:
+            continue
+
+        for path, target in index.identical(source.original):
+            if target is source or id(target) in seen:
+                continue
+            if not is_open_slot(target):
+                continue
+            seen.add(id(target))
+            fills.append(Fill(path, target, source.translation))
+
+    return fills
+
+
+def memory_fills(project: Project, memories: Iterable) -> List[Fill]:
+    """Pré-tradução: linhas em branco com correspondência exata na memória."""
+    memories = list(memories)
+    fills: List[Fill] = []
+
+    for path, entries in project.files.items():
+        for entry in entries:
+            if not is_open_slot(entry):
+                continue
+            for memory in memories:
+                match = memory.exact(entry.original)
+                if match is not None:
+                    fills.append(Fill(path, entry, match.target))
+                    break
+
+    return fills
+
+
+# ============================================================
+# Aplicação
+# ============================================================
+
+def apply_fills(
+    fills: Iterable[Fill],
+    on_fill: Callable[[TranslationEntry, str], None],
+) -> List[UndoAction]:
+    """
+    Aplica os preenchimentos (status decidido por `on_fill`, um
+    método do StatusService) e devolve as ações de undo.
+    """
+    actions: List[UndoAction] = []
+
+    for fill in fills:
+        entry = fill.entry
+        old_text = entry.translation
+        old_status = entry.status
+
+        on_fill(entry, fill.text)
+
+        actions.append(
+            UndoAction(
+                entry_id=entry.entry_id,
+                field="translation",
+                old_value=old_text,
+                new_value=entry.translation,
+                file_path=fill.file_path,
+            )
+        )
+        actions.append(
+            UndoAction(
+                entry_id=entry.entry_id,
+                field="status",
+                old_value=old_status,
+                new_value=entry.status,
+                file_path=fill.file_path,
+            )
+        )
+
+    return actions
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+# ============================================================
+# Padrões por engine
+# ============================================================
+
+# Marcadores de quebra de linha explícita dentro do texto
+ENGINE_LINE_BREAKS: Dict[str, Tuple[str, ...]] = {
+    "artemis": ("\\n",),
+    "kirikiri": ("[r]", "\\n"),
+    "siglus": ("\\n",),
+}
+
+BMP_SIZE = 0x10000
+
+
+# ============================================================
+# Métricas de fonte
+# ============================================================
+
+class FontMetrics:
+    """
+    Largura de avanço por caractere, em unidades da fonte.
+
+    Os avanços do BMP ficam num array compacto (uint16, 128 KB)
+    indexado pelo code point; o resto cai no avanço padrão.
+    """
+
+    def __init__(self, advances: array, units_per_em: int, default: int):
+        self.advances = advances
+        self.units_per_em = units_per_em
+        self.default = default
+
+    # --------------------------------------------------
+
+    def width(self, text: str) -> int:
+        """Largura total em unidades da fonte."""
+        if not text:
+            return 0
+
+        adv = self.advances
+        if len(text) > 32:
+            # Texto longo repete poucos caracteres distintos:
+            # contar (em C) e multiplicar sai bem mais barato
+            chars = Counter(text).items()
+        else:
+            chars = ((c, 1) for c in text)
+
+        total = 0
+        default = self.default
+        for char, count in chars:
+            code = ord(char)
+            total += (adv[code] if code < BMP_SIZE else default) * count
+        return total
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def approximate(units_per_em: int = 1000) -> "FontMetrics":
+        """
+        Tabela sem arquivo de fonte: meia largura para texto latino,
+        largura cheia para CJK / formas full-width.
+        """
+        half = units_per_em // 2
+        full = units_per_em
+
+        advances = array("H", [half]) * BMP_SIZE
+        for start, end in (
+            (0x1100, 0x115F),   # Hangul Jamo
+            (0x2E80, 0xA4CF),   # CJK, kana, símbolos
+            (0xAC00, 0xD7A3),   # Hangul
+            (0xF900, 0xFAFF),   # CJK compat
+            (0xFE30, 0xFE4F),
+            (0xFF00, 0xFF60),   # full-width ASCII
+            (0xFFE0, 0xFFE6),
+        ):
+            advances[start:end + 1] = array("H", [full]) * (end - start + 1)
+
+        # Caracteres de controle / combinantes não ocupam espaço
+        for c in range(0x20):
+            advances[c] = 0
+        for c in range(0x300, 0x370):
+            advances[c] = 0
+
+        return FontMetrics(advances, units_per_em, full)
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def from_font_file(path: str) -> "FontMetrics":
+        return _load_font_metrics(str(Path(path)))
+
+
+@lru_cache(maxsize=8)
+def _load_font_metrics(path: str) -> FontMetrics:
+    data = Path(path).read_bytes()
+    tables = _ttf_tables(data)
+
+    for required in (b"head", b"hhea", b"hmtx", b"cmap"):
+        if required not in tables:
+            raise ValueError(
+                f"Fonte sem tabela {required.decode()}: {path}"
+            )
+
+    head = tables[b"head"]
+    units_per_em = struct.unpack_from(">H", data, head + 18)[0]
+
+    hhea = tables[b"hhea"]
+    num_hmetrics = struct.unpack_from(">H", data, hhea + 34)[0]
+
+    hmtx = tables[b"hmtx"]
+    glyph_advances = [
+        struct.unpack_from(">H", data, hmtx + 4 * i)[0]
+        for i in range(num_hmetrics)
+    ]
+
+    default = glyph_advances[0] if glyph_advances else units_per_em // 2
+    last = num_hmetrics - 1
+
+    advances = array("H", [default]) * BMP_SIZE
+    for code, glyph in _ttf_cmap(data, tables[b"cmap"]):
+        if code < BMP_SIZE:
+            advances[code] = glyph_advances[min(glyph, last)]
+
+    return FontMetrics(advances, units_per_em, default)
+
+
+def _ttf_tables(data: bytes) -> Dict[bytes, int]:
+    offset = 0
+    if data[:4] == b"ttcf":
+        # Coleção: usa a primeira fonte
+        offset = struct.unpack_from(">I", data, 12)[0]
+
+    num_tables = struct.unpack_from(">H", data, offset + 4)[0]
+
+    tables: Dict[bytes, int] = {}
+    for i in range(num_tables):
+        rec = offset + 12 + 16 * i
+        tag = data[rec:rec + 4]
+        tables[tag] = struct.unpack_from(">I", data, rec + 8)[0]
+    return tables
+
+
+def _ttf_cmap(data: bytes, cmap: int):
+    """Gera (code point, glyph id) da melhor subtabela Unicode."""
+    num = struct.unpack_from(">H", data, cmap + 2)[0]
+
+    subtables = {}
+    for i in range(num):
+        platform, encoding, off = struct.unpack_from(
+            ">HHI", data, cmap + 4 + 8 * i
+        )
+        fmt = struct.unpack_from(">H", data, cmap + off)[0]
+        subtables[(platform, encoding, fmt)] = cmap + off
+
+    for key in ((3, 10, 12), (0, 4, 12), (0, 6, 12)):
+        if key in subtables:
+            yield from _cmap_format12(data, subtables[key])
+            return
+
+    for key in ((3, 1, 4), (0, 3, 4), (0, 4, 4), (0, 1, 4), (0, 0, 4)):
+        if key in subtables:
+            yield from _cmap_format4(data, subtables[key])
+            return
+
+    raise ValueError("Fonte sem cmap Unicode suportado (formato 4 ou 12)")
+
+
+def _cmap_format4(data: bytes, base: int):
+    seg_count = struct.unpack_from(">H", data, base + 6)[0] // 2
+
+    ends = base + 14
+    starts = ends + 2 * seg_count + 2
+    deltas = starts + 2 * seg_count
+    range_offsets = deltas + 2 * seg_count
+
+    for s in range(seg_count):
+        end = struct.unpack_from(">H", data, ends + 2 * s)[0]
+        start = struct.unpack_from(">H", data, starts + 2 * s)[0]
+        delta = struct.unpack_from(">h", data, deltas + 2 * s)[0]
+        ro_pos = range_offsets + 2 * s
+        range_offset = struct.unpack_from(">H", data, ro_pos)[0]
+
+        if start == 0xFFFF:
+            continue
+
+        for code in range(start, end + 1):
+            if range_offset == 0:
+                glyph = (code + delta) & 0xFFFF
+            else:
+                pos = ro_pos + range_offset + 2 * (code - start)
+                glyph = struct.unpack_from(">H", data, pos)[0]
+                if glyph:
+                    glyph = (glyph + delta) & 0xFFFF
+            if glyph:
+                yield code, glyph
+
+
+def _cmap_format12(data: bytes, base: int):
+    groups = struct.unpack_from(">I", data, base + 12)[0]
+    for g in range(groups):
+        start, end, glyph = struct.unpack_from(">III", data, base + 16 + 12 * g)
+        for code in range(start, min(end, BMP_SIZE - 1) + 1):
+            yield code, glyph + (code - start)
+
+
+@lru_cache(maxsize=1)
+def _approximate_metrics() -> FontMetrics:
+    return FontMetrics.approximate()
+
+
+# ============================================================
+# Caixa de texto
+# ============================================================
+
+@dataclass
+class TextBoxLayout:
+    """
+    Caixa de texto do jogo: largura útil em pixels e número de linhas.
+    Lida de `QAConfig.options["layout"]`.
+    """
+
+    box_width: float
+    max_lines: int = 3
+    font_size: float = 24.0
+    font_path: str | None = None
+    wrap: str = "word"          # "word" | "char"
+    line_breaks: Tuple[str, ...] = ("\\n",)
+    metrics: FontMetrics = field(default=None, repr=False)  # type: ignore[assignment]
+
+    def __post_init__(self):
+        if self.metrics is None:
+            self.metrics = _approximate_metrics()
+            if self.font_path:
+                try:
+                    self.metrics = FontMetrics.from_font_file(self.font_path)
+                except (OSError, ValueError, struct.error):
+                    # Fonte ilegível: segue com a tabela aproximada
+                    pass
+        self._scale = self.font_size / self.metrics.units_per_em
+        # Limite em unidades da fonte (evita multiplicar a cada medida)
+        self._limit = self.box_width / self._scale
+        self._space = self.metrics.width(" ")
+        # Palavras se repetem muito: largura medida uma vez só
+        self._word_widths: Dict[str, int] = {}
+
+    @staticmethod
+    def from_options(engine: str, options: dict) -> "TextBoxLayout | None":
+        data = options.get("layout") or {}
+        if not data.get("box_width"):
+            return None
+
+        return TextBoxLayout(
+            box_width=float(data["box_width"]),
+            max_lines=int(data.get("max_lines", 3)),
+            font_size=float(data.get("font_size", 24)),
+            font_path=data.get("font_path") or None,
+            wrap=data.get("wrap", "word"),
+            line_breaks=tuple(
+                data.get("line_breaks")
+                or ENGINE_LINE_BREAKS.get(engine, ("\\n",))
+            ),
+        )
+
+    # --------------------------------------------------
+
+    def text_width(self, text: str) -> float:
+        """Largura renderizada em pixels (sem quebra)."""
+        return self.metrics.width(text) * self._scale
+
+    def normalize_breaks(self, text: str) -> str:
+        """Troca os marcadores de quebra da engine por '\\n'."""
+        for token in self.line_breaks:
+            if token in text:
+                text = text.replace(token, "\n")
+        return text
+
+    def count_lines(self, text: str) -> int:
+        """
+        Quantas linhas o texto ocupa na caixa, com quebra automática.
+        Espera o texto já com `normalize_breaks` aplicado.
+        """
+        width = self.metrics.width
+        limit = self._limit
+        total = 0
+
+        for paragraph in text.split("\n"):
+            w = width(paragraph)
+
+            # Caminho rápido: cabe inteiro numa linha
+            if w <= limit:
+                total += 1
+                continue
+
+            if self.wrap == "char" or " " not in paragraph:
+                total += self._wrap_chars(paragraph)
+            else:
+                total += self._wrap_words(paragraph)
+
+        return total
+
+    def overflows(self, text: str) -> bool:
+        # Se mesmo tudo numa linha só cabe, nem simula a quebra
+        if self.metrics.width(text) <= self._limit:
+            return False
+        return self.count_lines(text) > self.max_lines
+
+    # --------------------------------------------------
+
+    WORD_CACHE_LIMIT = 200000
+
+    def _word_width(self, word: str) -> int:
+        cache = self._word_widths
+        w = cache.get(word)
+        if w is None:
+            if len(cache) >= self.WORD_CACHE_LIMIT:
+                cache.clear()
+            w = cache[word] = self.metrics.width(word)
+        return w
+
+    def _wrap_words(self, paragraph: str) -> int:
+        width = self._word_width
+        limit = self._limit
+        space = self._space
+
+        lines = 1
+        current = 0
+        for word in paragraph.split(" "):
+            w = width(word)
+
+            if current and current + space + w > limit:
+                lines += 1
+                current = 0
+
+            if w > limit:
+                # Palavra maior que a caixa: quebra por caractere
+                extra = self._wrap_chars(word)
+                lines += extra - 1
+                current = w % limit if limit else 0
+                continue
+
+            current = current + space + w if current else w
+
+        return lines
+
+    def _wrap_chars(self, paragraph: str) -> int:
+        adv = self.metrics.advances
+        default = self.metrics.default
+        limit = self._limit
+
+        lines = 1
+        current = 0
+        for c in map(ord, paragraph):
+            w = adv[c] if c < BMP_SIZE else default
+            if current + w > limit and current:
+                lines += 1
+                current = 0
+            current += w
+        return lines
+
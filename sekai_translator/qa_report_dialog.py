@@ -0,0 +1,92 @@
+from pathlib import Path
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QLabel,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QHeaderView,
+)
+
+from sekai_translator.qa_scan import QAReport
+
+
+class QAReportDialog(QDialog):
+    """
+    Lista agregada de problemas de QA do projeto.
+    Duplo clique abre o arquivo na linha correspondente.
+    """
+
+    entry_activated = Signal(str, object)  # file_path, TranslationEntry
+
+    def __init__(self, report: QAReport, root_path: str, parent=None):
+        super().__init__(parent)
+
+        self.setWindowTitle("QA do Projeto")
+        self.resize(900, 520)
+        self.setModal(False)
+
+        layout = QVBoxLayout(self)
+
+        self.summary = QLabel()
+        layout.addWidget(self.summary)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Nível", "Arquivo", "Linha", "Mensagem"])
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setSortingEnabled(True)
+
+        header = self.tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
+
+        layout.addWidget(self.tree)
+
+        self.tree.itemDoubleClicked.connect(self._on_item_activated)
+
+        self.set_report(report, root_path)
+
+    # --------------------------------------------------
+
+    def set_report(self, report: QAReport, root_path: str):
+        self.tree.clear()
+        self.tree.setSortingEnabled(False)
+
+        root = Path(root_path)
+        items = []
+
+        for r in report.items:
+            try:
+                name = str(Path(r.file_path).relative_to(root))
+            except ValueError:
+                name = Path(r.file_path).name
+
+            icon = "❌" if r.issue.level == "error" else "⚠️"
+            line = r.entry.context.get("line_number", "")
+
+            item = QTreeWidgetItem([icon, name, "", r.issue.message])
+            item.setData(2, Qt.DisplayRole, line)
+            item.setData(0, Qt.UserRole, (r.file_path, r.entry))
+            items.append(item)
+
+        self.tree.addTopLevelItems(items)
+        self.tree.setSortingEnabled(True)
+
+        self.summary.setText(
+            f"{report.errors} erro(s), {report.warnings} aviso(s) "
+            f"em {report.checked} linha(s) verificadas "
+            f"({report.evaluated} reavaliadas)."
+        )
+
+    # --------------------------------------------------
+
+    def _on_item_activated(self, item: QTreeWidgetItem, _column: int):
+        data = item.data(0, Qt.UserRole)
+        if data:
+            path, entry = data
+            self.entry_activated.emit(path, entry)
@@ -0,0 +1,502 @@
+from __future__ import annotations
+
+import re
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from sekai_translator.core import TranslationEntry, TranslationStatus
+from sekai_translator.glossary import glossary_matcher, project_terms
+from sekai_translator.qa_layout import TextBoxLayout
+
+
+# ============================================================
+# QA Issue
+# ============================================================
+
+@dataclass
+class QAIssue:
+    level: str      # "warning" | "error"
+    code: str       # identificador curto
+    message: str    # mensagem amigável
+
+
+# ============================================================
+# Sintaxe de tags por engine
+# ============================================================
+
+# Sem grupos de captura: findall devolve as tags direto
+# (padrões do usuário com grupos são tratados em QAEngine)
+DEFAULT_TAG_PATTERN = r"\{[^}]+\}|\[[^\]]+\]|<[^>]+>"
+
+ENGINE_TAG_PATTERNS: Dict[str, str] = {
+    # {var}, [ruby=...], <color=red>
+    "artemis": DEFAULT_TAG_PATTERN,
+    # tags KAG inline ([r], [ruby text=...]) e entidades &var;
+    "kirikiri": r"\[[^\]]+\]|&[^;\s]+;|<[^>]+>",
+    # variáveis {..}, códigos de nome 【..】 e controle <..>
+    "siglus": r"\{[^}]+\}|【[^】]+】|<[^>]+>",
+}
+
+
+@lru_cache(maxsize=8)
+def _glossary_digest(glossary: Tuple[Tuple[str, str], ...]) -> int:
+    """CRC do glossário, estável entre processos (hash() de str não é)."""
+    crc = 0
+    for source, target in glossary:
+        crc = zlib.crc32(f"{source}\x00{target}\n".encode("utf-8"), crc)
+    return crc
+
+
+# ============================================================
+# Configuração por projeto
+# ============================================================
+
+@dataclass(frozen=True)
+class QAConfig:
+    """
+    Regras ativas e parâmetros de QA de um projeto.
+    Serializada em `Project.qa_config`.
+    """
+
+    engine: str = "artemis"
+    disabled: FrozenSet[str] = frozenset()
+    options: Dict[str, Any] = field(default_factory=dict)
+    tag_pattern: Optional[str] = None
+    # (termo, tradução aprovada) — vem de `Project.glossary`
+    glossary: Tuple[Tuple[str, str], ...] = ()
+
+    @staticmethod
+    def from_project(project) -> "QAConfig":
+        data = getattr(project, "qa_config", None) or {}
+        return QAConfig(
+            engine=(getattr(project, "engine", "") or "artemis").lower(),
+            disabled=frozenset(data.get("disabled", ())),
+            options=dict(data.get("options", {})),
+            tag_pattern=data.get("tag_pattern") or None,
+            glossary=project_terms(project),
+        )
+
+    def to_dict(self) -> dict:
+        data: dict = {
+            "disabled": sorted(self.disabled),
+            "options": dict(self.options),
+        }
+        if self.tag_pattern:
+            data["tag_pattern"] = self.tag_pattern
+        return data
+
+    def option(self, name: str, default: Any) -> Any:
+        return self.options.get(name, default)
+
+    def signature(self) -> tuple:
+        return (
+            self.engine,
+            tuple(sorted(self.disabled)),
+            tuple(sorted((k, repr(v)) for k, v in self.options.items())),
+            self.tag_pattern,
+            _glossary_digest(self.glossary),
+        )
+
+    def resolved_tag_pattern(self) -> str:
+        return self.tag_pattern or ENGINE_TAG_PATTERNS.get(
+            self.engine, DEFAULT_TAG_PATTERN
+        )
+
+
+# ============================================================
+# Contexto de avaliação (1 por entrada)
+# ============================================================
+
+class QAContext:
+    """
+    Dados derivados de uma entrada, calculados uma única vez
+    e compartilhados entre todas as regras.
+    """
+
+    __slots__ = (
+        "entry",
+        "status",
+        "original",
+        "translation",
+        "prefix",
+        "suffix",
+        "rebuilt",
+        "_engine",
+        "_original_core",
+        "_original_tags",
+        "_rebuilt_tags",
+    )
+
+    def __init__(self, entry: TranslationEntry, engine: "QAEngine"):
+        ctx = entry.context
+
+        self.entry = entry
+        self.status = entry.status
+        self.original = entry.original or ""
+        self.translation = entry.translation or ""
+        self.prefix = ctx.get("prefix", "") or ""
+        self.suffix = ctx.get("suffix", "") or ""
+        self.rebuilt = f"{self.prefix}{self.translation}{self.suffix}"
+
+        self._engine = engine
+        self._original_core = None
+        self._original_tags = None
+        self._rebuilt_tags = None
+
+    @property
+    def original_core(self) -> str:
+        if self._original_core is None:
+            original, prefix, suffix = self.original, self.prefix, self.suffix
+            core = original
+            if original.startswith(prefix) and original.endswith(suffix):
+                core = original[len(prefix):len(original) - len(suffix)]
+            self._original_core = core
+        return self._original_core
+
+    @property
+    def original_tags(self) -> FrozenSet[str]:
+        if self._original_tags is None:
+            self._original_tags = self._engine.tags(self.original)
+        return self._original_tags
+
+    @property
+    def rebuilt_tags(self) -> FrozenSet[str]:
+        if self._rebuilt_tags is None:
+            self._rebuilt_tags = self._engine.tags(self.rebuilt)
+        return self._rebuilt_tags
+
+
+# ============================================================
+# Regras
+# ============================================================
+
+# Necessidades que uma regra pode declarar
+NEEDS_STATUS = "status"   # só faz sentido se a linha não está UNTRANSLATED
+NEEDS_TAGS = "tags"       # usa tags extraídas do original / reconstruído
+NEEDS_LENGTHS = "lengths" # compara tamanhos de texto
+NEEDS_LAYOUT = "layout"   # mede o texto renderizado (métricas de fonte)
+
+RULES: Dict[str, type] = {}
+
+
+def register_rule(cls):
+    if any(r.bit == cls.bit for r in RULES.values()):
+        raise ValueError(f"Bit de QA duplicado: {cls.code}")
+    RULES[cls.code] = cls
+    return cls
+
+
+class QARule:
+    code = ""
+    bit = -1          # posição fixa no bitset persistido (qa_store)
+    message = ""      # mensagem padrão / usada ao restaurar do disco
+    level = "warning"
+    title = ""
+    needs: FrozenSet[str] = frozenset()
+    defaults: Dict[str, Any] = {}
+
+    def __init__(self, config: QAConfig):
+        self.config = config
+
+    @classmethod
+    def applies(cls, config: QAConfig) -> bool:
+        """Se a regra faz sentido para esta configuração."""
+        return True
+
+    def option(self, name: str) -> Any:
+        return self.config.option(name, self.defaults[name])
+
+    def issue(self, message: str | None = None) -> QAIssue:
+        return QAIssue(
+            level=self.level,
+            code=self.code,
+            message=message or self.message,
+        )
+
+    def check(self, ctx: QAContext) -> Optional[QAIssue]:
+        raise NotImplementedError
+
+
+@register_rule
+class EmptyTranslationRule(QARule):
+    code = "EMPTY_TRANSLATION"
+    bit = 0
+    message = "Tradução vazia."
+    level = "warning"
+    title = "Tradução vazia"
+    needs = frozenset({NEEDS_STATUS})
+
+    def check(self, ctx):
+        if ctx.original.strip() and not ctx.translation.strip():
+            return self.issue()
+        return None
+
+
+@register_rule
+class IdenticalTextRule(QARule):
+    code = "IDENTICAL_TEXT"
+    bit = 1
+    message = "Tradução idêntica ao original."
+    level = "warning"
+    title = "Tradução idêntica ao original"
+    needs = frozenset({NEEDS_STATUS})
+
+    def check(self, ctx):
+        t = ctx.translation.strip()
+        if t and t == ctx.original_core.strip():
+            return self.issue()
+        return None
+
+
+@register_rule
+class MissingTagRule(QARule):
+    code = "MISSING_TAG"
+    bit = 2
+    message = "Tags ausentes na tradução."
+    level = "error"
+    title = "Tags obrigatórias ausentes"
+    needs = frozenset({NEEDS_TAGS})
+
+    def check(self, ctx):
+        original_tags = ctx.original_tags
+        if not original_tags:
+            return None
+
+        missing = original_tags - ctx.rebuilt_tags
+        if missing:
+            return self.issue(
+                f"Tags ausentes na tradução: {', '.join(sorted(missing))}"
+            )
+        return None
+
+
+@register_rule
+class PrefixMismatchRule(QARule):
+    code = "PREFIX_MISMATCH"
+    bit = 3
+    message = "Prefixo original não preservado."
+    level = "error"
+    title = "Prefixo original não preservado"
+
+    def check(self, ctx):
+        if ctx.prefix and not ctx.rebuilt.startswith(ctx.prefix):
+            return self.issue()
+        return None
+
+
+@register_rule
+class SuffixMismatchRule(QARule):
+    code = "SUFFIX_MISMATCH"
+    bit = 4
+    message = "Sufixo original não preservado."
+    level = "error"
+    title = "Sufixo original não preservado"
+
+    def check(self, ctx):
+        if ctx.suffix and not ctx.rebuilt.endswith(ctx.suffix):
+            return self.issue()
+        return None
+
+
+@register_rule
+class TextTooLongRule(QARule):
+    code = "TEXT_TOO_LONG"
+    bit = 5
+    message = "Tradução muito mais longa que o original."
+    level = "warning"
+    title = "Texto excessivamente longo"
+    needs = frozenset({NEEDS_STATUS, NEEDS_LENGTHS})
+    defaults = {"LENGTH_RATIO_LIMIT": 1.8}
+
+    @classmethod
+    def applies(cls, config):
+        # Com a caixa de texto configurada, TEXT_OVERFLOW é quem mede
+        return not (config.options.get("layout") or {}).get("box_width")
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.limit = float(self.option("LENGTH_RATIO_LIMIT"))
+
+    def check(self, ctx):
+        if (
+            ctx.original.strip()
+            and ctx.translation.strip()
+            and len(ctx.translation) > len(ctx.original) * self.limit
+        ):
+            return self.issue()
+        return None
+
+
+@register_rule
+class TextOverflowRule(QARule):
+    """
+    Mede a largura renderizada da tradução (métricas da fonte)
+    e simula a quebra de linha na caixa de texto da engine.
+    Configurada em `options["layout"]`:
+    box_width, max_lines, font_size, font_path, wrap, line_breaks.
+    """
+
+    code = "TEXT_OVERFLOW"
+    bit = 6
+    message = "Texto estoura a caixa de texto."
+    level = "warning"
+    title = "Texto estoura a caixa de texto"
+    needs = frozenset({NEEDS_STATUS, NEEDS_LAYOUT})
+
+    @classmethod
+    def applies(cls, config):
+        return bool((config.options.get("layout") or {}).get("box_width"))
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.layout = TextBoxLayout.from_options(config.engine, config.options)
+        self._strip_tags = re.compile(config.resolved_tag_pattern()).sub
+
+    def check(self, ctx):
+        if not ctx.translation.strip():
+            return None
+
+        layout = self.layout
+        # Quebras primeiro: marcadores como [r] também casam como tag
+        text = self._strip_tags("", layout.normalize_breaks(ctx.translation))
+
+        if not layout.overflows(text):
+            return None
+
+        lines = layout.count_lines(text)
+        return self.issue(
+            f"Texto ocupa {lines} linhas na caixa "
+            f"(máximo {layout.max_lines})."
+        )
+
+
+@register_rule
+class GlossaryTermRule(QARule):
+    """
+    Termo do glossário presente no original sem a tradução
+    aprovada na tradução. Todos os termos são buscados numa
+    passada só (Aho-Corasick), não termo a termo.
+    """
+
+    code = "GLOSSARY_TERM"
+    bit = 7
+    message = "Termo do glossário sem a tradução aprovada."
+    level = "warning"
+    title = "Termo do glossário não respeitado"
+    needs = frozenset({NEEDS_STATUS})
+
+    @classmethod
+    def applies(cls, config):
+        return bool(config.glossary)
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.matcher = glossary_matcher(config.glossary)
+
+    def check(self, ctx):
+        if not ctx.translation.strip():
+            return None
+
+        missing = self.matcher.missing(ctx.original, ctx.translation)
+        if not missing:
+            return None
+
+        return self.issue(
+            "Termos do glossário ausentes: "
+            + ", ".join(f"{t.source} → {t.target}" for t in missing)
+        )
+
+
+# ============================================================
+# Engine (regras pré-compiladas para uma configuração)
+# ============================================================
+
+class QAEngine:
+    """
+    Conjunto de regras já instanciado para uma configuração.
+    Construir uma vez e reutilizar: `run_batch` é o caminho rápido.
+    """
+
+    # Versão da lógica das regras (incrementar ao mudar qualquer regra)
+    RULES_VERSION = 4
+
+    # Limite do cache de tags por string durante um lote
+    TAG_CACHE_LIMIT = 50000
+
+    def __init__(self, config: QAConfig | None = None):
+        self.config = config or QAConfig()
+        self.version = (self.RULES_VERSION, self.config.signature())
+
+        pattern = re.compile(self.config.resolved_tag_pattern())
+        if pattern.groups:
+            # Com grupos, findall devolveria tuplas: usa o match inteiro
+            self._tag_findall = lambda text: [
+                m.group(0) for m in pattern.finditer(text)
+            ]
+        else:
+            self._tag_findall = pattern.findall
+        self._tag_cache: Dict[str, FrozenSet[str]] = {}
+
+        rules = [
+            cls(self.config)
+            for code, cls in RULES.items()
+            if code not in self.config.disabled and cls.applies(self.config)
+        ]
+
+        self.rules = rules
+        self._checks = [r.check for r in rules]
+
+        # Linhas UNTRANSLATED só passam pelas regras que não dependem de status
+        self._always_checks = [
+            r.check for r in rules if NEEDS_STATUS not in r.needs
+        ]
+
+    # --------------------------------------------------
+
+    def tags(self, text: str) -> FrozenSet[str]:
+        cache = self._tag_cache
+        tags = cache.get(text)
+        if tags is None:
+            tags = frozenset(self._tag_findall(text)) if text else frozenset()
+            if len(cache) >= self.TAG_CACHE_LIMIT:
+                cache.clear()
+            cache[text] = tags
+        return tags
+
+    # --------------------------------------------------
+
+    def run(self, entry: TranslationEntry) -> List[QAIssue]:
+        return self.run_batch([entry])[0]
+
+    def run_batch(
+        self,
+        entries: List[TranslationEntry],
+    ) -> List[List[QAIssue]]:
+        untranslated = TranslationStatus.UNTRANSLATED
+        all_checks = self._checks
+        always_checks = self._always_checks
+        results: List[List[QAIssue]] = []
+        append = results.append
+
+        for entry in entries:
+            # Ignora linhas estruturais
+            if entry.context.get("is_empty"):
+                append([])
+                continue
+
+            ctx = QAContext(entry, self)
+            checks = (
+                always_checks if entry.status == untranslated else all_checks
+            )
+
+            issues = []
+            for check in checks:
+                issue = check(ctx)
+                if issue is not None:
+                    issues.append(issue)
+
+            append(issues)
+
+        return results
@@ -0,0 +1,158 @@
+import re
+
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QCheckBox,
+    QDoubleSpinBox,
+    QLineEdit,
+    QPushButton,
+    QMessageBox,
+    QSpinBox,
+    QFormLayout,
+    QGroupBox,
+    QFileDialog,
+)
+
+from sekai_translator.qa_rules import RULES, QAConfig
+
+
+class QARulesDialog(QDialog):
+    """
+    Ativa / desativa regras de QA e ajusta seus parâmetros
+    para o projeto atual.
+    """
+
+    def __init__(self, project, parent=None):
+        super().__init__(parent)
+
+        self.setWindowTitle("Regras de QA")
+        self.resize(460, 560)
+
+        current = QAConfig.from_project(project)
+        self.config = current
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"<b>Engine:</b> {current.engine}"))
+
+        # ---------------- Regras ----------------
+
+        self._checks: dict[str, QCheckBox] = {}
+        for code, rule in RULES.items():
+            box = QCheckBox(f"{rule.title} ({code})")
+            box.setChecked(code not in current.disabled)
+            layout.addWidget(box)
+            self._checks[code] = box
+
+        # ---------------- Parâmetros ----------------
+
+        layout.addWidget(QLabel("Limite de proporção de tamanho"))
+        self.ratio_spin = QDoubleSpinBox()
+        self.ratio_spin.setRange(1.0, 10.0)
+        self.ratio_spin.setSingleStep(0.1)
+        self.ratio_spin.setValue(
+            float(current.option(
+                "LENGTH_RATIO_LIMIT",
+                RULES["TEXT_TOO_LONG"].defaults["LENGTH_RATIO_LIMIT"],
+            ))
+        )
+        layout.addWidget(self.ratio_spin)
+
+        layout.addWidget(QLabel("Regex de tags (vazio = padrão da engine)"))
+        self.tag_edit = QLineEdit(current.tag_pattern or "")
+        self.tag_edit.setPlaceholderText(current.resolved_tag_pattern())
+        layout.addWidget(self.tag_edit)
+
+        # ---------------- Caixa de texto ----------------
+
+        layout_opts = current.options.get("layout") or {}
+
+        box = QGroupBox("Caixa de texto (TEXT_OVERFLOW)")
+        form = QFormLayout(box)
+
+        self.box_width_spin = QSpinBox()
+        self.box_width_spin.setRange(0, 10000)
+        self.box_width_spin.setSuffix(" px")
+        self.box_width_spin.setSpecialValueText("desativado")
+        self.box_width_spin.setValue(int(layout_opts.get("box_width", 0)))
+        form.addRow("Largura", self.box_width_spin)
+
+        self.max_lines_spin = QSpinBox()
+        self.max_lines_spin.setRange(1, 20)
+        self.max_lines_spin.setValue(int(layout_opts.get("max_lines", 3)))
+        form.addRow("Linhas", self.max_lines_spin)
+
+        self.font_size_spin = QSpinBox()
+        self.font_size_spin.setRange(4, 200)
+        self.font_size_spin.setSuffix(" px")
+        self.font_size_spin.setValue(int(layout_opts.get("font_size", 24)))
+        form.addRow("Tamanho da fonte", self.font_size_spin)
+
+        font_row = QHBoxLayout()
+        self.font_path_edit = QLineEdit(layout_opts.get("font_path", ""))
+        self.font_path_edit.setPlaceholderText("aproximada (sem arquivo)")
+        font_btn = QPushButton("...")
+        font_btn.clicked.connect(self._browse_font)
+        font_row.addWidget(self.font_path_edit)
+        font_row.addWidget(font_btn)
+        form.addRow("Fonte", font_row)
+
+        layout.addWidget(box)
+
+        # ---------------- Botões ----------------
+
+        btns = QHBoxLayout()
+        ok_btn = QPushButton("Salvar")
+        cancel_btn = QPushButton("Cancelar")
+        ok_btn.clicked.connect(self._accept)
+        cancel_btn.clicked.connect(self.reject)
+        btns.addStretch()
+        btns.addWidget(ok_btn)
+        btns.addWidget(cancel_btn)
+        layout.addLayout(btns)
+
+    # --------------------------------------------------
+
+    def _browse_font(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Selecione a fonte do jogo", "", "Fontes (*.ttf *.otf *.ttc)"
+        )
+        if path:
+            self.font_path_edit.setText(path)
+
+    def _accept(self):
+        pattern = self.tag_edit.text().strip() or None
+        if pattern:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                QMessageBox.warning(self, "Regex inválida", str(e))
+                return
+
+        options = dict(self.config.options)
+        options["LENGTH_RATIO_LIMIT"] = round(self.ratio_spin.value(), 2)
+
+        if self.box_width_spin.value():
+            layout_opts = dict(options.get("layout") or {})
+            layout_opts.update({
+                "box_width": self.box_width_spin.value(),
+                "max_lines": self.max_lines_spin.value(),
+                "font_size": self.font_size_spin.value(),
+                "font_path": self.font_path_edit.text().strip(),
+            })
+            options["layout"] = layout_opts
+        else:
+            options.pop("layout", None)
+
+        self.config = QAConfig(
+            engine=self.config.engine,
+            disabled=frozenset(
+                code for code, box in self._checks.items()
+                if not box.isChecked()
+            ),
+            options=options,
+            tag_pattern=pattern,
+        )
+        self.accept()
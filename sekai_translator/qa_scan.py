@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from sekai_translator.core import Project, TranslationEntry
+from sekai_translator.qa_rules import QAConfig, QAEngine, QAIssue
+from sekai_translator.qa_service import QAService
+
+
+# ============================================================
+# Relatório agregado
+# ============================================================
+
+@dataclass
+class QAReportItem:
+    file_path: str
+    entry: TranslationEntry
+    issue: QAIssue
+
+
+@dataclass
+class QAReport:
+    items: List[QAReportItem] = field(default_factory=list)
+    checked: int = 0      # entradas avaliadas no total
+    evaluated: int = 0    # entradas que realmente rodaram o QA (cache miss)
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for i in self.items if i.issue.level == "error")
+
+    @property
+    def warnings(self) -> int:
+        return len(self.items) - self.errors
+
+
+# ============================================================
+# Worker (roda em outro processo)
+# ============================================================
+
+_worker_engines: Dict[tuple, QAEngine] = {}
+
+
+def _evaluate_chunk(
+    config: QAConfig,
+    keys: List[tuple],
+) -> List[Tuple[QAIssue, ...]]:
+    """
+    Avalia um lote de chaves de cache.
+    Precisa ser função de módulo para ser serializável (pickle).
+    """
+    engine = _worker_engines.get(config.signature())
+    if engine is None:
+        engine = _worker_engines.setdefault(config.signature(), QAEngine(config))
+
+    entries = [
+        TranslationEntry(
+            entry_id="",
+            original=original,
+            translation=translation,
+            status=status,
+            context={
+                "prefix": prefix,
+                "suffix": suffix,
+                "is_empty": is_empty,
+            },
+        )
+        for original, translation, prefix, suffix, status, is_empty, _ in keys
+    ]
+    return [tuple(issues) for issues in engine.run_batch(entries)]
+
+
+# ============================================================
+# Scanner do projeto inteiro
+# ============================================================
+
+class ProjectQAScanner:
+    """
+    QA de todos os arquivos do projeto.
+
+    O resultado de cada entrada é guardado em cache pela chave
+    (original, tradução, prefixo, sufixo, status, versão das regras),
+    então uma nova varredura só reavalia o que mudou.
+    Lotes grandes de entradas novas vão para um pool de processos.
+    """
+
+    # Abaixo disso o custo de subir o pool não compensa
+    PARALLEL_THRESHOLD = 20000
+    CHUNK_SIZE = 4000
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._cache: Dict[tuple, Tuple[QAIssue, ...]] = {}
+        # id(entry) -> (entry, tradução, status, prefixo, sufixo, versão)
+        # da última avaliação.
+        # Comparação por identidade: pula entradas intocadas sem
+        # nem recalcular a chave.
+        self._seen: Dict[int, tuple] = {}
+        # path -> (lista de entradas, tamanho, itens do relatório).
+        # Arquivo sem nenhuma entrada reavaliada reaproveita os itens.
+        self._file_items: Dict[str, tuple] = {}
+        self._executor: ProcessPoolExecutor | None = None
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def cache_key(entry: TranslationEntry, version) -> tuple:
+        ctx = entry.context
+        return (
+            entry.original or "",
+            entry.translation or "",
+            ctx.get("prefix", "") or "",
+            ctx.get("suffix", "") or "",
+            getattr(entry.status, "value", entry.status),
+            bool(ctx.get("is_empty")),
+            version,
+        )
+
+    @staticmethod
+    def _memo(entry: TranslationEntry, version) -> tuple:
+        ctx = entry.context
+        return (
+            entry,
+            entry.translation,
+            entry.status,
+            ctx.get("prefix"),
+            ctx.get("suffix"),
+            version,
+        )
+
+    # --------------------------------------------------
+
+    def scan(
+        self,
+        project: Project,
+        paths: Iterable[str] | None = None,
+    ) -> QAReport:
+        """
+        Roda o QA nos arquivos informados (ou em todos)
+        e atualiza `entry.qa_issues`.
+        """
+        report = QAReport()
+
+        engine = QAService.engine_for(project)
+        version = engine.version
+
+        targets = list(paths) if paths is not None else list(project.files)
+        cache = self._cache
+        seen = self._seen
+        file_items = self._file_items
+
+        # chave -> entradas que dependem dela (linhas repetidas avaliam 1x)
+        pending: Dict[tuple, List[TranslationEntry]] = {}
+        # Arquivos cujos itens do relatório precisam ser refeitos
+        stale = set()
+
+        for path in targets:
+            entries = project.files.get(path, ())
+            previous = file_items.get(path)
+            if (
+                previous is None
+                or previous[0] is not entries
+                or previous[1] != len(entries)
+            ):
+                stale.add(path)
+
+            for entry in entries:
+                memo = seen.get(id(entry))
+                ctx = entry.context
+                if (
+                    memo is not None
+                    and memo[0] is entry
+                    and memo[1] is entry.translation
+                    and memo[2] is entry.status
+                    and memo[3] is ctx.get("prefix")
+                    and memo[4] is ctx.get("suffix")
+                    and memo[5] is version
+                ):
+                    report.checked += 1
+                    continue
+
+                if not ctx.get("is_translatable"):
+                    continue
+
+                report.checked += 1
+                stale.add(path)
+
+                seen[id(entry)] = self._memo(entry, version)
+
+                key = self.cache_key(entry, version)
+                cached = cache.get(key)
+
+                if cached is None:
+                    pending.setdefault(key, []).append(entry)
+                else:
+                    entry.qa_issues = list(cached)
+
+        if pending:
+            keys = list(pending)
+            report.evaluated = len(keys)
+
+            for key, issues in zip(keys, self._evaluate(engine, keys)):
+                cache[key] = issues
+                for entry in pending[key]:
+                    entry.qa_issues = list(issues)
+
+        for path in targets:
+            if path in stale:
+                entries = project.files.get(path, ())
+                items = [
+                    QAReportItem(path, entry, issue)
+                    for entry in entries
+                    if entry.qa_issues
+                    for issue in entry.qa_issues
+                ]
+                file_items[path] = (entries, len(entries), items)
+            report.items.extend(file_items[path][2])
+
+        return report
+
+    # --------------------------------------------------
+
+    def adopt(self, project: Project):
+        """
+        Aproveita resultados já presentes nas entradas
+        (ex.: restaurados da tabela de QA) sem reavaliá-los.
+        Roda na thread da interface, depois da carga do projeto; usa
+        o mesmo objeto `version` da engine (o memo compara por identidade).
+        """
+        version = QAService.engine_for(project).version
+        for entries in project.files.values():
+            for entry in entries:
+                if not entry.qa_issues:
+                    continue
+                self._cache.setdefault(
+                    self.cache_key(entry, version), tuple(entry.qa_issues)
+                )
+                self._seen[id(entry)] = self._memo(entry, version)
+
+    # --------------------------------------------------
+
+    def _evaluate(
+        self,
+        engine: QAEngine,
+        keys: List[tuple],
+    ) -> List[Tuple[QAIssue, ...]]:
+        if len(keys) < self.PARALLEL_THRESHOLD or self.max_workers < 2:
+            return _evaluate_chunk(engine.config, keys)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        chunks = [
+            keys[i:i + self.CHUNK_SIZE]
+            for i in range(0, len(keys), self.CHUNK_SIZE)
+        ]
+
+        results: List[Tuple[QAIssue, ...]] = []
+        work = partial(_evaluate_chunk, engine.config)
+        for part in self._executor.map(work, chunks):
+            results.extend(part)
+        return results
+
+    # --------------------------------------------------
+
+    def clear_cache(self):
+        self._cache.clear()
+        self._seen.clear()
+        self._file_items.clear()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
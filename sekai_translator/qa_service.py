@@ -1,144 +1,77 @@
-import re
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
 from typing import List
 
-from sekai_translator.core import TranslationEntry, TranslationStatus
+from sekai_translator.core import TranslationEntry
+from sekai_translator.qa_rules import QAConfig, QAEngine, QAIssue
+
+__all__ = ["QAIssue", "QAService"]
 
 
 # ============================================================
-# QA Issue
+# QA Service
 # ============================================================
 
-@dataclass
-class QAIssue:
-    level: str      # "warning" | "error"
-    code: str       # identificador curto
-    message: str    # mensagem amigável
+class QAService:
+    """
+    Fachada do QA. As regras em si ficam em `qa_rules`;
+    aqui só se escolhe o `QAEngine` certo para o projeto.
+    """
 
+    # Incrementar sempre que as regras mudarem (invalida caches de QA)
+    RULES_VERSION = QAEngine.RULES_VERSION
 
-# ============================================================
-# QA Service (CORRIGIDO)
-# ============================================================
+    # Poucas configurações vivas ao mesmo tempo (a atual e a padrão)
+    MAX_ENGINES = 4
 
-class QAService:
+    _engines: "OrderedDict[tuple, QAEngine]" = OrderedDict()
+    _engines_lock = threading.Lock()
 
-    TAG_PATTERN = re.compile(r"""
-        (\{[^}]+\})            |  # {player_name}
-        (\[[^\]]+\])           |  # [ruby=...]
-        (<[^>]+>)                 # <color=red>
-    """, re.VERBOSE)
+    # --------------------------------------------------------
 
-    LENGTH_RATIO_LIMIT = 1.8
+    @staticmethod
+    def version_for(project=None) -> tuple:
+        """
+        Mesmo valor de `engine_for(project).version`, sem montar a
+        engine (seguro na thread de carregamento do projeto).
+        """
+        config = QAConfig.from_project(project) if project else QAConfig()
+        return (QAEngine.RULES_VERSION, config.signature())
 
     # --------------------------------------------------------
 
     @staticmethod
-    def run(entry: TranslationEntry) -> List[QAIssue]:
-        issues: List[QAIssue] = []
-
-        original = entry.original or ""
-        translation = entry.translation or ""
-
-        # Ignora linhas estruturais
-        if entry.context.get("is_empty"):
-            return issues
-
-        prefix = entry.context.get("prefix", "") or ""
-        suffix = entry.context.get("suffix", "") or ""
-
-        rebuilt = f"{prefix}{translation}{suffix}"
-
-        # ----------------------------------------------------
-        # 1️⃣ Tradução vazia (SÓ SE NÃO FOR UNTRANSLATED)
-        # ----------------------------------------------------
-        if (
-            entry.status != TranslationStatus.UNTRANSLATED
-            and original.strip()
-            and not translation.strip()
-        ):
-            issues.append(
-                QAIssue(
-                    level="warning",
-                    code="EMPTY_TRANSLATION",
-                    message="Tradução vazia.",
-                )
-            )
-
-        # ----------------------------------------------------
-        # 2️⃣ Tradução idêntica ao original
-        # ----------------------------------------------------
-        original_core = original
-        if original.startswith(prefix) and original.endswith(suffix):
-            original_core = original[len(prefix):len(original) - len(suffix)]
-
-        if (
-            entry.status != TranslationStatus.UNTRANSLATED
-            and translation.strip()
-            and translation.strip() == original_core.strip()
-        ):
-            issues.append(
-                QAIssue(
-                    level="warning",
-                    code="IDENTICAL_TEXT",
-                    message="Tradução idêntica ao original.",
-                )
-            )
-
-        # ----------------------------------------------------
-        # 3️⃣ Tags obrigatórias ausentes
-        # ----------------------------------------------------
-        original_tags = set(QAService.TAG_PATTERN.findall(original))
-        rebuilt_tags = set(QAService.TAG_PATTERN.findall(rebuilt))
-
-        original_tags = {t for group in original_tags for t in group if t}
-        rebuilt_tags = {t for group in rebuilt_tags for t in group if t}
-
-        missing_tags = original_tags - rebuilt_tags
-        if missing_tags:
-            issues.append(
-                QAIssue(
-                    level="error",
-                    code="MISSING_TAG",
-                    message=f"Tags ausentes na tradução: {', '.join(missing_tags)}",
-                )
-            )
-
-        # ----------------------------------------------------
-        # 4️⃣ Prefixo / sufixo preservados
-        # ----------------------------------------------------
-        if prefix and not rebuilt.startswith(prefix):
-            issues.append(
-                QAIssue(
-                    level="error",
-                    code="PREFIX_MISMATCH",
-                    message="Prefixo original não preservado.",
-                )
-            )
-
-        if suffix and not rebuilt.endswith(suffix):
-            issues.append(
-                QAIssue(
-                    level="error",
-                    code="SUFFIX_MISMATCH",
-                    message="Sufixo original não preservado.",
-                )
-            )
-
-        # ----------------------------------------------------
-        # 5️⃣ Texto excessivamente longo
-        # ----------------------------------------------------
-        if (
-            entry.status != TranslationStatus.UNTRANSLATED
-            and original.strip()
-            and translation.strip()
-            and len(translation) > len(original) * QAService.LENGTH_RATIO_LIMIT
-        ):
-            issues.append(
-                QAIssue(
-                    level="warning",
-                    code="TEXT_TOO_LONG",
-                    message="Tradução muito mais longa que o original.",
-                )
-            )
-
-        return issues
+    def engine_for(project=None) -> QAEngine:
+        """
+        Engine (regras pré-compiladas) para a configuração do projeto.
+        Reaproveitada enquanto a configuração não mudar; as
+        menos usadas recentemente são descartadas.
+        """
+        config = QAConfig.from_project(project) if project else QAConfig()
+        key = config.signature()
+
+        with QAService._engines_lock:
+            engines = QAService._engines
+            engine = engines.get(key)
+            if engine is None:
+                engine = QAEngine(config)
+                engines[key] = engine
+                while len(engines) > QAService.MAX_ENGINES:
+                    engines.popitem(last=False)
+            else:
+                engines.move_to_end(key)
+        return engine
+
+    # --------------------------------------------------------
+
+    @staticmethod
+    def run(entry: TranslationEntry, project=None) -> List[QAIssue]:
+        return QAService.engine_for(project).run(entry)
+
+    @staticmethod
+    def run_batch(entries: List[TranslationEntry], project=None) -> List[List[QAIssue]]:
+        """
+        Avalia várias entradas de uma vez (bem mais rápido que
+        chamar `run` em loop: regras e tags são compartilhadas).
+        """
+        return QAService.engine_for(project).run_batch(entries)
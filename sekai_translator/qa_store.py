@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Dict
+
+from sekai_translator.core import Project, TranslationEntry
+from sekai_translator.qa_rules import RULES, QAIssue
+from sekai_translator.qa_service import QAService
+
+
+# ============================================================
+# Tabela de QA persistida (qa_issues.json, ao lado do project.json)
+#
+#   {
+#     "rules": "<hash da versão das regras + config>",
+#     "files": { path: { entry_id: [bits, fingerprint] } }
+#   }
+#
+# Só entradas com problema são gravadas. Cada código de QA tem um
+# bit fixo (QARule.bit); a mensagem é reconstruída a partir da regra.
+# ============================================================
+
+QA_TABLE_NAME = "qa_issues.json"
+
+_RULES_BY_BIT = {cls.bit: cls for cls in RULES.values()}
+
+
+def entry_fingerprint(entry: TranslationEntry) -> int:
+    """
+    Identifica o conteúdo avaliado pelo QA.
+    Se mudar, o resultado salvo não vale mais.
+    """
+    ctx = entry.context
+    data = "\x1f".join((
+        entry.original or "",
+        entry.translation or "",
+        ctx.get("prefix", "") or "",
+        ctx.get("suffix", "") or "",
+        getattr(entry.status, "value", entry.status),
+    ))
+    return zlib.crc32(data.encode("utf-8"))
+
+
+def rules_signature(project: Project) -> str:
+    version = QAService.version_for(project)
+    return hashlib.sha1(repr(version).encode("utf-8")).hexdigest()[:16]
+
+
+def qa_table_path(project: Project) -> Path | None:
+    if not project.project_path:
+        return None
+    return Path(project.project_path).with_name(QA_TABLE_NAME)
+
+
+# --------------------------------------------------
+# Bitset <-> issues
+# --------------------------------------------------
+
+def issues_to_bits(issues) -> int:
+    bits = 0
+    for issue in issues:
+        rule = RULES.get(issue.code)
+        if rule is not None:
+            bits |= 1 << rule.bit
+    return bits
+
+
+def bits_to_issues(bits: int) -> list[QAIssue]:
+    issues = []
+    bit = 0
+    while bits:
+        if bits & 1:
+            rule = _RULES_BY_BIT.get(bit)
+            if rule is not None:
+                issues.append(
+                    QAIssue(level=rule.level, code=rule.code, message=rule.message)
+                )
+        bits >>= 1
+        bit += 1
+    return issues
+
+
+# --------------------------------------------------
+# Save / Load
+# --------------------------------------------------
+
+def save_qa_table(project: Project, path: Path | None = None):
+    path = path or qa_table_path(project)
+    if path is None:
+        return
+
+    files: Dict[str, Dict[str, list]] = {}
+    for file_path, entries in project.files.items():
+        table = {
+            e.entry_id: [issues_to_bits(e.qa_issues), entry_fingerprint(e)]
+            for e in entries
+            if e.qa_issues
+        }
+        if table:
+            files[file_path] = table
+
+    data = {"rules": rules_signature(project), "files": files}
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def load_qa_table(project: Project, path: Path | None = None) -> int:
+    """
+    Restaura `qa_issues` sem rodar o QA.
+    Entradas alteradas desde o último save (fingerprint diferente)
+    e tabelas de outra versão das regras são ignoradas.
+    Retorna quantas entradas foram restauradas.
+    """
+    path = path or qa_table_path(project)
+    if path is None or not path.exists():
+        return 0
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return 0
+
+    if data.get("rules") != rules_signature(project):
+        return 0
+
+    restored = 0
+    issues_cache: Dict[int, list] = {}
+
+    for file_path, table in data.get("files", {}).items():
+        entries = project.files.get(file_path)
+        if not entries:
+            continue
+
+        for entry in entries:
+            stored = table.get(entry.entry_id)
+            if stored is None:
+                continue
+
+            bits, fingerprint = stored
+            if fingerprint != entry_fingerprint(entry):
+                continue
+
+            issues = issues_cache.get(bits)
+            if issues is None:
+                issues = issues_cache[bits] = bits_to_issues(bits)
+
+            entry.qa_issues = list(issues)
+            restored += 1
+
+    return restored
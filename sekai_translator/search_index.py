@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import json
+import operator
+import os
+import struct
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from sekai_translator.core import Project, TranslationEntry
+
+
+# ============================================================
+# Resultado
+# ============================================================
+
+@dataclass
+class SearchHit:
+    file_path: str
+    entry: TranslationEntry
+    in_original: bool
+    in_translation: bool
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+SEPARATOR = "\x00"
+
+
+def _fold(entry: TranslationEntry) -> str:
+    return f"{entry.original or ''}{SEPARATOR}{entry.translation or ''}".casefold()
+
+
+def _grams(text: str) -> Set[str]:
+    """Bigramas do texto (funciona sem segmentar palavras: JP / CN)."""
+    return set(map(operator.add, text, text[1:]))
+
+
+def _file_fingerprint(entries: Iterable[TranslationEntry]) -> int:
+    crc = 0
+    for e in entries:
+        if e.context.get("is_translatable"):
+            crc = zlib.crc32(
+                f"{e.entry_id}{SEPARATOR}{e.original}{SEPARATOR}{e.translation}\n"
+                .encode("utf-8"),
+                crc,
+            )
+    return crc
+
+
+# ============================================================
+# Índice invertido (bigramas) do projeto
+# ============================================================
+
+class SearchIndex:
+    """
+    Índice de busca sobre originais e traduções de todos os arquivos
+    importados. A consulta intersecta as listas dos bigramas da busca
+    e só confirma (substring) os candidatos que sobram.
+
+    Atualizado incrementalmente a cada commit e salvo ao lado do
+    project.json (search_index.bin).
+    """
+
+    FILE_NAME = "search_index.bin"
+    MAGIC = b"SKSI"
+    VERSION = 1
+
+    def __init__(self):
+        self._entries: List[Optional[TranslationEntry]] = []
+        self._paths: List[Optional[str]] = []
+        self._indexed: List[str] = []         # texto "dobrado" indexado
+        self._doc_of: Dict[int, int] = {}      # id(entry) -> doc
+        self._file_docs: Dict[str, List[int]] = {}
+        self._free: List[int] = []
+
+        # bigrama -> docs. Valores carregados do disco ficam como array
+        # e só viram set quando precisam ser alterados / intersectados.
+        self._postings: Dict[str, object] = {}
+
+        # Só regrava o arquivo se algo mudou desde o último save/load
+        self.dirty = False
+
+    # --------------------------------------------------
+    # Construção
+    # --------------------------------------------------
+
+    def build(self, project: Project):
+        self.__init__()
+        for path, entries in project.files.items():
+            self.add_file(path, entries)
+
+    def add_file(self, path: str, entries: List[TranslationEntry]):
+        if path in self._file_docs:
+            self.remove_file(path)
+
+        docs = []
+        for entry in entries:
+            if entry.context.get("is_translatable"):
+                docs.append(self._add_doc(path, entry))
+        self._file_docs[path] = docs
+
+    def remove_file(self, path: str):
+        for doc in self._file_docs.pop(path, ()):
+            self._remove_doc(doc)
+
+    def has_file(self, path: str) -> bool:
+        return path in self._file_docs
+
+    def _add_doc(self, path: str, entry: TranslationEntry) -> int:
+        text = _fold(entry)
+
+        if self._free:
+            doc = self._free.pop()
+            self._entries[doc] = entry
+            self._paths[doc] = path
+            self._indexed[doc] = text
+        else:
+            doc = len(self._entries)
+            self._entries.append(entry)
+            self._paths.append(path)
+            self._indexed.append(text)
+
+        self._doc_of[id(entry)] = doc
+        self.dirty = True
+
+        for gram in _grams(text):
+            self._posting_set(gram).add(doc)
+        return doc
+
+    def _remove_doc(self, doc: int):
+        for gram in _grams(self._indexed[doc]):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                self._posting_set(gram).discard(doc)
+
+        entry = self._entries[doc]
+        if entry is not None:
+            self._doc_of.pop(id(entry), None)
+
+        self._entries[doc] = None
+        self._paths[doc] = None
+        self._indexed[doc] = ""
+        self._free.append(doc)
+        self.dirty = True
+
+    def _posting_set(self, gram: str) -> Set[int]:
+        postings = self._postings.get(gram)
+        if postings is None:
+            postings = self._postings[gram] = set()
+        elif not isinstance(postings, set):
+            postings = self._postings[gram] = set(postings)
+        return postings
+
+    # --------------------------------------------------
+    # Atualização incremental
+    # --------------------------------------------------
+
+    def update_entries(self, entries: Iterable[TranslationEntry]):
+        """Reindexa só o que mudou (diferença de bigramas)."""
+        for entry in entries:
+            doc = self._doc_of.get(id(entry))
+            if doc is None:
+                continue
+
+            new_text = _fold(entry)
+            old_text = self._indexed[doc]
+            if new_text == old_text:
+                continue
+
+            old_grams = _grams(old_text)
+            new_grams = _grams(new_text)
+
+            for gram in old_grams - new_grams:
+                self._posting_set(gram).discard(doc)
+            for gram in new_grams - old_grams:
+                self._posting_set(gram).add(doc)
+
+            self._indexed[doc] = new_text
+            self.dirty = True
+
+    # --------------------------------------------------
+    # Busca
+    # --------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        in_original: bool = True,
+        in_translation: bool = True,
+        limit: Optional[int] = 1000,
+    ) -> List[SearchHit]:
+        """Busca por substring (sem diferenciar maiúsculas). limit=None: todos."""
+        q = query.casefold()
+        if not q or SEPARATOR in q:
+            return []
+
+        if len(q) < 2:
+            candidates: Iterable[int] = range(len(self._entries))
+        else:
+            lists = []
+            for gram in _grams(q):
+                postings = self._postings.get(gram)
+                if not postings:
+                    return []
+                lists.append(postings)
+
+            lists.sort(key=len)
+            result = set(lists[0])
+            for postings in lists[1:]:
+                result.intersection_update(postings)
+                if not result:
+                    return []
+            candidates = sorted(result)
+
+        hits: List[SearchHit] = []
+        indexed = self._indexed
+        sep = SEPARATOR
+
+        for doc in candidates:
+            text = indexed[doc]
+            if not text:
+                continue
+
+            split = text.index(sep)
+            hit_original = text.find(q, 0, split) != -1
+            hit_translation = text.find(q, split + 1) != -1
+
+            if (hit_original and in_original) or (hit_translation and in_translation):
+                hits.append(
+                    SearchHit(
+                        self._paths[doc],
+                        self._entries[doc],
+                        hit_original,
+                        hit_translation,
+                    )
+                )
+                if limit is not None and len(hits) >= limit:
+                    break
+
+        return hits
+
+    # --------------------------------------------------
+    # Persistência
+    # --------------------------------------------------
+
+    @classmethod
+    def index_path(cls, project: Project) -> Path | None:
+        if not project.project_path:
+            return None
+        return Path(project.project_path).with_name(cls.FILE_NAME)
+
+    def save(self, project: Project):
+        """
+        Formato: MAGIC, versão, cabeçalho JSON (arquivos, fingerprints,
+        docs) e as listas de postings como arrays uint32 — carregar é
+        praticamente só copiar bytes.
+        """
+        path = self.index_path(project)
+        if path is None or (not self.dirty and path.exists()):
+            return
+
+        # Ids são gravados como estão (buracos viram null), sem
+        # renumerar: salvar é só serializar as listas
+        docs: List[Optional[list]] = [None] * len(self._entries)
+        files = {}
+        for file_path, file_docs in self._file_docs.items():
+            entries = project.files.get(file_path, [])
+            files[file_path] = _file_fingerprint(entries)
+            for doc in file_docs:
+                docs[doc] = [file_path, self._entries[doc].entry_id]
+
+        header = json.dumps(
+            {"files": files, "docs": docs},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        body = bytearray()
+        for gram, postings in self._postings.items():
+            if not postings:
+                continue
+            ids = array("I", sorted(postings))
+            g = gram.encode("utf-8")
+            body += struct.pack("<BI", len(g), len(ids))
+            body += g
+            body += ids.tobytes()
+
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<HI", self.VERSION, len(header)))
+            f.write(header)
+            f.write(zlib.compress(bytes(body), 1))
+        os.replace(tmp, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, project: Project) -> "SearchIndex":
+        """
+        Carrega o índice salvo. Arquivos alterados fora do índice
+        (fingerprint diferente) ou novos são reindexados; se não houver
+        índice válido, constrói do zero.
+        """
+        index = cls()
+        path = cls.index_path(project)
+
+        try:
+            if path is None or not path.exists():
+                raise ValueError("sem índice")
+            index._read(project, path.read_bytes())
+        except (OSError, ValueError, KeyError, struct.error, zlib.error):
+            index.build(project)
+            return index
+
+        for file_path, entries in project.files.items():
+            if not index.has_file(file_path):
+                index.add_file(file_path, entries)
+
+        return index
+
+    def _read(self, project: Project, data: bytes):
+        if data[:4] != self.MAGIC:
+            raise ValueError("formato inválido")
+
+        version, header_len = struct.unpack_from("<HI", data, 4)
+        if version != self.VERSION:
+            raise ValueError("versão diferente")
+
+        offset = 4 + struct.calcsize("<HI")
+        header = json.loads(data[offset:offset + header_len].decode("utf-8"))
+        body = zlib.decompress(data[offset + header_len:])
+
+        # Arquivos cujo conteúdo não bate mais com o índice
+        stale = {
+            p for p, fp in header["files"].items()
+            if p not in project.files
+            or _file_fingerprint(project.files[p]) != fp
+        }
+
+        lookup: Dict[str, Dict[str, TranslationEntry]] = {}
+        for file_path in header["files"]:
+            if file_path not in stale:
+                lookup[file_path] = {
+                    e.entry_id: e for e in project.files[file_path]
+                }
+
+        for item in header["docs"]:
+            doc = len(self._entries)
+            entry = None
+            if item is not None:
+                file_path, entry_id = item
+                entry = lookup.get(file_path, {}).get(entry_id)
+
+            if entry is None:
+                self._entries.append(None)
+                self._paths.append(None)
+                self._indexed.append("")
+                self._free.append(doc)
+                continue
+
+            self._entries.append(entry)
+            self._paths.append(file_path)
+            self._indexed.append(_fold(entry))
+            self._doc_of[id(entry)] = doc
+            self._file_docs.setdefault(file_path, []).append(doc)
+
+        pos = 0
+        size = array("I").itemsize
+        while pos < len(body):
+            glen, count = struct.unpack_from("<BI", body, pos)
+            pos += struct.calcsize("<BI")
+            gram = body[pos:pos + glen].decode("utf-8")
+            pos += glen
+            ids = array("I")
+            ids.frombytes(body[pos:pos + count * size])
+            pos += count * size
+            self._postings[gram] = ids
+
+        # Postings de docs descartados (arquivos alterados) são filtrados
+        # na hora: reindexar esses arquivos do zero
+        if self._free:
+            dead = set(self._free)
+            for gram, ids in list(self._postings.items()):
+                if any(d in dead for d in ids):
+                    self._postings[gram] = {d for d in ids if d not in dead}
+
+        for file_path in stale:
+            if file_path in project.files:
+                self.add_file(file_path, project.files[file_path])
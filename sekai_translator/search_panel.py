@@ -0,0 +1,158 @@
+from pathlib import Path
+import time
+
+from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtWidgets import (
+    QDockWidget,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLineEdit,
+    QCheckBox,
+    QLabel,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QHeaderView,
+)
+
+from sekai_translator.search_index import SearchIndex
+
+
+class SearchPanel(QDockWidget):
+    """
+    Busca no projeto inteiro (originais e traduções),
+    usando o `SearchIndex`. Duplo clique abre o arquivo na linha.
+    """
+
+    entry_activated = Signal(str, object)  # file_path, TranslationEntry
+
+    SEARCH_DELAY_MS = 200
+    MAX_RESULTS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__("Buscar no Projeto", parent)
+
+        self.setObjectName("SearchPanel")
+        self.setAllowedAreas(Qt.BottomDockWidgetArea | Qt.RightDockWidgetArea)
+
+        self.index: SearchIndex | None = None
+        self.root_path = ""
+
+        body = QWidget()
+        layout = QVBoxLayout(body)
+        layout.setContentsMargins(6, 6, 6, 6)
+
+        row = QHBoxLayout()
+
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("Buscar texto em todos os arquivos…")
+        self.query_edit.setClearButtonEnabled(True)
+        row.addWidget(self.query_edit)
+
+        self.original_check = QCheckBox("Original")
+        self.original_check.setChecked(True)
+        row.addWidget(self.original_check)
+
+        self.translation_check = QCheckBox("Tradução")
+        self.translation_check.setChecked(True)
+        row.addWidget(self.translation_check)
+
+        layout.addLayout(row)
+
+        self.summary = QLabel()
+        layout.addWidget(self.summary)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Arquivo", "Linha", "Original", "Tradução"])
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True)
+
+        header = self.tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
+
+        layout.addWidget(self.tree)
+        self.setWidget(body)
+
+        # Debounce: busca só quando o usuário para de digitar
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.SEARCH_DELAY_MS)
+        self._timer.timeout.connect(self.run_search)
+
+        self.query_edit.textChanged.connect(lambda _: self._timer.start())
+        self.query_edit.returnPressed.connect(self.run_search)
+        self.original_check.toggled.connect(lambda _: self.run_search())
+        self.translation_check.toggled.connect(lambda _: self.run_search())
+        self.tree.itemActivated.connect(self._on_item_activated)
+
+    # --------------------------------------------------
+
+    def set_index(self, index: SearchIndex | None, root_path: str = ""):
+        self.index = index
+        self.root_path = root_path
+        self.tree.clear()
+        self.summary.clear()
+
+    def focus_query(self):
+        self.show()
+        self.raise_()
+        self.query_edit.setFocus()
+        self.query_edit.selectAll()
+
+    # --------------------------------------------------
+
+    def run_search(self):
+        self._timer.stop()
+        self.tree.clear()
+
+        query = self.query_edit.text()
+        if not query or self.index is None:
+            self.summary.clear()
+            return
+
+        start = time.perf_counter()
+        hits = self.index.search(
+            query,
+            in_original=self.original_check.isChecked(),
+            in_translation=self.translation_check.isChecked(),
+            limit=self.MAX_RESULTS,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+
+        root = Path(self.root_path) if self.root_path else None
+        items = []
+
+        for hit in hits:
+            try:
+                name = str(Path(hit.file_path).relative_to(root))
+            except (TypeError, ValueError):
+                name = Path(hit.file_path).name
+
+            entry = hit.entry
+            item = QTreeWidgetItem([
+                name,
+                "",
+                (entry.original or "").replace("\n", " "),
+                (entry.translation or "").replace("\n", " "),
+            ])
+            item.setData(1, Qt.DisplayRole, entry.context.get("line_number", ""))
+            item.setData(0, Qt.UserRole, (hit.file_path, entry))
+            items.append(item)
+
+        self.tree.addTopLevelItems(items)
+
+        more = "+" if len(hits) >= self.MAX_RESULTS else ""
+        self.summary.setText(
+            f"{len(hits)}{more} resultado(s) em {elapsed:.1f} ms"
+        )
+
+    # --------------------------------------------------
+
+    def _on_item_activated(self, item: QTreeWidgetItem, _column: int):
+        data = item.data(0, Qt.UserRole)
+        if data:
+            path, entry = data
+            self.entry_activated.emit(path, entry)
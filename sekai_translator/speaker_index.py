@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from sekai_translator.core import Project, TranslationEntry, TranslationStatus
+
+
+class SpeakerIndex:
+    """
+    Personagem → falas (arquivo, entrada) no projeto inteiro.
+
+    O personagem vem do parser (`context["speaker"]`) e não muda
+    depois do import: o índice só é alterado quando um arquivo
+    é importado / removido.
+    """
+
+    def __init__(self):
+        self._lines: Dict[str, List[Tuple[str, TranslationEntry]]] = {}
+        self._file_speakers: Dict[str, set] = {}
+
+    @classmethod
+    def from_project(cls, project: Project) -> "SpeakerIndex":
+        index = cls()
+        for path, entries in project.files.items():
+            index.add_file(path, entries)
+        return index
+
+    # --------------------------------------------------
+
+    def add_file(self, path: str, entries: List[TranslationEntry]):
+        if path in self._file_speakers:
+            self.remove_file(path)
+
+        speakers = set()
+        lines = self._lines
+        for entry in entries:
+            speaker = entry.context.get("speaker")
+            if speaker and entry.context.get("is_translatable"):
+                lines.setdefault(speaker, []).append((path, entry))
+                speakers.add(speaker)
+        self._file_speakers[path] = speakers
+
+    def remove_file(self, path: str):
+        for speaker in self._file_speakers.pop(path, ()):
+            items = [i for i in self._lines.get(speaker, ()) if i[0] != path]
+            if items:
+                self._lines[speaker] = items
+            else:
+                self._lines.pop(speaker, None)
+
+    # --------------------------------------------------
+
+    def speakers(self) -> List[Tuple[str, int, int]]:
+        """(personagem, falas, falas traduzidas), mais falas primeiro."""
+        result = []
+        for speaker, items in self._lines.items():
+            translated = sum(
+                1 for _, e in items if e.status == TranslationStatus.TRANSLATED
+            )
+            result.append((speaker, len(items), translated))
+        result.sort(key=lambda s: (-s[1], s[0]))
+        return result
+
+    def lines(self, speaker: str) -> List[Tuple[str, TranslationEntry]]:
+        return self._lines.get(speaker, [])
+
+    def __contains__(self, speaker: str) -> bool:
+        return speaker in self._lines
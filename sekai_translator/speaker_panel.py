@@ -0,0 +1,211 @@
+from pathlib import Path
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QDockWidget,
+    QWidget,
+    QVBoxLayout,
+    QSplitter,
+    QLineEdit,
+    QLabel,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QHeaderView,
+    QAbstractItemView,
+)
+
+from sekai_translator.speaker_index import SpeakerIndex
+
+
+class SpeakerPanel(QDockWidget):
+    """
+    Personagens do projeto: quantas falas cada um tem, o nome
+    traduzido (usado na exportação) e todas as falas de um
+    personagem em todos os arquivos. Duplo clique abre a linha.
+    """
+
+    entry_activated = Signal(str, object)   # file_path, TranslationEntry
+    speaker_renamed = Signal(str, str)      # original, traduzido
+
+    def __init__(self, parent=None):
+        super().__init__("Personagens", parent)
+
+        self.setObjectName("SpeakerPanel")
+        self.setAllowedAreas(Qt.BottomDockWidgetArea | Qt.RightDockWidgetArea)
+
+        self.index: SpeakerIndex | None = None
+        self.names: dict = {}
+        self.root_path = ""
+        self._filling = False
+
+        body = QWidget()
+        layout = QVBoxLayout(body)
+        layout.setContentsMargins(6, 6, 6, 6)
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filtrar personagens…")
+        self.filter_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.filter_edit)
+
+        splitter = QSplitter(Qt.Horizontal)
+
+        self.speaker_tree = QTreeWidget()
+        self.speaker_tree.setHeaderLabels(
+            ["Personagem", "Nome traduzido", "Falas", "Traduzidas"]
+        )
+        self.speaker_tree.setRootIsDecorated(False)
+        self.speaker_tree.setUniformRowHeights(True)
+        # Só o nome traduzido é editável (duplo clique na coluna)
+        self.speaker_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        header = self.speaker_tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        splitter.addWidget(self.speaker_tree)
+
+        right = QWidget()
+        right_layout = QVBoxLayout(right)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.summary = QLabel()
+        right_layout.addWidget(self.summary)
+
+        self.lines_tree = QTreeWidget()
+        self.lines_tree.setHeaderLabels(["Arquivo", "Linha", "Original", "Tradução"])
+        self.lines_tree.setRootIsDecorated(False)
+        self.lines_tree.setUniformRowHeights(True)
+        header = self.lines_tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        right_layout.addWidget(self.lines_tree)
+
+        splitter.addWidget(right)
+        splitter.setSizes([300, 700])
+        layout.addWidget(splitter)
+
+        self.setWidget(body)
+
+        self.filter_edit.textChanged.connect(self._apply_filter)
+        self.speaker_tree.currentItemChanged.connect(
+            lambda item, _prev: self._show_lines(item)
+        )
+        self.speaker_tree.itemChanged.connect(self._on_item_changed)
+        self.speaker_tree.itemDoubleClicked.connect(self._on_speaker_double_click)
+        self.lines_tree.itemActivated.connect(self._on_line_activated)
+
+    # --------------------------------------------------
+
+    def set_index(self, index: SpeakerIndex | None, names: dict, root_path: str = ""):
+        self.index = index
+        self.names = names
+        self.root_path = root_path
+        self.refresh()
+
+    def show_panel(self):
+        self.refresh()
+        self.show()
+        self.raise_()
+        self.filter_edit.setFocus()
+
+    def refresh(self):
+        """Recarrega a lista (contagens de traduzidas mudam com o uso)."""
+        current = self.speaker_tree.currentItem()
+        selected = current.data(0, Qt.UserRole) if current else None
+
+        self._filling = True
+        self.speaker_tree.clear()
+        self.lines_tree.clear()
+        self.summary.clear()
+
+        if self.index is not None:
+            items = []
+            for speaker, total, translated in self.index.speakers():
+                item = QTreeWidgetItem([
+                    speaker, self.names.get(speaker, ""), "", ""
+                ])
+                item.setData(0, Qt.UserRole, speaker)
+                item.setData(2, Qt.DisplayRole, total)
+                item.setData(3, Qt.DisplayRole, translated)
+                item.setFlags(item.flags() | Qt.ItemIsEditable)
+                items.append(item)
+            self.speaker_tree.addTopLevelItems(items)
+
+        self._filling = False
+        self._apply_filter(self.filter_edit.text())
+
+        if selected is not None:
+            for i in range(self.speaker_tree.topLevelItemCount()):
+                item = self.speaker_tree.topLevelItem(i)
+                if item.data(0, Qt.UserRole) == selected:
+                    self.speaker_tree.setCurrentItem(item)
+                    break
+
+    # --------------------------------------------------
+
+    def _apply_filter(self, text: str):
+        text = text.casefold()
+        for i in range(self.speaker_tree.topLevelItemCount()):
+            item = self.speaker_tree.topLevelItem(i)
+            visible = (
+                not text
+                or text in item.text(0).casefold()
+                or text in item.text(1).casefold()
+            )
+            item.setHidden(not visible)
+
+    def _show_lines(self, item: QTreeWidgetItem | None):
+        self.lines_tree.clear()
+        if item is None or self.index is None:
+            self.summary.clear()
+            return
+
+        speaker = item.data(0, Qt.UserRole)
+        lines = self.index.lines(speaker)
+
+        root = Path(self.root_path) if self.root_path else None
+        names = {}
+        items = []
+
+        for path, entry in lines:
+            name = names.get(path)
+            if name is None:
+                try:
+                    name = str(Path(path).relative_to(root))
+                except (TypeError, ValueError):
+                    name = Path(path).name
+                names[path] = name
+
+            row = QTreeWidgetItem([
+                name,
+                "",
+                (entry.original or "").replace("\n", " "),
+                (entry.translation or "").replace("\n", " "),
+            ])
+            row.setData(1, Qt.DisplayRole, entry.context.get("line_number", ""))
+            row.setData(0, Qt.UserRole, (path, entry))
+            items.append(row)
+
+        self.lines_tree.addTopLevelItems(items)
+        self.summary.setText(
+            f"{speaker}: {len(lines)} fala(s) em {len(names)} arquivo(s)"
+        )
+
+    def _on_speaker_double_click(self, item: QTreeWidgetItem, column: int):
+        self.speaker_tree.editItem(item, 1)
+
+    def _on_item_changed(self, item: QTreeWidgetItem, column: int):
+        if self._filling or column != 1:
+            return
+        speaker = item.data(0, Qt.UserRole)
+        name = item.text(1).strip()
+        if name != self.names.get(speaker, ""):
+            self.speaker_renamed.emit(speaker, name)
+
+    def _on_line_activated(self, item: QTreeWidgetItem, _column: int):
+        data = item.data(0, Qt.UserRole)
+        if data:
+            path, entry = data
+            self.entry_activated.emit(path, entry)
@@ -4,29 +4,93 @@ from sekai_translator.core import TranslationEntry, TranslationStatus
 class StatusService:
     """
     Fonte ÚNICA da verdade sobre status de tradução.
+
+    Quem precisa acompanhar as alterações (ver change_bus) se
+    registra com `add_listener(fn)`; fn(entry, status_anterior,
+    texto_anterior) é chamado só quando algo realmente muda.
     """
 
+    _listeners: list = []
+
+    @classmethod
+    def add_listener(cls, fn):
+        if fn not in cls._listeners:
+            cls._listeners.append(fn)
+
+    @classmethod
+    def remove_listener(cls, fn):
+        if fn in cls._listeners:
+            cls._listeners.remove(fn)
+
+    @classmethod
+    def notify(cls, entry: TranslationEntry, old_status, old_text: str):
+        """
+        Avisa os listeners. Chamado aqui dentro e por quem altera
+        a entrada diretamente (undo / redo).
+        """
+        if entry.status == old_status and entry.translation == old_text:
+            return
+        for fn in cls._listeners:
+            fn(entry, old_status, old_text)
+
+    @classmethod
+    def _apply(cls, entry: TranslationEntry, text: str, status: TranslationStatus):
+        old_status = entry.status
+        old_text = entry.translation
+        entry.translation = text
+        entry.status = status
+        cls.notify(entry, old_status, old_text)
+
+    # --------------------------------------------------
+
     @staticmethod
     def on_text_edited(entry: TranslationEntry, text: str):
         """
         Chamado quando o usuário digita algo,
         mas ainda não confirmou a tradução.
         """
-        entry.translation = text
-
         if not text.strip():
-            entry.status = TranslationStatus.UNTRANSLATED
+            StatusService._apply(entry, text, TranslationStatus.UNTRANSLATED)
         else:
-            entry.status = TranslationStatus.IN_PROGRESS
+            StatusService._apply(entry, text, TranslationStatus.IN_PROGRESS)
 
     @staticmethod
     def on_translation_committed(entry: TranslationEntry, text: str):
         """
         Chamado quando o usuário CONFIRMA a tradução (Enter).
         """
-        entry.translation = text
-
         if text.strip():
-            entry.status = TranslationStatus.TRANSLATED
+            StatusService._apply(entry, text, TranslationStatus.TRANSLATED)
         else:
-            entry.status = TranslationStatus.UNTRANSLATED
+            StatusService._apply(entry, text, TranslationStatus.UNTRANSLATED)
+
+    @staticmethod
+    def on_translation_replaced(entry: TranslationEntry, text: str):
+        """
+        Chamado pelo localizar / substituir em lote.
+        Só troca o texto: o status muda apenas se a linha
+        ficar vazia (ou deixar de estar).
+        """
+        if not text.strip():
+            status = TranslationStatus.UNTRANSLATED
+        elif entry.status == TranslationStatus.UNTRANSLATED:
+            status = TranslationStatus.IN_PROGRESS
+        else:
+            status = entry.status
+        StatusService._apply(entry, text, status)
+
+    @staticmethod
+    def on_translation_propagated(entry: TranslationEntry, text: str):
+        """
+        Tradução copiada de outra linha com o MESMO original,
+        confirmada pelo usuário: conta como traduzida.
+        """
+        StatusService.on_translation_committed(entry, text)
+
+    @staticmethod
+    def on_translation_pretranslated(entry: TranslationEntry, text: str):
+        """
+        Pré-tradução vinda da memória: fica para revisão
+        (em andamento) até o usuário confirmar.
+        """
+        StatusService.on_text_edited(entry, text)
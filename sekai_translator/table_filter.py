@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from sekai_translator.core import TranslationEntry, TranslationStatus
+
+
+# ============================================================
+# Filtro
+# ============================================================
+
+QA_ANY = "issues"    # qualquer problema de QA
+QA_ERRORS = "errors" # só erros
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    statuses: Optional[FrozenSet[str]] = None   # None = todos
+    qa: Optional[str] = None                    # QA_ANY | QA_ERRORS | None
+    speaker: Optional[str] = None
+    text: str = ""
+    regex: bool = False
+    case_sensitive: bool = False
+
+    def is_empty(self) -> bool:
+        return (
+            self.statuses is None
+            and self.qa is None
+            and self.speaker is None
+            and not self.text
+        )
+
+
+# ============================================================
+# Índices por linha
+# ============================================================
+
+def _status_key(status) -> str:
+    return getattr(status, "value", status)
+
+
+class RowIndex:
+    """
+    Índices pré-calculados das linhas de um arquivo
+    (status, QA, personagem e texto), para que filtrar seja
+    operação de conjuntos em vez de testar linha a linha.
+
+    As posições são índices na lista de entradas traduzíveis.
+    """
+
+    def __init__(self, entries: List[TranslationEntry]):
+        self.entries = entries
+        self.rebuild()
+
+    # --------------------------------------------------
+
+    def rebuild(self):
+        self.by_status: Dict[str, Set[int]] = {
+            s.value: set() for s in TranslationStatus
+        }
+        self.with_issues: Set[int] = set()
+        self.with_errors: Set[int] = set()
+        self.by_speaker: Dict[str, Set[int]] = {}
+
+        # Estado atual de cada linha, para mover entre conjuntos
+        self._row_status: List[str] = []
+        self._row_qa: List[int] = []   # 0 = ok, 1 = aviso, 2 = erro
+
+        self._index_rows(0)
+
+    def extend(self, entries: List[TranslationEntry]):
+        """Linhas novas no fim (carga progressiva do arquivo)."""
+        start = len(self.entries)
+        self.entries.extend(entries)
+        self._index_rows(start)
+
+    def _index_rows(self, start: int):
+        for i in range(start, len(self.entries)):
+            entry = self.entries[i]
+            status = _status_key(entry.status)
+            self.by_status.setdefault(status, set()).add(i)
+            self._row_status.append(status)
+
+            qa = self._qa_level(entry)
+            self._row_qa.append(qa)
+            if qa:
+                self.with_issues.add(i)
+            if qa == 2:
+                self.with_errors.add(i)
+
+            speaker = entry.context.get("speaker")
+            if speaker:
+                self.by_speaker.setdefault(speaker, set()).add(i)
+
+        self._haystack: Optional[str] = None
+        self._folded: Optional[str] = None
+        self._starts: List[int] = []
+
+    @staticmethod
+    def _qa_level(entry: TranslationEntry) -> int:
+        issues = entry.qa_issues
+        if not issues:
+            return 0
+        return 2 if any(i.level == "error" for i in issues) else 1
+
+    # --------------------------------------------------
+
+    def update(self, i: int):
+        """Atualiza a linha `i` depois de uma edição."""
+        entry = self.entries[i]
+
+        status = _status_key(entry.status)
+        old = self._row_status[i]
+        if status != old:
+            self.by_status[old].discard(i)
+            self.by_status.setdefault(status, set()).add(i)
+            self._row_status[i] = status
+
+        qa = self._qa_level(entry)
+        if qa != self._row_qa[i]:
+            self._row_qa[i] = qa
+            if qa:
+                self.with_issues.add(i)
+            else:
+                self.with_issues.discard(i)
+            if qa == 2:
+                self.with_errors.add(i)
+            else:
+                self.with_errors.discard(i)
+
+        # Texto mudou: o índice de busca é refeito na próxima consulta
+        self._haystack = None
+        self._folded = None
+
+    # --------------------------------------------------
+
+    def speakers(self) -> List[str]:
+        return sorted(self.by_speaker)
+
+    def query(self, f: RowFilter) -> List[int]:
+        """Linhas (em ordem) que passam no filtro."""
+        if f.is_empty():
+            return list(range(len(self.entries)))
+
+        sets: List[Set[int]] = []
+
+        if f.statuses is not None:
+            selected: Set[int] = set()
+            for status in f.statuses:
+                selected |= self.by_status.get(status, set())
+            sets.append(selected)
+
+        if f.qa == QA_ERRORS:
+            sets.append(self.with_errors)
+        elif f.qa == QA_ANY:
+            sets.append(self.with_issues)
+
+        if f.speaker is not None:
+            sets.append(self.by_speaker.get(f.speaker, set()))
+
+        if f.text:
+            sets.append(self._search(f.text, f.regex, f.case_sensitive))
+
+        sets.sort(key=len)
+        result = set(sets[0])
+        for s in sets[1:]:
+            result &= s
+            if not result:
+                break
+
+        return sorted(result)
+
+    # --------------------------------------------------
+    # Busca textual
+    # --------------------------------------------------
+
+    def _ensure_haystack(self):
+        if self._haystack is not None:
+            return
+
+        # Uma string só com todas as linhas ("original \x00 tradução"),
+        # para a regex varrer em C; bisect converte posição -> linha
+        parts = []
+        starts = []
+        pos = 0
+        for entry in self.entries:
+            text = (
+                f"{entry.original or ''}\x00{entry.translation or ''}"
+            ).replace("\n", " ")
+            starts.append(pos)
+            parts.append(text)
+            pos += len(text) + 1
+
+        self._haystack = "\n".join(parts)
+        self._starts = starts
+
+    def _search(self, text: str, regex: bool, case_sensitive: bool) -> Set[int]:
+        if regex:
+            return self._search_regex(text, case_sensitive)
+
+        self._ensure_haystack()
+
+        flags = re.MULTILINE
+        if case_sensitive:
+            haystack = self._haystack
+        else:
+            if self._folded is None:
+                # casefold preserva o tamanho para quase todo texto;
+                # se não preservar, cai para IGNORECASE
+                folded = self._haystack.casefold()
+                self._folded = (
+                    folded if len(folded) == len(self._haystack) else ""
+                )
+            haystack = self._folded or self._haystack
+            if self._folded:
+                text = text.casefold()
+            else:
+                flags |= re.IGNORECASE
+        pattern = re.compile(re.escape(text), flags)
+
+        rows: Set[int] = set()
+        starts = self._starts
+        n = len(starts)
+        search = pattern.search
+        pos = 0
+
+        while True:
+            m = search(haystack, pos)
+            if m is None:
+                break
+            row = bisect_right(starts, m.start()) - 1
+            rows.add(row)
+            if row + 1 >= n:
+                break
+            # Próxima linha: uma ocorrência por linha basta
+            pos = starts[row + 1]
+
+        return rows
+
+    def _search_regex(self, text: str, case_sensitive: bool) -> Set[int]:
+        """
+        Regex do usuário: testada em cada campo separado. Na string
+        única ela poderia casar atravessando o \x00 ou o \n entre
+        original, tradução e linhas vizinhas (ex.: "a.*b", "\\s").
+        """
+        flags = re.MULTILINE | (0 if case_sensitive else re.IGNORECASE)
+        try:
+            search = re.compile(text, flags).search
+        except re.error:
+            return set()
+
+        return {
+            i
+            for i, entry in enumerate(self.entries)
+            if search(entry.original or "") or search(entry.translation or "")
+        }
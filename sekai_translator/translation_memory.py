@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import operator
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from sekai_translator.core import Project, TranslationStatus
+
+
+# ============================================================
+# Resultado
+# ============================================================
+
+@dataclass
+class TMMatch:
+    source: str
+    target: str
+    score: float        # 1.0 = idêntico
+    origin: str = ""    # projeto de onde veio
+
+    @property
+    def percent(self) -> int:
+        return int(self.score * 100)
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+_SPACES = re.compile(r"\s+")
+
+COMMITTED = (TranslationStatus.TRANSLATED, TranslationStatus.REVIEWED)
+
+
+def normalize(text: str) -> str:
+    """
+    Chave de comparação: NFKC (full-width → half-width),
+    espaços colapsados e sem espaço nas pontas.
+    """
+    if not text:
+        return ""
+    return _SPACES.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def _sketch(text: str, size: int) -> List[int]:
+    """
+    Bottom-k MinHash dos bigramas: os `size` menores hashes.
+    Textos parecidos compartilham boa parte deles.
+    """
+    if len(text) < 2:
+        return [hash(text)]
+    grams = set(map(operator.add, text, text[1:]))
+    return sorted(map(hash, grams))[:size]
+
+
+def levenshtein(a: str, b: str) -> int:
+    """
+    Distância de edição (Myers / Hyyrö, bit-paralelo): uma
+    iteração por caractere do texto maior, com inteiros Python
+    fazendo o papel do vetor de bits.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(b)
+    if m == 0:
+        return len(a)
+
+    peq: Dict[str, int] = {}
+    for i, c in enumerate(b):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+
+    for c in a:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+
+    return score
+
+
+def similarity(a: str, b: str) -> float:
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    return 1.0 - levenshtein(a, b) / longest
+
+
+# ============================================================
+# Memória de tradução
+# ============================================================
+
+class TranslationMemory:
+    """
+    Pares original → tradução já confirmados.
+
+    - Exato: dicionário pelo original normalizado.
+    - Aproximado: cada segmento é indexado pelos menores hashes dos
+      seus bigramas (MinHash bottom-k). A consulta conta quantos
+      hashes cada segmento compartilha, pega os melhores candidatos
+      e só neles calcula a distância de edição.
+    """
+
+    SKETCH_SIZE = 8         # hashes indexados por segmento
+    QUERY_SKETCH = 16       # hashes usados na consulta
+    MAX_SCAN = 20000        # ids somados por consulta (listas curtas primeiro)
+    MAX_CANDIDATES = 48     # candidatos que vão para a distância de edição
+
+    def __init__(self):
+        self._sources: List[str] = []
+        self._targets: List[str] = []
+        self._origins = array("H")
+        self._origin_names: List[str] = []
+        self._origin_ids: Dict[str, int] = {}
+
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[int, array] = {}
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    # --------------------------------------------------
+    # Construção
+    # --------------------------------------------------
+
+    @classmethod
+    def from_project(cls, project: Project) -> "TranslationMemory":
+        memory = cls()
+        memory.add_project(project)
+        return memory
+
+    @classmethod
+    def from_projects(cls, projects: Iterable[Project]) -> "TranslationMemory":
+        memory = cls()
+        for project in projects:
+            memory.add_project(project)
+        return memory
+
+    def add_project(self, project: Project):
+        origin = project.name
+        add = self.add
+        for entries in project.files.values():
+            for e in entries:
+                if e.translation and e.status in COMMITTED:
+                    add(e.original, e.translation, origin)
+
+    def add_entries(self, entries: Iterable, origin: str = ""):
+        """Incremental: só as entradas confirmadas entram."""
+        for e in entries:
+            if e.translation and e.status in COMMITTED:
+                self.add(e.original, e.translation, origin)
+
+    def add(self, source: str, target: str, origin: str = ""):
+        key = normalize(source)
+        if not key or not target or not target.strip():
+            return
+
+        origin_id = self._origin_ids.get(origin)
+        if origin_id is None:
+            origin_id = self._origin_ids[origin] = len(self._origin_names)
+            self._origin_names.append(origin)
+
+        seg = self._exact.get(key)
+        if seg is not None:
+            # Mesmo original: a tradução mais recente vale
+            self._targets[seg] = target
+            self._origins[seg] = origin_id
+            return
+
+        seg = len(self._sources)
+        self._sources.append(key)
+        self._targets.append(target)
+        self._origins.append(origin_id)
+        self._exact[key] = seg
+
+        postings = self._postings
+        for h in _sketch(key, self.SKETCH_SIZE):
+            ids = postings.get(h)
+            if ids is None:
+                postings[h] = array("I", (seg,))
+            else:
+                ids.append(seg)
+
+    # --------------------------------------------------
+    # Consulta
+    # --------------------------------------------------
+
+    def _match(self, seg: int, score: float) -> TMMatch:
+        return TMMatch(
+            source=self._sources[seg],
+            target=self._targets[seg],
+            score=score,
+            origin=self._origin_names[self._origins[seg]],
+        )
+
+    def exact(self, text: str) -> Optional[TMMatch]:
+        seg = self._exact.get(normalize(text))
+        if seg is None:
+            return None
+        return self._match(seg, 1.0)
+
+    def suggest(
+        self,
+        text: str,
+        limit: int = 3,
+        min_score: float = 0.6,
+    ) -> List[TMMatch]:
+        key = normalize(text)
+        if not key:
+            return []
+
+        results: List[TMMatch] = []
+
+        exact = self._exact.get(key)
+        if exact is not None:
+            results.append(self._match(exact, 1.0))
+
+        # Listas mais curtas primeiro: hashes de bigramas muito
+        # comuns ("。」", "the") quase não discriminam nada
+        lists = [
+            self._postings[h]
+            for h in _sketch(key, self.QUERY_SKETCH)
+            if h in self._postings
+        ]
+        lists.sort(key=len)
+
+        counts: Counter = Counter()
+        scanned = 0
+        for ids in lists:
+            if scanned and scanned + len(ids) > self.MAX_SCAN:
+                break
+            counts.update(ids)
+            scanned += len(ids)
+
+        n = len(key)
+        sources = self._sources
+
+        for seg, _ in counts.most_common(self.MAX_CANDIDATES):
+            if seg == exact:
+                continue
+
+            source = sources[seg]
+            longest = max(n, len(source))
+
+            # A distância é no mínimo a diferença de tamanho
+            if 1.0 - abs(n - len(source)) / longest < min_score:
+                continue
+
+            score = 1.0 - levenshtein(key, source) / longest
+            if score >= min_score:
+                results.append(self._match(seg, score))
+
+        results.sort(key=lambda m: m.score, reverse=True)
+        return results[:limit]
+
+
+# ============================================================
+# Várias memórias (projeto atual + outros projetos)
+# ============================================================
+
+def suggest(
+    memories: Iterable[TranslationMemory],
+    text: str,
+    limit: int = 3,
+    min_score: float = 0.6,
+) -> List[TMMatch]:
+    results: List[TMMatch] = []
+    seen = set()
+
+    for memory in memories:
+        for match in memory.suggest(text, limit, min_score):
+            key = (match.source, match.target)
+            if key not in seen:
+                seen.add(key)
+                results.append(match)
+
+    results.sort(key=lambda m: m.score, reverse=True)
+    return results[:limit]
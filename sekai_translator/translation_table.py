@@ -1,15 +1,25 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
 from PySide6.QtCore import (
     Qt,
     QAbstractTableModel,
     QModelIndex,
     Signal,
+    QTimer,
 )
 from PySide6.QtGui import QColor, QFont
-from PySide6.QtWidgets import QTableView, QHeaderView
+from PySide6.QtWidgets import (
+    QTableView,
+    QHeaderView,
+    QWidget,
+    QHBoxLayout,
+    QComboBox,
+    QLineEdit,
+    QCheckBox,
+)
 
 from sekai_translator.core import TranslationEntry, TranslationStatus
+from sekai_translator.table_filter import QA_ANY, QA_ERRORS, RowFilter, RowIndex
 
 
 # ============================================================
@@ -37,23 +47,123 @@ def clean_engine_syntax(text: str) -> str:
 
 class TranslationTableModel(QAbstractTableModel):
 
-    advance_requested = Signal(int)
+    # Edição direta na célula (linha, texto): quem confirma é a aba,
+    # pelo mesmo caminho do editor (undo + StatusService)
+    translation_edited = Signal(int, str)
 
     BASE_HEADERS = ["#", "Original", "Tradução"]
 
+    # Objetos compartilhados por todas as linhas (nada de alocar por paint)
+    STATUS_COLORS = {
+        TranslationStatus.UNTRANSLATED: QColor("#2a2a2a"),
+        TranslationStatus.IN_PROGRESS: QColor("#3a331a"),
+        TranslationStatus.TRANSLATED: QColor("#1f3a24"),
+        TranslationStatus.REVIEWED: QColor("#1f2f3a"),
+    }
+
+    # (italic, bold) -> QFont; criadas só depois que existe QApplication
+    _FONTS: Dict[tuple, QFont] = {}
+
+    @classmethod
+    def _font(cls, italic: bool, bold: bool) -> QFont:
+        font = cls._FONTS.get((italic, bold))
+        if font is None:
+            font = QFont()
+            font.setItalic(italic)
+            font.setBold(bold)
+            cls._FONTS[(italic, bold)] = font
+        return font
+
+    # Colunas ordenáveis (sem personagem): #, original, tradução
+    SORT_KEYS = ("number", "original", "translation")
+
     def __init__(self, entries: List[TranslationEntry]):
         super().__init__()
 
         self.all_entries = entries
-        self.entries = [
-            e for e in entries
+
+        # Linhas traduzíveis do arquivo ("fonte") e as visíveis após
+        # filtro / ordenação (índices na fonte)
+        self._source: List[TranslationEntry] = []
+        self._visible: List[int] = []
+        self.entries: List[TranslationEntry] = []
+
+        # id(entry) -> linha visível (evita entries.index, que é O(n))
+        self._row_of: Dict[int, int] = {}
+
+        self.row_filter = RowFilter()
+        self._sort: tuple | None = None   # (chave, ordem)
+
+        self._rebuild_rows()
+
+    def _rebuild_rows(self):
+        self._source = [
+            e for e in self.all_entries
             if e.context.get("is_translatable", False)
         ]
+        self._src_of = {id(e): i for i, e in enumerate(self._source)}
+        self.row_index = RowIndex(self._source)
+
+        # Cache de exibição por linha da fonte (ver _row_display)
+        self._display: List[Optional[tuple]] = [None] * len(self._source)
 
         # 🔑 Só ativa se houver speaker (KiriKiri)
-        self.has_speaker = any(
-            e.context.get("speaker") for e in self.entries
-        )
+        self.has_speaker = bool(self.row_index.by_speaker)
+
+        self._apply_view()
+
+    def _apply_view(self):
+        visible = self.row_index.query(self.row_filter)
+
+        if self._sort is not None:
+            key, order = self._sort
+            source = self._source
+            if key == "speaker":
+                getter = lambda i: source[i].context.get("speaker") or ""
+            elif key == "original":
+                getter = lambda i: clean_engine_syntax(source[i].original).casefold()
+            elif key == "translation":
+                getter = lambda i: clean_engine_syntax(source[i].translation).casefold()
+            else:
+                getter = None
+            if getter is not None:
+                visible.sort(key=getter)
+            if order == Qt.DescendingOrder:
+                visible.reverse()
+
+        self._visible = visible
+        self.entries = [self._source[i] for i in visible]
+        self._row_of = {id(e): row for row, e in enumerate(self.entries)}
+
+    def row_of(self, entry: TranslationEntry) -> int:
+        """Linha da entrada na tabela, ou -1 se não estiver visível."""
+        return self._row_of.get(id(entry), -1)
+
+    def source_row(self, row: int) -> int:
+        """Posição da linha no arquivo (numeração da coluna #)."""
+        return self._visible[row]
+
+    # ---------------- Filtro / ordenação ----------------
+
+    def set_filter(self, row_filter: RowFilter):
+        self.beginResetModel()
+        self.row_filter = row_filter
+        self._apply_view()
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if self.has_speaker:
+            keys = ("number", "speaker", "original", "translation")
+        else:
+            keys = self.SORT_KEYS
+
+        if column < 0 or column >= len(keys):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        self._sort = (keys[column], order)
+        self._apply_view()
+        self.layoutChanged.emit()
 
     # ---------------- Headers ----------------
 
@@ -82,62 +192,87 @@ class TranslationTableModel(QAbstractTableModel):
 
     # ---------------- Data ----------------
 
+    def _row_display(self, row: int) -> tuple:
+        """
+        (nº, personagem, original, tradução, tooltip) já formatados.
+        Calculado na primeira pintura e invalidado só quando a linha muda.
+        """
+        src = self._visible[row]
+        cached = self._display[src]
+        if cached is not None:
+            return cached
+
+        entry = self._source[src]
+        issues = entry.qa_issues
+
+        number = src + 1
+        tooltip = None
+
+        if issues:
+            if any(i.level == "error" for i in issues):
+                number = f"❌ {src + 1}"
+            else:
+                number = f"⚠️ {src + 1}"
+            tooltip = "\n".join(
+                f"{'❌' if i.level == 'error' else '⚠️'} {i.message}"
+                for i in issues
+            )
+
+        cached = (
+            number,
+            entry.context.get("speaker", "") or "",
+            clean_engine_syntax(entry.original),
+            clean_engine_syntax(entry.translation),
+            tooltip,
+        )
+        self._display[src] = cached
+        return cached
+
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
             return None
 
-        entry = self.entries[index.row()]
+        row = index.row()
         col = index.column()
 
         # ---------------- Display ----------------
         if role == Qt.DisplayRole:
+            number, speaker, original, translation, _ = self._row_display(row)
 
             # #
             if col == 0:
-                if entry.qa_issues:
-                    if any(i.level == "error" for i in entry.qa_issues):
-                        return f"❌ {index.row() + 1}"
-                    return f"⚠️ {index.row() + 1}"
-                return index.row() + 1
+                return number
 
             # Personagem (KiriKiri)
             if self.has_speaker:
                 if col == 1:
-                    return entry.context.get("speaker", "") or ""
+                    return speaker
                 col -= 1
 
             # Original
             if col == 1:
-                return clean_engine_syntax(entry.original)
+                return original
 
             # Tradução
             if col == 2:
-                return clean_engine_syntax(entry.translation)
+                return translation
+
+            return None
 
         # ---------------- Tooltip QA ----------------
-        if role == Qt.ToolTipRole and entry.qa_issues:
-            return "\n".join(
-                f"{'❌' if i.level == 'error' else '⚠️'} {i.message}"
-                for i in entry.qa_issues
-            )
+        if role == Qt.ToolTipRole:
+            return self._row_display(row)[4]
 
         # ---------------- Background ----------------
         if role == Qt.BackgroundRole:
-            return {
-                TranslationStatus.UNTRANSLATED: QColor("#2a2a2a"),
-                TranslationStatus.IN_PROGRESS: QColor("#3a331a"),
-                TranslationStatus.TRANSLATED: QColor("#1f3a24"),
-                TranslationStatus.REVIEWED: QColor("#1f2f3a"),
-            }.get(entry.status)
+            return self.STATUS_COLORS.get(self.entries[row].status)
 
         # ---------------- Font ----------------
         if role == Qt.FontRole:
-            font = QFont()
-            if entry.status == TranslationStatus.UNTRANSLATED:
-                font.setItalic(True)
-            if self.has_speaker and index.column() == 1:
-                font.setBold(True)
-            return font
+            return self._font(
+                self.entries[row].status == TranslationStatus.UNTRANSLATED,
+                self.has_speaker and col == 1,
+            )
 
         return None
 
@@ -153,15 +288,7 @@ class TranslationTableModel(QAbstractTableModel):
 
         # Tradução
         if col == 2 and role == Qt.EditRole:
-            entry = self.entries[index.row()]
-            entry.translation = value
-
-            self.dataChanged.emit(
-                self.index(index.row(), 0),
-                self.index(index.row(), self.columnCount() - 1),
-            )
-
-            self.advance_requested.emit(index.row())
+            self.translation_edited.emit(index.row(), str(value or "").rstrip())
             return True
 
         return False
@@ -183,18 +310,96 @@ class TranslationTableModel(QAbstractTableModel):
 
     # ---------------- Refresh ----------------
 
-    def refresh(self):
-        self.beginResetModel()
-
-        self.entries = [
-            e for e in self.all_entries
-            if e.context.get("is_translatable", False)
-        ]
+    def refresh_entries(self, entries: Iterable[TranslationEntry]):
+        """
+        Avisa a view só das linhas editadas (dataChanged por faixa
+        contígua). Mantém scroll / seleção, custo independe do arquivo.
+        """
+        src_of = self._src_of
+        for e in entries:
+            src = src_of.get(id(e))
+            if src is not None:
+                self._display[src] = None
+                self.row_index.update(src)
+
+        # Linhas que deixaram de casar com o filtro continuam visíveis
+        # até o filtro ser reaplicado (não somem debaixo do cursor)
+        rows = sorted(
+            row for row in (self.row_of(e) for e in entries) if row >= 0
+        )
+        if not rows:
+            return
+
+        last_col = self.columnCount() - 1
+        start = prev = rows[0]
+
+        for row in rows[1:]:
+            if row == prev + 1:
+                prev = row
+                continue
+            self.dataChanged.emit(self.index(start, 0), self.index(prev, last_col))
+            start = prev = row
+
+        self.dataChanged.emit(self.index(start, 0), self.index(prev, last_col))
+
+    def refresh_all(self):
+        """Repinta todas as linhas sem resetar o modelo."""
+        self._display = [None] * len(self._source)
+        self.row_index.rebuild()
+        if self.entries:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.entries) - 1, self.columnCount() - 1),
+            )
 
-        self.has_speaker = any(
-            e.context.get("speaker") for e in self.entries
+    def append_entries(self, entries: List[TranslationEntry]):
+        """
+        Linhas novas no fim do arquivo (carga progressiva). Sem filtro
+        e na ordem do arquivo, só as novas linhas entram na view
+        (beginInsertRows); caso contrário, reset.
+        """
+        self.all_entries.extend(entries)
+
+        new = [e for e in entries if e.context.get("is_translatable", False)]
+        if not new:
+            return
+
+        start = len(self._source)
+        self.row_index.extend(new)      # acrescenta em self._source
+        for i, e in enumerate(new, start):
+            self._src_of[id(e)] = i
+        self._display.extend([None] * len(new))
+
+        has_speaker = bool(self.row_index.by_speaker)
+        in_file_order = self._sort is None or self._sort == (
+            "number", Qt.AscendingOrder
         )
 
+        # Primeira fala com personagem: muda o número de colunas
+        if has_speaker != self.has_speaker or not (
+            in_file_order and self.row_filter.is_empty()
+        ):
+            self.beginResetModel()
+            self.has_speaker = has_speaker
+            self._apply_view()
+            self.endResetModel()
+            return
+
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+        self._visible.extend(range(start, start + len(new)))
+        self.entries.extend(new)
+        for row, e in enumerate(new, first):
+            self._row_of[id(e)] = row
+        self.endInsertRows()
+
+    def refresh(self):
+        """
+        Reset completo. Usar só quando o conjunto de linhas muda
+        (ex.: arquivo reimportado); edições usam `refresh_entries`.
+        """
+        self.beginResetModel()
+        self._rebuild_rows()
         self.endResetModel()
 
 
@@ -232,3 +437,111 @@ class TranslationTableView(QTableView):
             | QTableView.EditKeyPressed
             | QTableView.AnyKeyPressed
         )
+
+
+# ============================================================
+# FILTER BAR
+# ============================================================
+
+class TableFilterBar(QWidget):
+    """
+    Filtros da tabela: status, QA, personagem e busca (texto / regex).
+    """
+
+    filter_changed = Signal(object)  # RowFilter
+
+    STATUS_OPTIONS = [
+        ("Todas as linhas", None),
+        ("Não traduzidas", frozenset({TranslationStatus.UNTRANSLATED.value})),
+        ("Em progresso", frozenset({TranslationStatus.IN_PROGRESS.value})),
+        ("Pendentes", frozenset({
+            TranslationStatus.UNTRANSLATED.value,
+            TranslationStatus.IN_PROGRESS.value,
+        })),
+        ("Traduzidas", frozenset({
+            TranslationStatus.TRANSLATED.value,
+            TranslationStatus.REVIEWED.value,
+        })),
+    ]
+
+    QA_OPTIONS = [
+        ("QA: tudo", None),
+        ("Com erros", QA_ERRORS),
+        ("Com erros ou avisos", QA_ANY),
+    ]
+
+    def __init__(self, speakers: List[str]):
+        super().__init__()
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.status_combo = QComboBox()
+        for label, _ in self.STATUS_OPTIONS:
+            self.status_combo.addItem(label)
+        layout.addWidget(self.status_combo)
+
+        self.qa_combo = QComboBox()
+        for label, _ in self.QA_OPTIONS:
+            self.qa_combo.addItem(label)
+        layout.addWidget(self.qa_combo)
+
+        self.speaker_combo = QComboBox()
+        self.set_speakers(speakers)
+        layout.addWidget(self.speaker_combo)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Buscar no original / tradução...")
+        self.search_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.search_edit, 1)
+
+        self.regex_check = QCheckBox("Regex")
+        layout.addWidget(self.regex_check)
+
+        self.case_check = QCheckBox("Aa")
+        self.case_check.setToolTip("Diferenciar maiúsculas")
+        layout.addWidget(self.case_check)
+
+        # Digitação: espera uma pausa antes de filtrar
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(150)
+        self._timer.timeout.connect(self._emit)
+
+        self.status_combo.currentIndexChanged.connect(self._emit)
+        self.qa_combo.currentIndexChanged.connect(self._emit)
+        self.speaker_combo.currentIndexChanged.connect(self._emit)
+        self.regex_check.toggled.connect(self._emit)
+        self.case_check.toggled.connect(self._emit)
+        self.search_edit.textChanged.connect(lambda _: self._timer.start())
+
+    def set_speakers(self, speakers: List[str]):
+        current = self.speaker_combo.currentText()
+
+        self.speaker_combo.blockSignals(True)
+        self.speaker_combo.clear()
+        self.speaker_combo.addItem("Todos os personagens")
+        self.speaker_combo.addItems(speakers)
+        if current in speakers:
+            self.speaker_combo.setCurrentText(current)
+        self.speaker_combo.blockSignals(False)
+
+        self.speaker_combo.setVisible(bool(speakers))
+
+    def current_filter(self) -> RowFilter:
+        speaker = None
+        if self.speaker_combo.currentIndex() > 0:
+            speaker = self.speaker_combo.currentText()
+
+        return RowFilter(
+            statuses=self.STATUS_OPTIONS[self.status_combo.currentIndex()][1],
+            qa=self.QA_OPTIONS[self.qa_combo.currentIndex()][1],
+            speaker=speaker,
+            text=self.search_edit.text(),
+            regex=self.regex_check.isChecked(),
+            case_sensitive=self.case_check.isChecked(),
+        )
+
+    def _emit(self, *_):
+        self._timer.stop()
+        self.filter_changed.emit(self.current_filter())
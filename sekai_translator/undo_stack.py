@@ -1,5 +1,12 @@
+import json
+import os
+import struct
+import sys
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -8,6 +15,8 @@ class UndoAction:
     field: str
     old_value: Any
     new_value: Any
+    # entry_id só é único dentro do arquivo
+    file_path: Optional[str] = None
 
 
 @dataclass
@@ -15,61 +24,481 @@ class CompositeUndoAction:
     actions: List[UndoAction]
 
 
+# ============================================================
+# Registro compacto
+# ============================================================
+#
+# Um passo de undo vira uma tupla plana:
+#   (chave, campo, antigo, novo, chave, campo, antigo, novo, ...)
+# - chave: int, índice na tabela (file_path, entry_id) da pilha
+# - campo: 0 = translation, 1 = status
+# - status guardado como int (posição em TranslationStatus)
+# Cada (chave, campo) aparece uma vez só por passo.
+
+FIELDS = ("translation", "status")
+_STATUS_FIELD = 1
+
+
+@lru_cache(maxsize=1)
+def _statuses() -> tuple:
+    # Import tardio: core importa este módulo
+    from sekai_translator.core import TranslationStatus
+    return tuple(TranslationStatus)
+
+
+def _status_code(value) -> int:
+    statuses = _statuses()
+    try:
+        return statuses.index(value)
+    except ValueError:
+        return statuses.index(type(statuses[0])(value))
+
+
+def _step_size(step: tuple) -> int:
+    """Estimativa (bytes) do que o passo mantém vivo."""
+    size = sys.getsizeof(step)
+    for value in step:
+        if isinstance(value, str):
+            size += sys.getsizeof(value)
+    return size
+
+
+# ============================================================
+# Arquivo de histórico (undo_history.bin, pasta do projeto)
+# ============================================================
+#
+# Append-only: tipo (1 byte) + tamanho (u32) + JSON + tamanho (u32).
+# O tamanho repetido no fim permite ler de trás para frente, do
+# passo mais recente ao mais antigo, sem índice.
+#
+# - "S": um passo de undo
+# - "C": checkpoint, escrito a cada salvamento do projeto. Passos
+#   depois do último checkpoint são de alterações que nunca foram
+#   salvas: ao abrir o projeto, o histórico termina no checkpoint.
+
+_HEADER = struct.Struct("<cI")
+_FOOTER = struct.Struct("<I")
+
+REC_STEP = b"S"
+REC_CHECKPOINT = b"C"
+
+
+def _record(kind: bytes, payload: bytes = b"") -> bytes:
+    return _HEADER.pack(kind, len(payload)) + payload + _FOOTER.pack(len(payload))
+
+
+def _encode_step(step: tuple, keys: List[tuple]) -> bytes:
+    # Tabela de chaves própria do registro: cada registro se
+    # resolve sozinho, de qualquer sessão
+    local: Dict[int, int] = {}
+    local_keys = []
+    flat = []
+    for i in range(0, len(step), 4):
+        key = step[i]
+        k = local.get(key)
+        if k is None:
+            k = local[key] = len(local_keys)
+            local_keys.append(list(keys[key]))
+        flat.extend((k, step[i + 1], step[i + 2], step[i + 3]))
+
+    payload = json.dumps(
+        {"k": local_keys, "c": flat},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return _record(REC_STEP, payload)
+
+
+def _read_back(f, end: int) -> Tuple[bytes, bytes, int]:
+    """Registro que termina em `end`: (tipo, payload, início)."""
+    f.seek(end - _FOOTER.size)
+    (length,) = _FOOTER.unpack(f.read(_FOOTER.size))
+    start = end - _FOOTER.size - length - _HEADER.size
+    if start < 0:
+        raise ValueError("registro inválido")
+    f.seek(start)
+    kind, size = _HEADER.unpack(f.read(_HEADER.size))
+    if size != length:
+        raise ValueError("registro inválido")
+    return kind, f.read(length), start
+
+
+# ============================================================
+# Pilha
+# ============================================================
+
 class UndoStack:
-    def __init__(self):
-        self._undo: List[Any] = []
-        self._redo: List[Any] = []
+    """
+    Histórico de undo / redo em registros compactos.
+
+    - Limite de memória (`max_bytes`): passado o limite, os passos
+      mais antigos saem da memória para o arquivo de histórico (ou
+      são descartados, sem arquivo configurado).
+    - Salvar o projeto grava o histórico em memória no arquivo
+      (`checkpoint`), então ele sobrevive entre sessões. O arquivo
+      só é lido quando o undo passa da janela em memória.
+    - Edições seguidas nas mesmas entradas (dentro de
+      `COALESCE_SECONDS`) viram um passo só.
+    """
+
+    MAX_BYTES = 32 * 1024 * 1024
+    MAX_HISTORY_BYTES = 64 * 1024 * 1024
+    COALESCE_SECONDS = 2.0
+    HISTORY_NAME = "undo_history.bin"
+
+    def __init__(self, max_bytes: int = MAX_BYTES, history_path: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.history_path = history_path
+
+        # Fim lógico do arquivo (None = ainda não aberto). Undo lido
+        # do arquivo só recua o fim; a próxima escrita sobrescreve.
+        self._end: Optional[int] = None
+        self._checkpointed = False
+
+        self._undo: deque = deque()
+        self._redo: List[tuple] = []
+        self._undo_bytes = 0
+
+        # (file_path, entry_id) <-> int
+        self._keys: List[tuple] = []
+        self._key_ids: Dict[tuple, int] = {}
+
+        self._last_push = 0.0
+
+    def configure(self, max_bytes: Optional[int] = None, history_path: Optional[str] = None):
+        """Não lê o arquivo: isso fica para o primeiro uso."""
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if history_path is not None and history_path != self.history_path:
+            self.history_path = history_path
+            self._end = None
+        self._evict()
+
+    # --------------------------------------------------
+    # Compactação
+    # --------------------------------------------------
+
+    def _key(self, action: UndoAction) -> int:
+        key = (action.file_path, action.entry_id)
+        k = self._key_ids.get(key)
+        if k is None:
+            k = self._key_ids[key] = len(self._keys)
+            self._keys.append(key)
+        return k
+
+    def _compact(self, actions: List[UndoAction], base: tuple = ()) -> tuple:
+        """
+        Junta as ações num passo. Mesma (chave, campo) repetida:
+        fica o valor antigo da primeira e o novo da última.
+        """
+        merged: Dict[Tuple[int, int], list] = {}
+        for i in range(0, len(base), 4):
+            merged[(base[i], base[i + 1])] = [base[i + 2], base[i + 3]]
+
+        for action in actions:
+            field = FIELDS.index(action.field)
+            old, new = action.old_value, action.new_value
+            if field == _STATUS_FIELD:
+                old, new = _status_code(old), _status_code(new)
+
+            slot_key = (self._key(action), field)
+            slot = merged.get(slot_key)
+            if slot is None:
+                merged[slot_key] = [old, new]
+            else:
+                slot[1] = new
+
+        step = []
+        for (key, field), (old, new) in merged.items():
+            step.extend((key, field, old, new))
+        return tuple(step)
+
+    @staticmethod
+    def _flatten(action: Any) -> List[UndoAction]:
+        if isinstance(action, CompositeUndoAction):
+            return list(action.actions)
+        return [action]
+
+    @staticmethod
+    def _step_keys(step: tuple) -> set:
+        return set(step[0::4])
 
     # --------------------------------------------------
 
     def push(self, action: Any):
-        self._undo.append(action)
+        actions = self._flatten(action)
+        if not actions:
+            return
+
+        now = time.monotonic()
+        step = self._compact(actions)
+
+        # Edição seguida das mesmas linhas: junta com o passo anterior
+        if (
+            self._undo
+            and not self._redo
+            and now - self._last_push <= self.COALESCE_SECONDS
+            and self._step_keys(self._undo[-1]) == self._step_keys(step)
+        ):
+            top = self._pop_top()
+            step = self._compact(actions, base=top)
+
+        self._last_push = now
         self._redo.clear()
+        self._push_step(step)
+
+    def amend(self, actions: List[UndoAction]):
+        """
+        Junta ações ao último passo do undo (ex.: propagação feita
+        junto com o commit que a disparou).
+        """
+        if not actions:
+            return
+
+        if not self._undo:
+            self.push(CompositeUndoAction(list(actions)))
+            return
+
+        top = self._pop_top()
+        self._push_step(self._compact(actions, base=top))
 
     def can_undo(self) -> bool:
-        return bool(self._undo)
+        return bool(self._undo) or self._open_history() > 0
 
     def can_redo(self) -> bool:
         return bool(self._redo)
 
+    def _push_step(self, step: tuple):
+        self._checkpointed = False
+        self._undo.append(step)
+        self._undo_bytes += _step_size(step)
+        self._evict()
+
+    def _pop_top(self) -> tuple:
+        step = self._undo.pop()
+        self._undo_bytes -= _step_size(step)
+        return step
+
+    # --------------------------------------------------
+    # Limite de memória / arquivo de histórico
     # --------------------------------------------------
 
-    def undo(self, project):
-        if not self._undo:
+    def _evict(self):
+        # O passo mais recente fica sempre em memória
+        while self._undo_bytes > self.max_bytes and len(self._undo) > 1:
+            step = self._undo.popleft()
+            self._undo_bytes -= _step_size(step)
+            if self.history_path:
+                self._append(_encode_step(step, self._keys))
+
+    def _open_history(self) -> int:
+        """
+        Na primeira vez: acha o último checkpoint andando de trás para
+        frente (só pelos passos nunca salvos). Retorna o fim lógico.
+        """
+        if self._end is not None:
+            return self._end
+
+        self._end = 0
+        if not self.history_path:
+            return 0
+
+        try:
+            size = os.path.getsize(self.history_path)
+        except OSError:
+            return 0
+
+        if size > self.MAX_HISTORY_BYTES:
+            size = self._trim(size)
+
+        try:
+            with open(self.history_path, "rb") as f:
+                pos = size
+                while pos > 0:
+                    kind, _, start = _read_back(f, pos)
+                    if kind == REC_CHECKPOINT:
+                        self._end = pos
+                        self._checkpointed = True
+                        break
+                    pos = start
+        except (OSError, ValueError, struct.error):
+            # Arquivo danificado: recomeça o histórico
+            self._end = 0
+
+        return self._end
+
+    def _trim(self, size: int) -> int:
+        """Arquivo grande demais: fica só a metade mais recente."""
+        keep_from = size - self.MAX_HISTORY_BYTES // 2
+        try:
+            with open(self.history_path, "rb") as f:
+                pos = 0
+                while pos < keep_from:
+                    f.seek(pos)
+                    _, length = _HEADER.unpack(f.read(_HEADER.size))
+                    pos += _HEADER.size + length + _FOOTER.size
+                f.seek(pos)
+                data = f.read()
+
+            tmp_path = self.history_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.history_path)
+            return len(data)
+        except (OSError, struct.error):
+            return size
+
+    def _append(self, record: bytes):
+        end = self._open_history()
+        mode = "r+b" if os.path.exists(self.history_path) else "wb"
+        try:
+            with open(self.history_path, mode) as f:
+                f.seek(end)
+                f.write(record)
+                f.truncate()
+        except OSError:
             return
+        self._end = end + len(record)
 
-        action = self._undo.pop()
-        self._apply(project, action, undo=True)
-        self._redo.append(action)
+    def _pop_history(self) -> Optional[tuple]:
+        """Passo mais recente do arquivo (recua o fim lógico)."""
+        while self._open_history() > 0:
+            try:
+                with open(self.history_path, "rb") as f:
+                    kind, payload, start = _read_back(f, self._end)
+            except (OSError, ValueError, struct.error):
+                self._end = 0
+                return None
 
-    def redo(self, project):
-        if not self._redo:
+            self._end = start
+            if kind == REC_STEP:
+                break
+        else:
+            return None
+
+        self._checkpointed = False
+        try:
+            data = json.loads(payload.decode("utf-8"))
+        except ValueError:
+            return None
+
+        keys = []
+        for path, entry_id in data["k"]:
+            key = (path, entry_id)
+            k = self._key_ids.get(key)
+            if k is None:
+                k = self._key_ids[key] = len(self._keys)
+                self._keys.append(key)
+            keys.append(k)
+
+        flat = data["c"]
+        step = []
+        for i in range(0, len(flat), 4):
+            step.extend((keys[flat[i]], flat[i + 1], flat[i + 2], flat[i + 3]))
+        return tuple(step)
+
+    def checkpoint(self):
+        """
+        Chamado ao salvar o projeto: o histórico em memória vai para
+        o arquivo e um checkpoint marca o estado salvo. O redo fica
+        só na memória.
+        """
+        if not self.history_path or self._checkpointed:
+            return
+        if not self._undo and self._open_history() == 0:
+            # Tudo desfeito: passos antigos além do fim lógico não podem
+            # sobreviver no arquivo (reabrir "desfaria" para frente)
+            try:
+                if os.path.exists(self.history_path):
+                    with open(self.history_path, "r+b") as f:
+                        f.truncate(0)
+            except OSError:
+                return
+            self._checkpointed = True
             return
 
-        action = self._redo.pop()
-        self._apply(project, action, undo=False)
-        self._undo.append(action)
+        while self._undo:
+            step = self._undo.popleft()
+            self._append(_encode_step(step, self._keys))
+        self._undo_bytes = 0
+
+        self._append(_record(REC_CHECKPOINT))
+        self._checkpointed = True
 
     # --------------------------------------------------
 
-    def _apply(self, project, action, undo: bool):
-        if isinstance(action, CompositeUndoAction):
-            actions = reversed(action.actions) if undo else action.actions
-            for a in actions:
-                self._apply_single(project, a, undo)
+    def undo(self, project) -> list:
+        """Desfaz a última ação. Retorna [(file_path, entrada)] alterados."""
+        if self._undo:
+            step = self._pop_top()
         else:
-            self._apply_single(project, action, undo)
+            step = self._pop_history()
+            if step is None:
+                return []
 
-    def _apply_single(self, project, action: UndoAction, undo: bool):
-        entry = project.entry_index.get(action.entry_id)
-        if not entry:
-            return
+        touched = self._apply(project, step, undo=True)
+        self._redo.append(step)
+        self._last_push = 0.0
+        self._checkpointed = False
+        return touched
+
+    def redo(self, project) -> list:
+        """Refaz a última ação desfeita. Retorna [(file_path, entrada)] alterados."""
+        if not self._redo:
+            return []
+
+        step = self._redo.pop()
+        touched = self._apply(project, step, undo=False)
+        self._push_step(step)
+        self._last_push = 0.0
+        return touched
+
+    # --------------------------------------------------
+
+    def _apply(self, project, step: tuple, undo: bool) -> list:
+        # Import tardio: status_service → core → undo_stack
+        from sekai_translator.status_service import StatusService
+
+        statuses = _statuses()
+        keys = self._keys
+        indices = range(len(step) - 4, -1, -4) if undo else range(0, len(step), 4)
+
+        touched = {}
+        for i in indices:
+            file_path, entry_id = keys[step[i]]
+            entry = project.get_entry(entry_id, file_path)
+            if not entry:
+                continue
+            if id(entry) not in touched:
+                if file_path is None:
+                    location = project.locate(entry)
+                    file_path = location[0] if location else None
+                touched[id(entry)] = (file_path, entry, entry.status, entry.translation)
+
+            field = step[i + 1]
+            value = step[i + 2] if undo else step[i + 3]
+            if field == _STATUS_FIELD:
+                value = statuses[value]
+            setattr(entry, FIELDS[field], value)
+
+        # Um aviso por entrada (ver change_bus)
+        for _, entry, old_status, old_text in touched.values():
+            StatusService.notify(entry, old_status, old_text)
 
-        value = action.old_value if undo else action.new_value
-        setattr(entry, action.field, value)
+        return [(t[0], t[1]) for t in touched.values()]
 
     # --------------------------------------------------
 
     def clear(self):
+        """Esquece todo o histórico (memória e arquivo)."""
         self._undo.clear()
         self._redo.clear()
+        self._undo_bytes = 0
+        self._last_push = 0.0
+        if self.history_path:
+            try:
+                os.remove(self.history_path)
+            except OSError:
+                pass
+        self._end = 0
+        self._checkpointed = False
@@ -1,37 +1,58 @@
-import requests
-from packaging.version import Version
-
-
 VERSION_URL = (
     "https://raw.githubusercontent.com/Satonix/SekaiTranslator/main/version.json"
 )
 
+# Verificação automática no máximo uma vez por dia
+CHECK_INTERVAL = 24 * 60 * 60
+
 
 class UpdateInfo:
-    def __init__(self, version: str, url: str):
+    def __init__(self, version: str, url: str, sha256: str = ""):
         self.version = version
         self.url = url
+        self.sha256 = sha256        # conferido pelo updater (se publicado)
 
 
 class UpdateService:
 
     @staticmethod
-    def check(current_version: str) -> UpdateInfo | None:
-        try:
-            r = requests.get(VERSION_URL, timeout=5)
-            r.raise_for_status()
-            data = r.json()
-
-            latest = data.get("version")
-            url = data.get("url")
+    def fetch(
+        current_version: str,
+        url: str = VERSION_URL,
+        timeout: float = 5,
+    ) -> UpdateInfo | None:
+        """
+        Consulta o version.json. Levanta exceção em falha de rede /
+        formato; None se já está na versão mais recente.
+        Bloqueia: chamar fora da thread da interface.
+        """
+        # requests custa ~150 ms de import: fica para a thread da
+        # verificação em vez de atrasar a abertura do programa
+        import requests
+        from packaging.version import Version
+
+        r = requests.get(url, timeout=timeout)
+        r.raise_for_status()
+        data = r.json()
+
+        latest = data.get("version")
+        installer = data.get("url")
+
+        if not latest or not installer:
+            return None
 
-            if not latest or not url:
-                return None
+        if Version(latest) > Version(current_version):
+            return UpdateInfo(latest, installer, data.get("sha256") or "")
 
-            if Version(latest) > Version(current_version):
-                return UpdateInfo(latest, url)
+        return None
 
+    @staticmethod
+    def check(
+        current_version: str,
+        url: str = VERSION_URL,
+        timeout: float = 5,
+    ) -> UpdateInfo | None:
+        try:
+            return UpdateService.fetch(current_version, url, timeout)
         except Exception:
             return None
-
-        return None
\ No newline at end of file
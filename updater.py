@@ -1,43 +1,207 @@
 import sys
 import time
+import hashlib
+import logging
+import os
 import subprocess
 from pathlib import Path
 
 import requests
+from urllib3.exceptions import HTTPError as Urllib3Error
 
 
-def download_installer(url: str, out_path: Path):
+# Blocos de leitura: ajustados à velocidade da conexão
+MIN_CHUNK = 64 * 1024
+MAX_CHUNK = 4 * 1024 * 1024
+CHUNK_SECONDS = 0.5
+
+# Falhas seguidas sem receber nada antes de desistir
+MAX_ATTEMPTS = 8
+
+# O updater é gerado com --noconsole: o progresso vai para um log
+LOG_NAME = "SekaiTranslator_Updater.log"
+LOG_INTERVAL = 1.0
+
+log = logging.getLogger("updater")
+
+
+class DownloadError(Exception):
+    pass
+
+
+def partial_path(url: str, out_path: Path) -> Path:
+    """
+    Arquivo parcial do download. Um por URL: um .part de outra
+    versão nunca é continuado com os bytes desta.
+    """
+    tag = hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
+    return out_path.with_name(f"{out_path.name}.{tag}.part")
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+_last_log = 0.0
+
+
+def log_progress(done: int, total: int | None, speed: float):
+    """Progresso no log, no máximo uma linha por LOG_INTERVAL."""
+    global _last_log
+    now = time.monotonic()
+    if now - _last_log < LOG_INTERVAL and done != total:
+        return
+    _last_log = now
+
+    mb = 1024 * 1024
+    if total:
+        line = f"{done / total:6.1%}  {done / mb:.1f}/{total / mb:.1f} MB"
+    else:
+        line = f"{done / mb:.1f} MB"
+    log.info(f"{line}  {speed / mb:.2f} MB/s")
+
+
+def _fetch(url: str, part: Path, progress, timeout: float):
+    """
+    Uma tentativa: continua o .part a partir do tamanho atual (Range).
+    Retorna com o arquivo completo; levanta exceção em falha de rede
+    (os bytes já gravados ficam para a próxima tentativa).
+    """
+    offset = part.stat().st_size if part.exists() else 0
+    # Sem compressão: offsets e SHA-256 valem para os bytes do arquivo
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+
+    with requests.get(url, stream=True, timeout=timeout, headers=headers) as r:
+        if r.status_code == 416 and offset:
+            # "bytes */5000": só está inteiro se o tamanho bater
+            size = r.headers.get("Content-Range", "").rpartition("/")[2]
+            if size == str(offset):
+                return
+            part.unlink()
+            raise DownloadError(
+                f".part com {offset} bytes, servidor informa {size or '?'}"
+            )
+        r.raise_for_status()
+
+        if offset and r.status_code != 206:
+            # Servidor ignorou o Range: recomeça do zero
+            offset = 0
+        elif offset:
+            # "bytes 1000-4999/5000"
+            start = r.headers.get("Content-Range", "").split(" ")[-1].split("-")[0]
+            if start != str(offset):
+                part.unlink()
+                raise DownloadError("Content-Range inesperado")
+
+        length = r.headers.get("Content-Length")
+        total = offset + int(length) if length else None
+
+        done = offset
+        chunk = MIN_CHUNK
+        with open(part, "ab" if offset else "wb") as f:
+            while True:
+                t = time.perf_counter()
+                data = r.raw.read(chunk, decode_content=False)
+                elapsed = time.perf_counter() - t
+                if not data:
+                    break
+
+                f.write(data)
+                done += len(data)
+
+                # Conexão rápida: blocos maiores; lenta: menores
+                if elapsed < CHUNK_SECONDS / 2 and len(data) == chunk:
+                    chunk = min(chunk * 2, MAX_CHUNK)
+                elif elapsed > CHUNK_SECONDS * 2:
+                    chunk = max(chunk // 2, MIN_CHUNK)
+
+                if progress is not None:
+                    progress(done, total, len(data) / max(elapsed, 1e-6))
+
+    if total is not None and done < total:
+        raise DownloadError(f"conexão encerrada em {done}/{total} bytes")
+
+
+def download_installer(
+    url: str,
+    out_path: Path,
+    sha256: str | None = None,
+    progress=log_progress,
+    timeout: float = 30,
+    max_attempts: int = MAX_ATTEMPTS,
+    retry_delay: float = 2.0,
+):
     """
     Baixa o instalador do GitHub Releases.
+
+    Grava num .part e, a cada queda, continua de onde parou (HTTP
+    Range), inclusive numa nova execução do updater. Com `sha256`
+    (publicado no version.json) o arquivo é conferido antes de
+    substituir `out_path`; se não bater, o .part é descartado.
     """
-    r = requests.get(url, stream=True, timeout=30)
-    r.raise_for_status()
+    part = partial_path(url, out_path)
+    failures = 0
+
+    while True:
+        before = part.stat().st_size if part.exists() else 0
+        try:
+            _fetch(url, part, progress, timeout)
+            break
+        except (requests.RequestException, Urllib3Error, DownloadError) as e:
+            received = part.exists() and part.stat().st_size > before
+            failures = 0 if received else failures + 1
+            log.warning("tentativa falhou (%s)", e)
+            if failures >= max_attempts:
+                raise DownloadError(f"download falhou: {e}") from e
+            time.sleep(retry_delay * max(failures, 1))
 
-    with open(out_path, "wb") as f:
-        for chunk in r.iter_content(chunk_size=8192):
-            if chunk:
-                f.write(chunk)
+    if sha256:
+        actual = file_sha256(part)
+        if actual.lower() != sha256.strip().lower():
+            part.unlink()
+            raise DownloadError(
+                f"SHA-256 não confere (esperado {sha256}, obtido {actual})"
+            )
+
+    os.replace(part, out_path)
+    log.info("download concluído: %s", out_path)
 
 
 def main():
+    # Pasta TEMP do usuário
+    temp_dir = Path.home() / "AppData" / "Local" / "Temp"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+
+    # Sem console: tudo vai para o log
+    logging.basicConfig(
+        filename=temp_dir / LOG_NAME,
+        filemode="w",
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+        encoding="utf-8",
+    )
+
     # Espera receber a URL do instalador
     if len(sys.argv) < 2:
-        print("Installer URL not provided")
+        log.error("Installer URL not provided")
         sys.exit(1)
 
     installer_url = sys.argv[1]
-
-    # Pasta TEMP do usuário
-    temp_dir = Path.home() / "AppData" / "Local" / "Temp"
-    temp_dir.mkdir(parents=True, exist_ok=True)
+    installer_sha256 = sys.argv[2] if len(sys.argv) > 2 else None
 
     installer_path = temp_dir / "SekaiTranslator_Setup.exe"
 
     # Baixa o instalador
     try:
-        download_installer(installer_url, installer_path)
+        download_installer(installer_url, installer_path, installer_sha256)
     except Exception as e:
-        print(f"Failed to download installer: {e}")
+        log.error("Failed to download installer: %s", e)
         sys.exit(1)
 
     # 🔒 Garante que o app principal já morreu completamente
@@ -55,7 +219,7 @@ def main():
             shell=True,
         )
     except Exception as e:
-        print(f"Failed to launch installer: {e}")
+        log.error("Failed to launch installer: %s", e)
         sys.exit(1)
 
     # Sai do updater